@@ -0,0 +1,244 @@
+"""asyncio runtime for the bot network.
+
+One event loop drives every persona: each bot is a task that sleeps until
+its next activity and then acts.  Bot actions are blocking PRAW, LLM and
+SQLite code, so they run on one small shared thread pool instead of a
+thread per bot.  The pool size, not the number of personas, bounds the
+threads in use.  Database writes issued by the bots go through an
+:class:`AsyncWriteQueue` and are applied in order by a single writer
+thread.
+
+The runtime drives an ``InquisitorNetworkManager`` (duck-typed here): it
+uses its ``bots``, ``db_manager``, ``_get_recent_posts``,
+``_plan_activity_tick``, ``_run_activity`` and ``_daily_maintenance``.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import random
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncWriteQueue:
+    """Ordered database writes applied off the event loop by one thread.
+
+    ``submit`` may be called from the loop or from any worker thread.
+    Queued writes are drained in batches of up to ``batch_size``.  A failing
+    write is logged and counted, and does not stop the queue.
+    """
+
+    def __init__(self, batch_size: int = 100):
+        self.batch_size = batch_size
+        self.written = 0
+        self.failed = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def start(self) -> None:
+        """Start draining; call from inside the running loop."""
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
+        self._task = self._loop.create_task(self._drain(), name="db-writer")
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        if self._loop is None:
+            raise RuntimeError("AsyncWriteQueue is not running")
+        item = functools.partial(fn, *args, **kwargs)
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._queue.put_nowait(item)
+        else:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, item)
+
+    async def _drain(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._loop.run_in_executor(self._executor, self._apply, batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _apply(self, batch: List[Callable[[], Any]]) -> None:
+        for write in batch:
+            try:
+                write()
+                self.written += 1
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Queued database write failed: {e}")
+
+    async def close(self) -> None:
+        """Apply every queued write, then stop the writer thread."""
+        if self._loop is None:
+            return
+        await self._queue.join()
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._executor.shutdown(wait=True)
+        self._loop = None
+
+
+class QueuedWrites:
+    """Database manager proxy whose write methods go through an :class:`AsyncWriteQueue`.
+
+    Other attributes (reads) pass straight through to the wrapped manager.
+    """
+
+    def __init__(self, db_manager: Any, queue: AsyncWriteQueue,
+                 methods: Sequence[str] = ("log_activity", "store_memory")):
+        self.db_manager = db_manager
+        self.queue = queue
+        self.methods = frozenset(methods)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.db_manager, name)
+        if name in self.methods:
+            return functools.partial(self.queue.submit, attr)
+        return attr
+
+
+class AsyncBotRuntime:
+    """Run a network manager's bots as asyncio tasks.
+
+    Each bot sleeps ``interval`` plus up to ``jitter`` seconds between
+    activities, independently of the others.  When it wakes up and may
+    post, it gets one action from the manager's planner.  The subreddit
+    listing is shared: concurrent requests for it await a single fetch, and
+    a post is replied to by at most one bot (over the last
+    ``claim_memory`` replies).
+
+    Args:
+        manager: The network manager whose bots are run.
+        subreddit (str): Subreddit the bots act in.
+        interval (float): Minimum seconds between one bot's activities.
+        jitter (float): Extra random delay, drawn afresh each time.
+        listing_limit (int): Posts fetched for reply candidates.
+        workers (int): Threads for blocking bot work.
+        maintenance_hour (Optional[int]): Local hour for the daily
+            maintenance job, which runs on the database writer thread;
+            None disables it.
+    """
+
+    def __init__(self, manager: Any, *, subreddit: str, interval: float, jitter: float = 0.0,
+                 listing_limit: int = 5, workers: int = 16, maintenance_hour: Optional[int] = 0,
+                 claim_memory: int = 1024):
+        self.manager = manager
+        self.subreddit = subreddit
+        self.interval = interval
+        self.jitter = jitter
+        self.listing_limit = listing_limit
+        self.workers = workers
+        self.maintenance_hour = maintenance_hour
+        self.claim_memory = claim_memory
+        self.write_queue = AsyncWriteQueue()
+        self.completed = 0
+        self.failed = 0
+        self._claimed: "OrderedDict[str, None]" = OrderedDict()
+        self._listing: Optional[asyncio.Future] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop: Optional[asyncio.Event] = None
+
+    async def run(self, duration: Optional[float] = None) -> None:
+        """Run until :meth:`stop` is called (or for ``duration`` seconds)."""
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bot-io")
+        self.write_queue.start()
+        direct_db = {name: bot.db_manager for name, bot in self.manager.bots.items()}
+        for bot in self.manager.bots.values():
+            bot.db_manager = QueuedWrites(bot.db_manager, self.write_queue)
+        tasks = [asyncio.create_task(self._bot_loop(name), name=f"bot-{name}") for name in self.manager.bots]
+        if self.maintenance_hour is not None:
+            tasks.append(asyncio.create_task(self._maintenance_loop(), name="daily-maintenance"))
+        logger.info(f"Async runtime started with {len(self.manager.bots)} bots")
+        try:
+            if duration is None:
+                await self._stop.wait()
+            else:
+                await asyncio.wait_for(self._stop.wait(), duration)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # Actions already handed to a thread finish, and their writes are applied
+            await self._loop.run_in_executor(None, functools.partial(self._executor.shutdown, wait=True))
+            await self.write_queue.close()
+            for name, db_manager in direct_db.items():
+                self.manager.bots[name].db_manager = db_manager
+            logger.info(f"Async runtime stopped: {self.completed} actions completed, {self.failed} failed")
+
+    def stop(self) -> None:
+        """Ask :meth:`run` to return; safe to call from any thread."""
+        if self._loop is not None and self._stop is not None:
+            self._loop.call_soon_threadsafe(self._stop.set)
+
+    async def _offload(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return await self._loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    async def _bot_loop(self, bot_name: str) -> None:
+        while True:
+            await asyncio.sleep(self.interval + random.uniform(0, self.jitter))
+            try:
+                await self.act(bot_name)
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Activity for {bot_name} failed: {e}")
+
+    async def act(self, bot_name: str) -> Optional[str]:
+        """Plan and carry out one action for ``bot_name`` if it may post now."""
+        if not self.manager.bots[bot_name].can_post():
+            return None
+        listing = [post_id for post_id in await self._shared_listing() if post_id not in self._claimed]
+        plan = self.manager._plan_activity_tick([bot_name], listing)
+        if not plan:
+            return None
+        activity = plan[0]
+        if activity.post_id is not None:
+            # Claimed before the thread runs, so no other bot picks the same post meanwhile
+            self._claimed[activity.post_id] = None
+            while len(self._claimed) > self.claim_memory:
+                self._claimed.popitem(last=False)
+        result = await self._offload(self.manager._run_activity, activity)
+        if result is None:
+            self.failed += 1
+        else:
+            self.completed += 1
+        return result
+
+    async def _shared_listing(self) -> List[str]:
+        """Recent post ids; callers arriving while a fetch is in flight share it."""
+        if self._listing is None or self._listing.done():
+            self._listing = asyncio.ensure_future(
+                self._offload(self.manager._get_recent_posts, self.subreddit, limit=self.listing_limit)
+            )
+        return await asyncio.shield(self._listing)
+
+    async def _maintenance_loop(self) -> None:
+        while True:
+            now = datetime.now()
+            next_run = now.replace(hour=self.maintenance_hour, minute=0, second=0, microsecond=0)
+            if next_run <= now:
+                next_run += timedelta(days=1)
+            await asyncio.sleep((next_run - now).total_seconds())
+            # Memory compaction writes to the database, so it is queued behind the
+            # bots' writes instead of running beside them on an I/O thread.
+            self.write_queue.submit(self.manager._daily_maintenance)
@@ -0,0 +1,146 @@
+"""Persistent LLM response cache (SQLite) with TTL expiry and LRU eviction.
+
+Entries are keyed by model, a temperature bucket and the SHA-256 of the
+messages and ``max_tokens``, so a repeated prompt (same persona and topic,
+or a retried post) is answered without an API round-trip.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from core.llm_client import LLMRequest
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_response_cache (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    temp_bucket INTEGER NOT NULL,
+    prompt_sha256 TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_llm_response_cache_lru ON llm_response_cache(last_used_at);
+"""
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LLMResponseCache:
+    """Thread-safe TTL + LRU cache over one SQLite connection.
+
+    Args:
+        db_path: SQLite file (``":memory:"`` for a process-local cache).
+        ttl_seconds: Entries older than this are treated as misses and dropped.
+        max_entries: Least-recently-used entries beyond this are evicted on insert.
+        temperature_step: Width of a temperature bucket; 0.75 and 0.8 share a
+            bucket with the default 0.1.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path = ":memory:",
+        *,
+        ttl_seconds: float = 7 * 86400,
+        max_entries: int = 5000,
+        temperature_step: float = 0.1,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.temperature_step = temperature_step
+        self.clock = clock
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        self._size = self._conn.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()[0]
+
+    def key_for(self, request: LLMRequest) -> tuple:
+        material = json.dumps([request.messages, request.max_tokens], separators=(",", ":"))
+        digest = hashlib.sha256(material.encode("utf-8")).hexdigest()
+        bucket = int(round(request.temperature / self.temperature_step)) if self.temperature_step else 0
+        return f"{request.model}|{bucket}|{digest}", bucket, digest
+
+    def get(self, request: LLMRequest) -> Optional[str]:
+        key, _, _ = self.key_for(request)
+        now = self.clock()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_response_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            response, created_at = row
+            if now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_response_cache WHERE key = ?", (key,))
+                self._size -= 1
+                self.stats.expired += 1
+                self.stats.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE llm_response_cache SET last_used_at = ?, hits = hits + 1 WHERE key = ?", (now, key)
+            )
+            self.stats.hits += 1
+            return response
+
+    def put(self, request: LLMRequest, response: str) -> None:
+        key, bucket, digest = self.key_for(request)
+        now = self.clock()
+        with self._lock, self._conn:
+            exists = self._conn.execute("SELECT 1 FROM llm_response_cache WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                """
+                INSERT INTO llm_response_cache (key, model, temp_bucket, prompt_sha256, response, created_at, last_used_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                  response = excluded.response, created_at = excluded.created_at, last_used_at = excluded.last_used_at
+                """,
+                (key, request.model, bucket, digest, response, now, now),
+            )
+            if exists is None:
+                self._size += 1
+            if self._size > self.max_entries:
+                self._evict()
+
+    def _evict(self) -> None:
+        # Expired rows go first, then the least recently used beyond the cap.
+        cur = self._conn.execute(
+            "DELETE FROM llm_response_cache WHERE created_at < ?", (self.clock() - self.ttl_seconds,)
+        )
+        removed = cur.rowcount
+        cur = self._conn.execute(
+            """
+            DELETE FROM llm_response_cache WHERE key IN (
+                SELECT key FROM llm_response_cache ORDER BY last_used_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,),
+        )
+        removed += cur.rowcount
+        self.stats.evictions += removed
+        self._size = self._conn.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,252 @@
+"""Pooled LLM request layer: concurrency cap, timeouts, jittered retries, coalescing.
+
+Providers implement :class:`LLMProvider` (``async complete(request) -> str``).
+:class:`AsyncLLMClient` wraps one for asyncio callers; :class:`LLMPool` runs
+that client on a private event loop thread so synchronous code (scheduler
+jobs, bots) can share the same cap and in-flight table.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import itertools
+import random
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple
+
+
+class LLMError(RuntimeError):
+    """Raised when a request fails after all retries (or times out on each)."""
+
+
+@dataclass(frozen=True)
+class LLMRequest:
+    model: str
+    messages: Tuple[Tuple[str, str], ...]  # (role, content) pairs, hashable for coalescing
+    max_tokens: int = 500
+    temperature: float = 0.8
+
+    @classmethod
+    def chat(cls, model: str, system: str, user: str, **kwargs: Any) -> "LLMRequest":
+        return cls(model=model, messages=(("system", system), ("user", user)), **kwargs)
+
+    def as_messages(self) -> List[Dict[str, str]]:
+        return [{"role": role, "content": content} for role, content in self.messages]
+
+
+class LLMProvider(Protocol):
+    async def complete(self, request: LLMRequest) -> str: ...
+
+
+class OpenAIProvider:
+    """Chat completions through the ``openai`` SDK.
+
+    Pass an ``openai.AsyncOpenAI`` (preferred) or ``openai.OpenAI`` client; the
+    sync client's blocking call runs on the provider's own pool of
+    ``max_workers`` threads.  Without a client, an ``AsyncOpenAI`` is created
+    on first use from ``api_key``.
+
+    ``timeout`` is passed to the SDK with every request.  A caller-side
+    timeout only stops waiting, not a blocking call already on a thread; the
+    SDK timeout ends that call.  Calls that are abandoned but still running
+    occupy the provider's pool, not the loop's default executor, so retries
+    queue behind them instead of piling up more threads.  Size
+    ``max_workers`` to the client's concurrency cap.
+    """
+
+    def __init__(self, client: Any = None, api_key: Optional[str] = None, *,
+                 timeout: Optional[float] = None, max_workers: int = 4):
+        self._client = client
+        self._api_key = api_key
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def _get_client(self):
+        if self._client is None:
+            import openai  # deferred: only needed once a request is made
+
+            self._client = openai.AsyncOpenAI(api_key=self._api_key)
+        return self._client
+
+    async def complete(self, request: LLMRequest) -> str:
+        create = self._get_client().chat.completions.create
+        kwargs = dict(model=request.model, messages=request.as_messages(),
+                      max_tokens=request.max_tokens, temperature=request.temperature)
+        if self.timeout is not None:
+            kwargs["timeout"] = self.timeout
+        if inspect.iscoroutinefunction(create):
+            response = await create(**kwargs)
+        else:
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(self._blocking_executor(), functools.partial(create, **kwargs))
+        return response.choices[0].message.content.strip()
+
+    def _blocking_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="openai")
+            return self._executor
+
+    def close(self) -> None:
+        """Wait for blocking calls still on the provider's threads, then stop them."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+class FakeLLMProvider:
+    """Deterministic local provider for tests and offline runs.
+
+    ``latency`` is awaited per call, ``fail_first`` calls raise
+    ``ConnectionError``, and ``responses`` (cycled) replace the default echo.
+    """
+
+    def __init__(self, responses: Optional[Sequence[str]] = None, latency: float = 0.0, fail_first: int = 0):
+        self._responses = itertools.cycle(responses) if responses else None
+        self.latency = latency
+        self.fail_first = fail_first
+        self.calls: List[LLMRequest] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def complete(self, request: LLMRequest) -> str:
+        self.calls.append(request)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            if self.fail_first > 0:
+                self.fail_first -= 1
+                raise ConnectionError("fake provider: transient failure")
+            if self._responses is not None:
+                return next(self._responses)
+            return f"[{request.model}] {request.messages[-1][1][:60]}"
+        finally:
+            self.active -= 1
+
+
+@dataclass
+class LLMStats:
+    requests: int = 0
+    provider_calls: int = 0
+    coalesced: int = 0
+    retries: int = 0
+    timeouts: int = 0
+    failures: int = 0
+
+
+@dataclass
+class AsyncLLMClient:
+    """Concurrency-capped, retrying, coalescing wrapper around a provider.
+
+    Identical requests already in flight share one provider call.  Each
+    attempt is bounded by ``timeout``; failed attempts are retried up to
+    ``max_retries`` times with full-jitter exponential backoff.  With a
+    ``cache`` (see :class:`core.llm_cache.LLMResponseCache`), stored responses
+    are returned before any of that and successful ones are stored.
+    """
+
+    provider: LLMProvider
+    max_concurrency: int = 4
+    timeout: float = 30.0
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+    stats: LLMStats = field(default_factory=LLMStats)
+    cache: Any = None
+
+    def __post_init__(self):
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._inflight: Dict[LLMRequest, asyncio.Future] = {}
+
+    async def complete(self, request: LLMRequest) -> str:
+        self.stats.requests += 1
+        if self.cache is not None:
+            # The cache is SQLite-backed; keep its I/O off the loop the other requests share
+            cached = await asyncio.to_thread(self.cache.get, request)
+            if cached is not None:
+                return cached
+        pending = self._inflight.get(request)
+        if pending is not None:
+            self.stats.coalesced += 1
+            return await asyncio.shield(pending)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[request] = future
+        try:
+            result = await self._with_retries(request)
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved when nobody else was waiting
+            raise
+        else:
+            future.set_result(result)
+            if self.cache is not None:
+                await asyncio.to_thread(self.cache.put, request, result)
+            return result
+        finally:
+            self._inflight.pop(request, None)
+
+    async def _with_retries(self, request: LLMRequest) -> str:
+        if self._semaphore is None:
+            # Created lazily so it binds to the loop that actually runs requests.
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        last_error: Optional[BaseException] = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.stats.retries += 1
+                await asyncio.sleep(random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))))
+            try:
+                async with self._semaphore:
+                    self.stats.provider_calls += 1
+                    return await asyncio.wait_for(self.provider.complete(request), self.timeout)
+            except asyncio.TimeoutError as exc:
+                self.stats.timeouts += 1
+                last_error = exc
+            except Exception as exc:
+                last_error = exc
+        self.stats.failures += 1
+        raise LLMError(f"LLM request failed after {self.max_retries + 1} attempts: {last_error!r}") from last_error
+
+    async def complete_many(self, requests: Sequence[LLMRequest]) -> List[Any]:
+        """Run requests concurrently; failed entries come back as the exception."""
+        return await asyncio.gather(*(self.complete(r) for r in requests), return_exceptions=True)
+
+
+class LLMPool:
+    """Thread-safe synchronous front end for :class:`AsyncLLMClient`.
+
+    Owns an event loop on a daemon thread; every caller thread submits to it,
+    so the concurrency cap and request coalescing apply across all bots.
+    """
+
+    def __init__(self, provider: LLMProvider, **client_kwargs: Any):
+        self.client = AsyncLLMClient(provider, **client_kwargs)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="llm-pool", daemon=True)
+        self._thread.start()
+
+    @property
+    def stats(self) -> LLMStats:
+        return self.client.stats
+
+    def submit(self, request: LLMRequest) -> Future:
+        return asyncio.run_coroutine_threadsafe(self.client.complete(request), self._loop)
+
+    def complete(self, request: LLMRequest, timeout: Optional[float] = None) -> str:
+        return self.submit(request).result(timeout)
+
+    def close(self) -> None:
+        if self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+        self._loop.close()
+        close_provider = getattr(self.client.provider, "close", None)
+        if close_provider is not None:
+            close_provider()
@@ -0,0 +1,189 @@
+"""Shared, TTL-bounded cache of Reddit listings and submissions.
+
+Bots, the activity planner and ``HeresyScanner`` read ``subreddit.new``
+listings and individual submissions through one :class:`ListingCache`, so
+a listing fetched by one of them is reused by the others until it expires.
+Cached values are plain :class:`SubmissionSnapshot` records rather than
+PRAW objects: actions such as replying still go through each bot's own
+PRAW instance.
+
+The cache reads from a :class:`ListingSource`.  :class:`PrawListingSource`
+talks to Reddit; :class:`FileListingSource` serves a JSONL file and is
+used in tests and offline runs.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Protocol
+
+from core.llm_cache import CacheStats
+
+
+@dataclass(frozen=True)
+class SubmissionSnapshot:
+    id: str
+    subreddit: str
+    title: str
+    selftext: str
+    author: str
+    url: str = ""
+    created_utc: Any = None
+
+    @classmethod
+    def from_praw(cls, post) -> "SubmissionSnapshot":
+        return cls(
+            id=post.id,
+            subreddit=str(post.subreddit),
+            title=post.title or "",
+            selftext=post.selftext or "",
+            author=str(post.author),
+            url=post.url or "",
+            created_utc=post.created_utc,
+        )
+
+    @classmethod
+    def from_dict(cls, row: Dict[str, Any]) -> "SubmissionSnapshot":
+        return cls(
+            id=row["id"],
+            subreddit=row.get("subreddit", ""),
+            title=row.get("title", ""),
+            selftext=row.get("selftext", row.get("body", "")),
+            author=str(row.get("author")),
+            url=row.get("url", ""),
+            created_utc=row.get("created_utc"),
+        )
+
+
+class ListingSource(Protocol):
+    def new(self, subreddit: str, limit: int) -> List[SubmissionSnapshot]: ...
+
+    def submission(self, post_id: str) -> SubmissionSnapshot: ...
+
+
+class PrawListingSource:
+    """Reads through a ``praw.Reddit`` instance."""
+
+    def __init__(self, reddit):
+        self.reddit = reddit
+
+    def new(self, subreddit: str, limit: int) -> List[SubmissionSnapshot]:
+        return [SubmissionSnapshot.from_praw(post) for post in self.reddit.subreddit(subreddit).new(limit=limit)]
+
+    def submission(self, post_id: str) -> SubmissionSnapshot:
+        return SubmissionSnapshot.from_praw(self.reddit.submission(id=post_id))
+
+
+class FileListingSource:
+    """Serves submissions from a JSONL file, newest first per subreddit.
+
+    Rows use the fixture fields (``id``, ``subreddit``, ``title``,
+    ``selftext`` or ``body``, ``author``, ``url``).  ``calls`` counts
+    fetches so tests can check what the cache absorbed.
+    """
+
+    def __init__(self, path: str | Path):
+        self.posts: Dict[str, SubmissionSnapshot] = {}
+        self.by_subreddit: Dict[str, List[SubmissionSnapshot]] = {}
+        for line in Path(path).read_text(encoding="utf-8").splitlines():
+            if line.strip():
+                post = SubmissionSnapshot.from_dict(json.loads(line))
+                self.posts[post.id] = post
+                self.by_subreddit.setdefault(post.subreddit.lower(), []).append(post)
+        self.calls: Counter = Counter()
+
+    def new(self, subreddit: str, limit: int) -> List[SubmissionSnapshot]:
+        self.calls["new"] += 1
+        return self.by_subreddit.get(subreddit.lower(), [])[:limit]
+
+    def submission(self, post_id: str) -> SubmissionSnapshot:
+        self.calls["submission"] += 1
+        try:
+            return self.posts[post_id]
+        except KeyError:
+            raise LookupError(f"No submission {post_id!r} in fake listing") from None
+
+
+class ListingCache:
+    """Thread-safe TTL + LRU cache in front of a :class:`ListingSource`.
+
+    Args:
+        source: Where misses are fetched from; may be set after construction.
+        ttl_seconds: How long a listing or submission is served from memory.
+        max_entries: Listings plus submissions kept; least recently used go first.
+    """
+
+    def __init__(
+        self,
+        source: Optional[ListingSource] = None,
+        *,
+        ttl_seconds: float = 60.0,
+        max_entries: int = 512,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.source = source
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.clock = clock
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            expires_at, value = entry
+            if self.clock() >= expires_at:
+                del self._entries[key]
+                self.stats.expired += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def _put_many(self, items: List[tuple]) -> None:
+        expires_at = self.clock() + self.ttl_seconds
+        with self._lock:
+            for key, value in items:
+                self._entries[key] = (expires_at, value)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def new(self, subreddit: str, limit: int = 10) -> List[SubmissionSnapshot]:
+        """Newest submissions in ``subreddit``; a cached longer listing also serves shorter requests."""
+        key = ("new", subreddit.lower())
+        cached = self._get(key)
+        if cached is not None:
+            fetched_limit, posts = cached
+            if fetched_limit >= limit or len(posts) < fetched_limit:
+                return posts[:limit]
+        posts = self.source.new(subreddit, limit)
+        # Listed posts are cached individually too, so a follow-up reply needs no fetch.
+        self._put_many([(key, (limit, posts))] + [(("submission", p.id), p) for p in posts])
+        return posts
+
+    def submission(self, post_id: str) -> SubmissionSnapshot:
+        key = ("submission", post_id)
+        post = self._get(key)
+        if post is None:
+            post = self.source.submission(post_id)
+            self._put_many([(key, post)])
+        return post
+
+    def invalidate(self, subreddit: Optional[str] = None) -> None:
+        """Drop one subreddit's listing, or everything when ``subreddit`` is None."""
+        with self._lock:
+            if subreddit is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(("new", subreddit.lower()), None)
@@ -4,8 +4,6 @@ from __future__ import annotations
 import time
 from typing import Dict, Iterable, List, Optional
 
-import praw
-
 
 class RedditClient:
     def __init__(self, cfg: Dict[str, str], pause_seconds: float = 0.5):
@@ -14,6 +12,8 @@ class RedditClient:
         if missing:
             raise ValueError(f"Missing Reddit credentials: {', '.join(missing)}")
         self.pause = pause_seconds
+        import praw  # deferred: the PRAW stack is only needed once a client is built
+
         self.reddit = praw.Reddit(
             client_id=cfg["client_id"],
             client_secret=cfg["client_secret"],
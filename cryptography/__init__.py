@@ -29,19 +29,27 @@ Example:
 
 """
 
-from .cipher import vigenere_encrypt, vigenere_decrypt
+from .cipher import VigenereStream, vigenere_encrypt, vigenere_decrypt
 from .aesthetics import (
     wrap_message,
     unwrap_message,
     encrypt,
     decrypt,
+    encrypt_stream,
+    decrypt_stream,
 )
+from .analysis import CrackResult, crack
 
 __all__ = [
     "vigenere_encrypt",
     "vigenere_decrypt",
+    "VigenereStream",
     "wrap_message",
     "unwrap_message",
     "encrypt",
     "decrypt",
+    "encrypt_stream",
+    "decrypt_stream",
+    "CrackResult",
+    "crack",
 ]
\ No newline at end of file
@@ -26,15 +26,30 @@ decrypt(wrapped: str, key: str) -> str
     Reverse of ``encrypt``.  Unwraps a Warhammer‑style message and
     decrypts it back to plaintext using the provided key.
 
+encrypt_stream(src, dst, key: str, ordo: str = "Hereticus", thought: str | None = None) -> int
+    Streaming ``encrypt``: reads plaintext from a text file object and
+    writes the communiqué to another, chunk by chunk.
+
+decrypt_stream(src, dst, key: str) -> int
+    Streaming ``decrypt``.
+
 """
 
 from __future__ import annotations
 
 import random
 import re
-from typing import Iterable
+from typing import Iterable, TextIO
+
+from .cipher import VigenereStream, vigenere_encrypt, vigenere_decrypt
 
-from .cipher import vigenere_encrypt, vigenere_decrypt
+STREAM_CHUNK_SIZE = 1 << 16
+# How far decrypt_stream looks for the begin marker before treating the
+# input as bare cipher text.
+HEADER_SCAN_LIMIT = 1 << 16
+
+BEGIN_MARKER = "++BEGIN CRYPTOGRAM++"
+END_MARKER = "++END CRYPTOGRAM++"
 
 # A curated list of Imperial aphorisms (Thoughts for the day) drawn
 # from Lexicanum and other official sources.  These phrases emphasise
@@ -69,6 +84,45 @@ def _group_text(text: str, group_size: int = 5) -> str:
     )
 
 
+class _GroupWriter:
+    """Incremental :func:`_group_text` that writes groups as they fill."""
+
+    def __init__(self, out: TextIO, group_size: int = 5):
+        self._out = out
+        self._size = group_size
+        self._pending = ""
+        self._started = False
+
+    def _emit(self, grouped: str) -> None:
+        self._out.write(" " + grouped if self._started else grouped)
+        self._started = True
+
+    def write(self, text: str) -> None:
+        clean = self._pending + re.sub(r"\s+", "", text.replace(" ", "_"))
+        full = len(clean) - len(clean) % self._size
+        if full:
+            self._emit(' '.join(clean[i : i + self._size] for i in range(0, full, self._size)))
+        self._pending = clean[full:]
+
+    def close(self) -> None:
+        if self._pending:
+            self._emit(self._pending)
+            self._pending = ""
+
+
+def _header_lines(ordo: str, thought: str | None) -> list[str]:
+    chosen_thought = thought or random.choice(THOUGHTS)
+    return [
+        "+++INQUISITORIAL COMMUNIQUÉ+++",
+        f"Ordo: {ordo}",
+        f"Thought for the Day: {chosen_thought}",
+        BEGIN_MARKER,
+    ]
+
+
+_FOOTER_LINES = [END_MARKER, "+++END OF COMMUNIQUÉ+++"]
+
+
 def wrap_message(cipher_text: str, ordo: str = "Hereticus", thought: str | None = None) -> str:
     """Wrap an encrypted string in a Warhammer‑style communiqué.
 
@@ -92,15 +146,9 @@ def wrap_message(cipher_text: str, ordo: str = "Hereticus", thought: str | None
         A multi‑line string styled like an Imperial transmission.
     """
     grouped = _group_text(cipher_text)
-    chosen_thought = thought or random.choice(THOUGHTS)
-    lines: list[str] = []
-    lines.append("+++INQUISITORIAL COMMUNIQUÉ+++")
-    lines.append(f"Ordo: {ordo}")
-    lines.append(f"Thought for the Day: {chosen_thought}")
-    lines.append("++BEGIN CRYPTOGRAM++")
+    lines = _header_lines(ordo, thought)
     lines.append(grouped)
-    lines.append("++END CRYPTOGRAM++")
-    lines.append("+++END OF COMMUNIQUÉ+++")
+    lines.extend(_FOOTER_LINES)
     return '\n'.join(lines)
 
 
@@ -122,8 +170,8 @@ def unwrap_message(wrapped: str) -> str:
     str
         The ungrouped cipher text ready for decryption.
     """
-    begin_marker = "++BEGIN CRYPTOGRAM++"
-    end_marker = "++END CRYPTOGRAM++"
+    begin_marker = BEGIN_MARKER
+    end_marker = END_MARKER
     pattern = re.compile(
         re.escape(begin_marker) + r"(.*?)" + re.escape(end_marker), re.DOTALL
     )
@@ -167,4 +215,108 @@ def decrypt(wrapped: str, key: str) -> str:
         The original plaintext.
     """
     cipher_text = unwrap_message(wrapped)
-    return vigenere_decrypt(cipher_text, key)
\ No newline at end of file
+    return vigenere_decrypt(cipher_text, key)
+
+
+def encrypt_stream(
+    src: TextIO,
+    dst: TextIO,
+    key: str,
+    ordo: str = "Hereticus",
+    thought: str | None = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> int:
+    """Encrypt a text stream into a communiqué without loading it whole.
+
+    Output is identical to ``dst.write(encrypt(src.read(), key, ...))``
+    but only ``chunk_size`` characters are held at a time: the key
+    position is carried across chunks and 5‑character groups are written
+    as soon as they are complete.
+
+    Parameters
+    ----------
+    src : TextIO
+        Text‑mode file object to read plaintext from.
+    dst : TextIO
+        Text‑mode file object the communiqué is written to.
+    key, ordo, thought
+        As for :func:`encrypt`.
+    chunk_size : int, optional
+        Characters read per step.
+
+    Returns
+    -------
+    int
+        Number of plaintext characters read.
+    """
+    dst.write('\n'.join(_header_lines(ordo, thought)) + '\n')
+    stream = VigenereStream(key)
+    groups = _GroupWriter(dst)
+    total = 0
+    for chunk in iter(lambda: src.read(chunk_size), ""):
+        groups.write(stream.update(chunk))
+        total += len(chunk)
+    groups.close()
+    dst.write('\n' + '\n'.join(_FOOTER_LINES))
+    return total
+
+
+def decrypt_stream(src: TextIO, dst: TextIO, key: str, chunk_size: int = STREAM_CHUNK_SIZE) -> int:
+    """Decrypt a communiqué stream written by :func:`encrypt_stream` or :func:`encrypt`.
+
+    Matches :func:`decrypt` for well‑formed communiqués and for bare
+    cipher text.  Two cases differ because the input is never held whole:
+    if no begin marker appears in the first ``HEADER_SCAN_LIMIT``
+    characters the input is treated as bare cipher text, and a
+    communiqué cut off before its end marker yields whatever cipher
+    text arrived.
+
+    Parameters
+    ----------
+    src : TextIO
+        Text‑mode file object holding the communiqué.
+    dst : TextIO
+        Text‑mode file object the plaintext is written to.
+    key : str
+        The key used for encryption.
+    chunk_size : int, optional
+        Characters read per step.
+
+    Returns
+    -------
+    int
+        Number of plaintext characters written.
+    """
+    stream = VigenereStream(key, decrypt=True)
+    written = 0
+
+    def emit(raw: str) -> None:
+        nonlocal written
+        clean = re.sub(r"\s+", "", raw).replace("_", " ")
+        if clean:
+            dst.write(stream.update(clean))
+            written += len(clean)
+
+    chunks = iter(lambda: src.read(chunk_size), "")
+    buf = ""
+    while (begin := buf.find(BEGIN_MARKER)) < 0:
+        chunk = next(chunks, "")
+        if not chunk or len(buf) >= HEADER_SCAN_LIMIT:
+            # No communiqué header: like unwrap_message, decrypt everything.
+            emit(buf + chunk)
+            for chunk in chunks:
+                emit(chunk)
+            return written
+        buf += chunk
+
+    buf = buf[begin + len(BEGIN_MARKER):]
+    keep = len(END_MARKER) - 1  # a marker split across reads must stay in the buffer
+    while (end := buf.find(END_MARKER)) < 0:
+        chunk = next(chunks, "")
+        if not chunk:
+            break
+        safe = max(len(buf) - keep, 0)
+        emit(buf[:safe])
+        buf = buf[safe:] + chunk
+    emit(buf if end < 0 else buf[:end])
+    return written
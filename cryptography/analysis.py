@@ -0,0 +1,240 @@
+"""
+Key recovery for the suite's Vigenère cipher.
+
+Given only cipher text produced by :func:`~.cipher.vigenere_encrypt`,
+these helpers estimate the key length and recover the key.  Everything
+works on NumPy count arrays, so a communiqué is cracked in well under a
+millisecond and batches of intercepts can be processed quickly.
+
+The analysis follows the cipher's exact rules.  Every letter and digit
+consumes one key position, and everything else is skipped.  Only the
+letters are counted, because digits are shifted modulo 10 and carry
+little frequency information.  A digit still advances the key, so it
+moves the column that the following letters fall into.
+
+Functions
+---------
+
+keyed_stream(text: str) -> tuple[ndarray, ndarray]
+    Key position and letter index (0–25) for each letter in ``text``.
+
+ioc_scores(text: str, max_key_length: int = 16) -> ndarray
+    Mean per-column index of coincidence for each candidate key length.
+
+kasiski_scores(text: str, max_key_length: int = 16) -> ndarray
+    How many repeated-trigram distances each candidate length divides.
+
+estimate_key_length(text: str, max_key_length: int = 16) -> int
+    The smallest key length whose IoC is close to the best one.
+
+recover_key(text: str, key_length: int) -> str
+    The chi-squared best shift for each column, as key letters.
+
+crack(text: str, max_key_length: int = 16) -> CrackResult
+    Estimate the length, recover the key and decrypt.
+
+crack_many(texts: Iterable[str], max_key_length: int = 16) -> list[CrackResult]
+    ``crack`` over a batch of intercepts.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable
+
+from .cipher import vigenere_decrypt
+
+# Relative letter frequencies of English text, A–Z.
+ENGLISH_FREQUENCIES = (
+    0.08167, 0.01492, 0.02782, 0.04253, 0.12702, 0.02228, 0.02015,
+    0.06094, 0.06966, 0.00153, 0.00772, 0.04025, 0.02406, 0.06749,
+    0.07507, 0.01929, 0.00095, 0.05987, 0.06327, 0.09056, 0.02758,
+    0.00978, 0.02360, 0.00150, 0.01974, 0.00074,
+)
+ENGLISH_IOC = 0.0667
+RANDOM_IOC = 1 / 26
+# A candidate length is accepted if its IoC reaches this fraction of the
+# best candidate's, so multiples of the true length don't win.
+IOC_TOLERANCE = 0.9
+
+
+@dataclass
+class CrackResult:
+    key: str
+    key_length: int
+    ioc: float
+    chi_squared: float
+    plaintext: str
+
+
+def _np():
+    import numpy as np  # the analysis toolkit is NumPy-only
+
+    return np
+
+
+@lru_cache(maxsize=None)
+def _letter_lut():
+    np = _np()
+    # -1: not keyed, 0–25: letter, 26: digit (keyed, not counted)
+    lut = np.full(256, -1, dtype=np.int16)
+    for i in range(26):
+        lut[ord('A') + i] = lut[ord('a') + i] = i
+    lut[ord('0'):ord('9') + 1] = 26
+    return lut
+
+
+@lru_cache(maxsize=None)
+def _shifted_frequencies():
+    """``[s, k]``: expected share of cipher letter ``k`` under shift ``s``."""
+    np = _np()
+    freqs = np.asarray(ENGLISH_FREQUENCIES)
+    return np.stack([np.roll(freqs, s) for s in range(26)])
+
+
+def keyed_stream(text: str):
+    """Return ``(key_position, letter)`` arrays for the letters of ``text``.
+
+    ``key_position`` counts every letter and digit before the letter,
+    matching the key index used by :func:`~.cipher.vigenere_encrypt`.
+    Non‑ASCII letters and digits advance the key position but are not
+    returned.
+    """
+    np = _np()
+    if text.isascii():
+        codes = _letter_lut()[np.frombuffer(text.encode("ascii"), dtype=np.uint8)]
+    else:
+        codes = np.asarray(
+            [
+                ord(ch.upper()) - ord('A') if ch.isascii() and ch.isalpha()
+                else 26 if ch.isalpha() or ch.isdigit()
+                else -1
+                for ch in text
+            ],
+            dtype=np.int16,
+        )
+    keyed = codes[codes >= 0]
+    positions = np.flatnonzero(keyed < 26)
+    return positions, keyed[positions].astype(np.intp)
+
+
+def _column_counts(positions, letters, key_length: int):
+    np = _np()
+    flat = (positions % key_length) * 26 + letters
+    return np.bincount(flat, minlength=key_length * 26).reshape(key_length, 26)
+
+
+def ioc_scores(text: str, max_key_length: int = 16):
+    """Mean column index of coincidence for key lengths ``1..max_key_length``.
+
+    Element ``L - 1`` is for length ``L``.  Columns are weighted by their
+    size, and lengths with no column of two or more letters score 0.
+    """
+    return _ioc_scores(*keyed_stream(text), max_key_length)
+
+
+def _ioc_scores(positions, letters, max_key_length: int):
+    np = _np()
+    # One bincount for every candidate length: length L owns columns
+    # [L(L-1)/2, L(L+1)/2) of a flat (column, letter) histogram.
+    lengths = np.arange(1, max_key_length + 1)
+    first_column = lengths * (lengths - 1) // 2
+    flat = (first_column + positions[:, None] % lengths) * 26 + letters[:, None]
+    n_columns = int(first_column[-1] + max_key_length)
+    counts = np.bincount(flat.ravel(), minlength=n_columns * 26).reshape(n_columns, 26)
+    n = counts.sum(axis=1)
+    coincidences = np.add.reduceat((counts * (counts - 1)).sum(axis=1), first_column)
+    pairs = np.add.reduceat(n * (n - 1), first_column)
+    return np.divide(coincidences, pairs, out=np.zeros(max_key_length), where=pairs > 0)
+
+
+def kasiski_scores(text: str, max_key_length: int = 16):
+    """Kasiski examination over the keyed stream.
+
+    Repeated letter trigrams are located in key‑position space, so skipped
+    punctuation does not distort the distances.  Element ``L - 1`` counts
+    the distances between consecutive repeats that ``L`` divides.
+    """
+    np = _np()
+    positions, letters = keyed_stream(text)
+    scores = np.zeros(max_key_length, dtype=np.int64)
+    if letters.size < 4:
+        return scores
+    # Only trigrams whose three letters occupy consecutive key positions.
+    contiguous = (positions[2:] - positions[:-2]) == 2
+    grams = (letters[:-2] * 26 + letters[1:-1]) * 26 + letters[2:]
+    grams, starts = grams[contiguous], positions[:-2][contiguous]
+    order = np.argsort(grams, kind="stable")
+    grams, starts = grams[order], starts[order]
+    repeat = grams[1:] == grams[:-1]
+    distances = (starts[1:] - starts[:-1])[repeat]
+    if distances.size:
+        lengths = np.arange(1, max_key_length + 1)
+        scores = (distances[:, None] % lengths == 0).sum(axis=0)
+    return scores
+
+
+def estimate_key_length(text: str, max_key_length: int = 16) -> int:
+    """Smallest key length whose IoC is within ``IOC_TOLERANCE`` of the best."""
+    return _pick_length(ioc_scores(text, max_key_length))
+
+
+def _pick_length(scores) -> int:
+    best = scores.max()
+    if best <= 0:
+        return 1
+    return int((scores >= IOC_TOLERANCE * best).argmax()) + 1
+
+
+def _chi_squared_by_shift(counts):
+    """Chi‑squared of each column against English for all 26 shifts, shape ``(L, 26)``."""
+    np = _np()
+    expected = _shifted_frequencies()
+    n = counts.sum(axis=1, keepdims=True)[:, :, None]
+    exp_counts = np.maximum(n * expected[None, :, :], 1e-9)
+    return ((counts[:, None, :] - exp_counts) ** 2 / exp_counts).sum(axis=2)
+
+
+def recover_key(text: str, key_length: int) -> str:
+    """Most English‑like shift per key column, as an upper‑case key."""
+    positions, letters = keyed_stream(text)
+    chi = _chi_squared_by_shift(_column_counts(positions, letters, key_length))
+    return "".join(chr(ord('A') + int(s)) for s in chi.argmin(axis=1))
+
+
+def crack(text: str, max_key_length: int = 16) -> CrackResult:
+    """Recover the key of a Vigenère cipher text and decrypt it.
+
+    Parameters
+    ----------
+    text : str
+        Raw cipher text (use :func:`~.aesthetics.unwrap_message` first
+        for a wrapped communiqué).
+    max_key_length : int, optional
+        Longest key considered.
+
+    Returns
+    -------
+    CrackResult
+        The key, its length, the mean column IoC at that length, the
+        summed chi‑squared of the chosen shifts, and the plaintext.
+    """
+    positions, letters = keyed_stream(text)
+    scores = _ioc_scores(positions, letters, max_key_length)
+    length = _pick_length(scores)
+    chi = _chi_squared_by_shift(_column_counts(positions, letters, length))
+    shifts = chi.argmin(axis=1)
+    key = "".join(chr(ord('A') + int(s)) for s in shifts)
+    return CrackResult(
+        key=key,
+        key_length=length,
+        ioc=float(scores[length - 1]),
+        chi_squared=float(chi.min(axis=1).sum()),
+        plaintext=vigenere_decrypt(text, key),
+    )
+
+
+def crack_many(texts: Iterable[str], max_key_length: int = 16) -> list[CrackResult]:
+    """:func:`crack` over a batch of intercepts."""
+    return [crack(text, max_key_length) for text in texts]
@@ -21,6 +21,11 @@ vigenere_encrypt(text: str, key: str) -> str
 vigenere_decrypt(text: str, key: str) -> str
     Decrypt a Vigenère‑style ciphertext using the same key.
 
+VigenereStream(key: str, decrypt: bool = False)
+    Incremental form of the two functions above: ``update(chunk)``
+    carries the key position across chunks, so feeding a text piece by
+    piece gives the same output as one call on the whole text.
+
 Key handling
 ------------
 
@@ -32,11 +37,51 @@ key has no letters the functions will raise a ``ValueError``.
 Numeric characters in the plaintext are shifted using the same
 mechanism but modulo 10 instead of 26.  For example, a key letter
 with value 3 will transform ``'7'`` into ``'0'``.
+
+Implementation
+--------------
+
+ASCII text takes a table-driven path: one 256-byte translation table
+per shift is built at import time, the letters and digits are pulled
+out of the text in a single regex pass, and every ``len(key)``-th
+keyed character is translated with one ``bytes.translate`` call.
+Payloads of ``NUMPY_MIN_BYTES`` or more are done as a single uint8
+gather in NumPy when it is installed.  Text containing non-ASCII
+characters goes through the original character loop, so output is
+identical to it for every input.
 """
 
 from __future__ import annotations
 
-import string
+import re
+from itertools import accumulate
+
+NUMPY_MIN_BYTES = 1 << 12
+
+_ASCII_UPPER = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_ASCII_LOWER = b"abcdefghijklmnopqrstuvwxyz"
+_DIGITS = b"0123456789"
+# Splits ASCII text into alternating (keyed run, separator run) pieces.
+_SEPARATORS = re.compile(rb"([^0-9A-Za-z]+)")
+
+
+def _rotate(alphabet: bytes, shift: int) -> bytes:
+    shift %= len(alphabet)
+    return alphabet[shift:] + alphabet[:shift]
+
+
+def _shift_table(shift: int) -> bytes:
+    """256-byte table moving letters by ``shift`` mod 26 and digits mod 10."""
+    return bytes.maketrans(
+        _ASCII_UPPER + _ASCII_LOWER + _DIGITS,
+        _rotate(_ASCII_UPPER, shift) + _rotate(_ASCII_LOWER, shift) + _rotate(_DIGITS, shift),
+    )
+
+
+_KEYED_MASK = bytes(b in _ASCII_UPPER + _ASCII_LOWER + _DIGITS for b in range(256))
+_NON_KEYED = bytes(b for b in range(256) if not _KEYED_MASK[b])
+_ENCRYPT_TABLES = tuple(_shift_table(s) for s in range(26))
+_DECRYPT_TABLES = tuple(_shift_table(-s) for s in range(26))
 
 def _prepare_key(key: str) -> list[int]:
     """Preprocess the key and return a list of integer shifts.
@@ -55,28 +100,13 @@ def _prepare_key(key: str) -> list[int]:
     return shifts
 
 
-def vigenere_encrypt(text: str, key: str) -> str:
-    """Encrypt `text` using a Vigenère‑style cipher with the provided `key`.
-
-    Only letters and digits are transformed.  Letters preserve their
-    case.  Digits are shifted modulo 10 by the same shift used for
-    letters.  Non‑alphanumeric characters (including whitespace)
-    remain unchanged.
-
-    Parameters
-    ----------
-    text : str
-        The plaintext to encrypt.
-    key : str
-        The encryption key consisting of one or more letters.  Other
-        characters are ignored.  The key is case‑insensitive.
+def _shift_reference(text: str, shifts: list[int], sign: int) -> str:
+    """Character-at-a-time transform; ``sign`` is +1 to encrypt, -1 to decrypt.
 
-    Returns
-    -------
-    str
-        The encrypted text.
+    This is the original implementation, kept for non-ASCII input (where
+    ``isalpha``/``isdigit`` accept more than A-Z and 0-9) and as the
+    reference the fast paths are checked against.
     """
-    shifts = _prepare_key(key)
     result: list[str] = []
     key_index = 0
     for ch in text:
@@ -84,16 +114,16 @@ def vigenere_encrypt(text: str, key: str) -> str:
             shift = shifts[key_index % len(shifts)]
             if ch.isupper():
                 base = ord('A')
-                offset = (ord(ch) - base + shift) % 26
+                offset = (ord(ch) - base + sign * shift) % 26
                 result.append(chr(base + offset))
             else:
                 base = ord('a')
-                offset = (ord(ch) - base + shift) % 26
+                offset = (ord(ch) - base + sign * shift) % 26
                 result.append(chr(base + offset))
             key_index += 1
         elif ch.isdigit():
             shift = shifts[key_index % len(shifts)]
-            new_digit = (int(ch) + shift) % 10
+            new_digit = (int(ch) + sign * shift) % 10
             result.append(str(new_digit))
             key_index += 1
         else:
@@ -101,6 +131,85 @@ def vigenere_encrypt(text: str, key: str) -> str:
     return ''.join(result)
 
 
+def _shift_keyed(keyed: bytes, shifts: list[int], tables: tuple) -> bytes:
+    """Translate a run of letters/digits; position ``i`` uses ``shifts[i % len]``."""
+    period = len(shifts)
+    if period == 1 or len(set(shifts)) == 1:
+        return keyed.translate(tables[shifts[0]])
+    out = bytearray(keyed)
+    for r in range(min(period, len(keyed))):
+        out[r::period] = keyed[r::period].translate(tables[shifts[r]])
+    return bytes(out)
+
+
+def _shift_ascii(data: bytes, shifts: list[int], tables: tuple) -> bytes:
+    parts = _SEPARATORS.split(data)
+    runs = parts[0::2]
+    shifted = _shift_keyed(b"".join(runs), shifts, tables)
+    ends = list(accumulate(map(len, runs)))
+    parts[0::2] = [shifted[end - len(run):end] for run, end in zip(runs, ends)]
+    return b"".join(parts)
+
+
+def _shift_numpy(data: bytes, shifts: list[int], tables: tuple) -> bytes:
+    import numpy as np  # optional; only large payloads use it
+
+    arr = np.frombuffer(data, dtype=np.uint8)
+    lut = np.frombuffer(b"".join(tables), dtype=np.uint8)  # tables[s][b] == lut[s * 256 + b]
+    # Running count of keyed characters gives each position its key index;
+    # separators get a neighbour's shift, which their identity row ignores.
+    key_index = np.cumsum(np.frombuffer(_KEYED_MASK, dtype=np.bool_).take(arr), dtype=np.intp)
+    key_index -= 1
+    key_index %= len(shifts)
+    flat = (np.asarray(shifts, dtype=np.intp) * 256).take(key_index)
+    flat += arr
+    return lut.take(flat).tobytes()
+
+
+def _count_keyed(text: str) -> int:
+    """Number of characters that consume a key position."""
+    if text.isascii():
+        return len(text.encode("ascii").translate(None, _NON_KEYED))
+    return sum(1 for ch in text if ch.isalpha() or ch.isdigit())
+
+
+def _transform(text: str, shifts: list[int], sign: int) -> str:
+    if not text.isascii():
+        return _shift_reference(text, shifts, sign)
+    tables = _ENCRYPT_TABLES if sign > 0 else _DECRYPT_TABLES
+    data = text.encode("ascii")
+    if len(data) >= NUMPY_MIN_BYTES:
+        try:
+            return _shift_numpy(data, shifts, tables).decode("ascii")
+        except ImportError:
+            pass
+    return _shift_ascii(data, shifts, tables).decode("ascii")
+
+
+def vigenere_encrypt(text: str, key: str) -> str:
+    """Encrypt `text` using a Vigenère‑style cipher with the provided `key`.
+
+    Only letters and digits are transformed.  Letters preserve their
+    case.  Digits are shifted modulo 10 by the same shift used for
+    letters.  Non‑alphanumeric characters (including whitespace)
+    remain unchanged.
+
+    Parameters
+    ----------
+    text : str
+        The plaintext to encrypt.
+    key : str
+        The encryption key consisting of one or more letters.  Other
+        characters are ignored.  The key is case‑insensitive.
+
+    Returns
+    -------
+    str
+        The encrypted text.
+    """
+    return _transform(text, _prepare_key(key), 1)
+
+
 def vigenere_decrypt(text: str, key: str) -> str:
     """Decrypt a Vigenère‑style ciphertext using the provided `key`.
 
@@ -119,26 +228,34 @@ def vigenere_decrypt(text: str, key: str) -> str:
     str
         The original plaintext.
     """
-    shifts = _prepare_key(key)
-    result: list[str] = []
-    key_index = 0
-    for ch in text:
-        if ch.isalpha():
-            shift = shifts[key_index % len(shifts)]
-            if ch.isupper():
-                base = ord('A')
-                offset = (ord(ch) - base - shift) % 26
-                result.append(chr(base + offset))
-            else:
-                base = ord('a')
-                offset = (ord(ch) - base - shift) % 26
-                result.append(chr(base + offset))
-            key_index += 1
-        elif ch.isdigit():
-            shift = shifts[key_index % len(shifts)]
-            new_digit = (int(ch) - shift) % 10
-            result.append(str(new_digit))
-            key_index += 1
-        else:
-            result.append(ch)
-    return ''.join(result)
\ No newline at end of file
+    return _transform(text, _prepare_key(key), -1)
+
+
+class VigenereStream:
+    """Chunk-at-a-time Vigenère transform.
+
+    The key position advances across :meth:`update` calls exactly as it
+    does within a single :func:`vigenere_encrypt` call, so
+    ``"".join(stream.update(c) for c in chunks)`` equals the one-shot
+    result for any split of the text.
+
+    Parameters
+    ----------
+    key : str
+        The cipher key (see :func:`vigenere_encrypt`).
+    decrypt : bool, optional
+        Shift backwards instead of forwards.
+    """
+
+    def __init__(self, key: str, decrypt: bool = False):
+        self._shifts = _prepare_key(key)
+        self._sign = -1 if decrypt else 1
+        self.key_index = 0
+
+    def update(self, chunk: str) -> str:
+        """Transform the next piece of text."""
+        offset = self.key_index % len(self._shifts)
+        shifts = self._shifts[offset:] + self._shifts[:offset]
+        out = _transform(chunk, shifts, self._sign)
+        self.key_index += _count_keyed(chunk)
+        return out
@@ -1,26 +1,209 @@
 from __future__ import annotations
 
+import argparse
+import gzip
+import io
 import json
+import os
 import sqlite3
 from pathlib import Path
+from typing import Iterator, Optional, Tuple
 
+from inquisitor.ingestion.db import MIGRATIONS_DIR, migrate, table_exists
 
-def export_marks(conn: sqlite3.Connection, out_path: Path) -> int:
-    cur = conn.execute(
-        """
-        SELECT item_id, degree_of_confidence, reasoning_for_mark
-        FROM detector_marks
-        ORDER BY inserted_at
-        """
-    )
-    rows = cur.fetchall()
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", encoding="utf-8") as handle:
-        for item_id, score, rationale in rows:
+FORMATS = ("jsonl", "npz")
+COMPRESSIONS = (None, "gzip", "zstd")
+CHUNK_SIZE = 1000
+
+MarkRow = Tuple[int, str, Optional[str], Optional[float], Optional[str], Optional[str]]
+
+
+def ensure_feed_offsets(conn: sqlite3.Connection) -> None:
+    if not table_exists(conn, "feed_offsets"):
+        migrate(conn, MIGRATIONS_DIR / "012_feed_offsets.sql")
+
+
+def read_offset(conn: sqlite3.Connection, consumer: str) -> int:
+    ensure_feed_offsets(conn)
+    row = conn.execute("SELECT last_id FROM feed_offsets WHERE consumer = ?", (consumer,)).fetchone()
+    return row[0] if row else 0
+
+
+def commit_offset(conn: sqlite3.Connection, consumer: str, last_id: int) -> None:
+    ensure_feed_offsets(conn)
+    with conn:
+        conn.execute(
+            """
+            INSERT INTO feed_offsets (consumer, last_id, updated_at) VALUES (?, ?, datetime('now'))
+            ON CONFLICT(consumer) DO UPDATE SET last_id = excluded.last_id, updated_at = excluded.updated_at
+            """,
+            (consumer, last_id),
+        )
+
+
+def iter_marks(
+    conn: sqlite3.Connection,
+    *,
+    after_id: int = 0,
+    until_id: Optional[int] = None,
+    chunk: int = CHUNK_SIZE,
+) -> Iterator[MarkRow]:
+    """Yield ``(id, item_id, subreddit, score, rationale, created_at)`` in id order.
+
+    Reads ``detector_marks`` in primary-key ranges of ``chunk`` rows, so memory
+    stays flat and no sort is needed.
+    """
+    last_id = after_id
+    bound = "AND id <= ?" if until_id is not None else ""
+    while True:
+        params = (last_id, until_id, chunk) if until_id is not None else (last_id, chunk)
+        rows = conn.execute(
+            f"""
+            SELECT id, item_id, subreddit, degree_of_confidence, reasoning_for_mark, created_at
+            FROM detector_marks WHERE id > ? {bound} ORDER BY id LIMIT ?
+            """,
+            params,
+        ).fetchall()
+        if not rows:
+            return
+        yield from rows
+        last_id = rows[-1][0]
+
+
+def _detect_format(out_path: Path, fmt: Optional[str], compression: Optional[str]):
+    suffixes = [s.lower() for s in out_path.suffixes]
+    if compression is None:
+        if suffixes[-1:] == [".gz"]:
+            compression = "gzip"
+        elif suffixes[-1:] == [".zst"]:
+            compression = "zstd"
+    if fmt is None:
+        fmt = "npz" if ".npz" in suffixes else "jsonl"
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r}; expected one of {FORMATS}")
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression {compression!r}; expected one of {COMPRESSIONS}")
+    if fmt == "npz" and compression is not None:
+        raise ValueError("npz output is already compressed; drop the compression option")
+    return fmt, compression
+
+
+def _open_text(path: Path, compression: Optional[str]):
+    if compression == "gzip":
+        return gzip.open(path, "wt", encoding="utf-8")
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise RuntimeError("zstd output requires the 'zstandard' package") from exc
+        raw = open(path, "wb")
+        return io.TextIOWrapper(zstandard.ZstdCompressor().stream_writer(raw), encoding="utf-8")
+    return open(path, "w", encoding="utf-8")
+
+
+def _write_jsonl(rows: Iterator[MarkRow], path: Path, compression: Optional[str]) -> Tuple[int, int]:
+    n = last_id = 0
+    with _open_text(path, compression) as handle:
+        for mark_id, item_id, subreddit, score, rationale, created_at in rows:
             payload = {
+                "id": mark_id,
                 "item_id": item_id,
                 "score": float(score) if score is not None else 0.0,
                 "rationale": rationale or "",
+                "subreddit": subreddit,
+                "created_at": created_at,
             }
             handle.write(json.dumps(payload) + "\n")
-    return len(rows)
+            n, last_id = n + 1, mark_id
+    return n, last_id
+
+
+def _write_npz(rows: Iterator[MarkRow], path: Path) -> Tuple[int, int]:
+    import numpy as np  # analytics-only dependency
+
+    cols = ([], [], [], [], [], [])
+    for row in rows:
+        for col, value in zip(cols, row):
+            col.append(value)
+    ids, item_ids, subreddits, scores, rationales, created = cols
+    with open(path, "wb") as handle:
+        np.savez_compressed(
+            handle,
+            id=np.asarray(ids, dtype=np.int64),
+            item_id=np.asarray(item_ids, dtype=str),
+            subreddit=np.asarray([s or "" for s in subreddits], dtype=str),
+            score=np.asarray([s if s is not None else np.nan for s in scores], dtype=np.float64),
+            rationale=np.asarray([r or "" for r in rationales], dtype=str),
+            created_at=np.asarray([c or "" for c in created], dtype=str),
+        )
+    return len(ids), (ids[-1] if ids else 0)
+
+
+def export_marks(
+    conn: sqlite3.Connection,
+    out_path: Path,
+    *,
+    consumer: Optional[str] = None,
+    since_id: int = 0,
+    fmt: Optional[str] = None,
+    compression: Optional[str] = None,
+    chunk: int = CHUNK_SIZE,
+) -> int:
+    """Stream ``detector_marks`` to ``out_path``.
+
+    Args:
+        conn (sqlite3.Connection): Open database connection.
+        out_path (Path): Destination file; the format and compression default
+            from its suffix (``.jsonl``, ``.jsonl.gz``, ``.jsonl.zst``, ``.npz``).
+        consumer (str, optional): Name in ``feed_offsets``. Only marks past the
+            consumer's offset are exported, and the offset advances once the file
+            is complete, so repeated runs write increments.
+        since_id (int, optional): Export marks with ``id`` greater than this when
+            no consumer is given. Defaults to 0 (full history).
+        fmt (str, optional): ``"jsonl"`` or ``"npz"`` (columnar, one array per field).
+        compression (str, optional): ``None``, ``"gzip"`` or ``"zstd"`` for JSONL.
+        chunk (int, optional): Rows fetched per id range.
+
+    Returns:
+        int: Number of marks written.
+    """
+    out_path = Path(out_path)
+    fmt, compression = _detect_format(out_path, fmt, compression)
+    after_id = read_offset(conn, consumer) if consumer else since_id
+    # Snapshot the upper bound so marks inserted mid-export go to the next run.
+    until_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM detector_marks").fetchone()[0]
+    rows = iter_marks(conn, after_id=after_id, until_id=until_id, chunk=chunk)
+
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out_path.with_name(f".{out_path.name}.{os.getpid()}.tmp")
+    try:
+        if fmt == "npz":
+            n, last_id = _write_npz(rows, tmp)
+        else:
+            n, last_id = _write_jsonl(rows, tmp, compression)
+        os.replace(tmp, out_path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+    if consumer and n:
+        commit_offset(conn, consumer, last_id)
+    return n
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Export detector marks (full or incremental)")
+    ap.add_argument("--db", default="inquisitor_net_phase1.db")
+    ap.add_argument("--out", required=True, help="Output path (.jsonl, .jsonl.gz, .jsonl.zst or .npz)")
+    ap.add_argument("--consumer", default=None, help="Resume from this consumer's offset and advance it")
+    ap.add_argument("--since-id", type=int, default=0, help="Export marks after this id (without --consumer)")
+    ap.add_argument("--format", choices=FORMATS, default=None, help="Override the format implied by --out")
+    ap.add_argument("--compression", choices=["gzip", "zstd"], default=None)
+    args = ap.parse_args()
+    with sqlite3.connect(args.db) as conn:
+        n = export_marks(conn, Path(args.out), consumer=args.consumer, since_id=args.since_id,
+                         fmt=args.format, compression=args.compression)
+    print(f"Exported {n} marks to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
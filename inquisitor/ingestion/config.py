@@ -1,10 +1,96 @@
-import yaml
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import sys
 from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
 
-def load_yaml(path: str|Path):
+# Bump when the pickled shape of any cached object changes.
+CACHE_FORMAT = 1
+
+# Pickled payloads, so every caller gets a fresh object it may mutate.
+_memo: Dict[Tuple[str, str, int, int], bytes] = {}
+
+
+def cache_dir() -> Path | None:
+    """Directory for the on-disk config cache, or None when disabled.
+
+    Controlled by ``INQUISITOR_CONFIG_CACHE=0`` (disable) and
+    ``INQUISITOR_CACHE_DIR`` (location, defaults to ``$XDG_CACHE_HOME/inquisitornet``).
+    """
+    if os.getenv("INQUISITOR_CONFIG_CACHE", "1") == "0":
+        return None
+    root = os.getenv("INQUISITOR_CACHE_DIR")
+    if root:
+        return Path(root)
+    xdg = os.getenv("XDG_CACHE_HOME")
+    return (Path(xdg) if xdg else Path.home() / ".cache") / "inquisitornet"
+
+
+def _parse_yaml(raw: bytes):
+    import yaml  # deferred: skipped entirely on cache hits
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(raw, Loader=loader)
+
+
+def cached_load(path: str | Path, kind: str, build: Callable[[bytes], Any]):
+    """Return ``build(raw)`` for the file at ``path``, memoised by content hash.
+
+    Results are kept in-process (keyed by path, mtime and size) and pickled to
+    :func:`cache_dir` keyed by the file's SHA-256, ``kind``, the cache format
+    and the running Python version, so a cron-launched CLI can skip YAML
+    parsing and rule validation when the file has not changed.
+
+    Args:
+        path (str | Path): Config file to load.
+        kind (str): Namespace for the built object (e.g. ``"yaml"``, ``"gate_rules"``).
+        build (Callable[[bytes], Any]): Turns raw file bytes into the cached object.
+
+    Returns:
+        Any: The built object.
+    """
     p = Path(path)
-    with p.open('r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    st = p.stat()
+    memo_key = (str(p.resolve()), kind, st.st_mtime_ns, st.st_size)
+    if memo_key in _memo:
+        return pickle.loads(_memo[memo_key])
+
+    raw = p.read_bytes()
+    target = None
+    root = cache_dir()
+    if root is not None:
+        h = hashlib.sha256()
+        h.update(f"{kind}\0{CACHE_FORMAT}\0{sys.version}\0".encode())
+        h.update(raw)
+        target = root / f"{kind}-{h.hexdigest()}.pickle"
+        try:
+            payload = target.read_bytes()
+            value = pickle.loads(payload)
+            _memo[memo_key] = payload
+            return value
+        except Exception:
+            # Missing, corrupt or incompatible entry; rebuild and overwrite below.
+            pass
+
+    value = build(raw)
+    payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    if target is not None:
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(payload)
+            os.replace(tmp, target)
+        except OSError:
+            pass
+    _memo[memo_key] = payload
+    return value
+
+
+def load_yaml(path: str|Path):
+    return cached_load(path, "yaml", _parse_yaml)
 
 class Settings:
     def __init__(self, base_dir: str|Path):
@@ -1,9 +1,20 @@
 from __future__ import annotations
 import re, json
-from typing import List, Dict, Any
+from dataclasses import dataclass, field
+from typing import Iterable, List, Dict, Any, Optional, Tuple
 
+from inquisitor.ingestion.keywords import KeywordAutomaton
 from inquisitor.ingestion.llm_stub import LLMReasoningStub
 
+CHUNK_SIZE = 1000
+EXCULPATORY_PENALTY = 0.2
+
+# Kept out of the prefilter: references to groups (numbering changes once
+# patterns are joined), inline flags, and escapes that can spell an upper-case letter.
+_UNFUSABLE = re.compile(r"\\[1-9xuUN0]|\(\?P=|\(\?\(|\(\?-?[aiLmsux]")
+_LITERAL = re.compile(r"(?:[^\\.^$*+?{}\[\]()|]|\\[^A-Za-z0-9])+")
+_WHOLE_WORDS = re.compile(r"\\b(?:\(\?:(.*)\)|(.*))\\b", re.S)
+
 def compile_rules(rules: List[Dict[str, Any]]):
     """Compile detection rules into regex patterns.
 
@@ -24,8 +35,208 @@ def compile_rules(rules: List[Dict[str, Any]]):
         })
     return out
 
-def run_detector_to_db(settings, conn):
-    rules = compile_rules(settings.detector.get('rules', []))
+def _folded(pattern: str) -> Optional[str]:
+    """Body of a ``(?i)`` pattern that matches lower-cased ASCII text the same way without the flag.
+
+    None when the pattern is case-sensitive, spells an upper-case letter, or
+    uses a construct that cannot be joined with other patterns.
+    """
+    if not pattern.startswith("(?i)") or not pattern.isascii():
+        return None
+    body = pattern[4:]
+    if _UNFUSABLE.search(body) or re.search(r"[A-Z]", re.sub(r"\\.", "", body)):
+        return None
+    return body
+
+def _ascii_form(pattern: re.Pattern) -> Tuple[re.Pattern, bool]:
+    """``(pattern, run_on_lowered_text)`` to use for ASCII text."""
+    body = _folded(pattern.pattern)
+    if body is None:
+        return pattern, False
+    return re.compile(body), True
+
+def _literal_alternatives(pattern: str) -> Optional[Tuple[List[str], bool]]:
+    """Keywords of a ``(?i)word|other phrase`` rule, or None for anything regex-shaped.
+
+    Only case-insensitive ASCII literals qualify: for ASCII text those match
+    exactly when the lower-cased keyword is a substring of the lower-cased text.
+    A whole-word list, ``(?i)\\bword\\b`` or ``(?i)\\b(?:word|other)\\b``, also
+    qualifies and is returned with ``True``.
+    """
+    if not pattern.startswith("(?i)") or not pattern.isascii():
+        return None
+    body = pattern[4:]
+    whole = _WHOLE_WORDS.fullmatch(body)
+    if whole is not None:
+        body = whole.group(1) if whole.group(1) is not None else whole.group(2)
+    alternatives = re.split(r"(?<!\\)\|", body)
+    if whole is not None and whole.group(2) is not None and len(alternatives) > 1:
+        return None  # \ba|b\b binds the boundaries to the outer alternatives only
+    if not all(_LITERAL.fullmatch(a) for a in alternatives):
+        return None
+    return [re.sub(r"\\(.)", r"\1", a).lower() for a in alternatives], whole is not None
+
+@dataclass
+class Verdict:
+    score: float                                      # clamped to [0, 1]
+    matched: List[str] = field(default_factory=list)  # rule ids, in rule order
+    exculpatory: List[str] = field(default_factory=list)
+
+class DetectorEngine:
+    """Compiled detector rules with a fused matching path.
+
+    Scores are identical to evaluating every rule's pattern (and every
+    exculpatory pattern) with ``re.search`` in rule order, but:
+
+    * when every pattern is case-insensitive, one alternation of all of them
+      is run over the lower-cased text first (without ``(?i)`` the regex
+      engine can skip ahead on literal prefixes), and ASCII text none of
+      them can match is scored 0 without running the individual rules;
+    * on ASCII text each case-insensitive pattern is likewise run without
+      the flag over the lower-cased text;
+    * rules that are plain case-insensitive keyword lists are answered for
+      ASCII text by one :class:`KeywordAutomaton` pass shared by all of them
+      (one more for whole-word lists), and when every rule is one, their ids
+      and weights are read straight off the automaton hits.
+
+    Args:
+        rules (List[Dict[str, Any]]): Output of :func:`compile_rules`.
+    """
+
+    def __init__(self, rules: List[Dict[str, Any]]):
+        self.rules = rules
+        keyword_rules, whole_word = {}, set()
+        for index, rule in enumerate(rules):
+            literal = _literal_alternatives(rule['pattern'].pattern)
+            if literal is not None:
+                keyword_rules[index], whole = literal
+                if whole:
+                    whole_word.add(index)
+        self._keyword_rules = keyword_rules
+        self._automata = [
+            KeywordAutomaton({i: w for i, w in keyword_rules.items() if (i in whole_word) == whole}, word_boundary=whole)
+            for whole in (False, True)
+            if any((i in whole_word) == whole for i in keyword_rules)
+        ]
+        sources = [r['pattern'].pattern for r in rules] + [ex.pattern for r in rules for ex in r['exculpatory']]
+        bodies = [_folded(src) for src in sources]
+        # Per rule, for ASCII text: (pattern, on_lowered, [(exculpatory, on_lowered)]),
+        # using the folded form of each pattern wherever one exists.
+        self._ascii_patterns = [
+            (*_ascii_form(rule['pattern']), [_ascii_form(ex) for ex in rule['exculpatory']])
+            for rule in rules
+        ]
+        self._prefilter = None
+        # When the automaton answers every rule, it already is the prefilter.
+        self._keywords_only = len(keyword_rules) == len(sources)
+        if bodies and None not in bodies and not self._keywords_only:
+            try:
+                self._prefilter = re.compile("|".join(f"(?:{body})" for body in bodies))
+            except re.error:
+                pass  # e.g. a group name used by two rules; every rule is simply run
+
+    @classmethod
+    def from_settings(cls, settings) -> "DetectorEngine":
+        return cls(compile_rules(settings.detector.get('rules', [])))
+
+    def evaluate(self, text: str) -> Verdict:
+        text = text or ''
+        if not text.isascii():
+            return self._evaluate_rules(text)
+        lowered = text.lower()
+        if self._prefilter is not None and not self._prefilter.search(lowered):
+            return Verdict(0.0)
+        keyword_hits = {index for automaton in self._automata for index in automaton.matched(lowered)}
+        if self._keywords_only:
+            # No other patterns to run (and no exculpatory ones): the hits are the verdict
+            hits = sorted(keyword_hits)
+            score = sum(self.rules[i]['weight'] for i in hits)
+            return Verdict(max(0.0, min(1.0, score)), [self.rules[i]['id'] for i in hits])
+        score = 0.0
+        verdict = Verdict(0.0)
+        for index, (rule, (pattern, fold, exculpatory)) in enumerate(zip(self.rules, self._ascii_patterns)):
+            if index in self._keyword_rules:
+                hit = index in keyword_hits
+            else:
+                hit = pattern.search(lowered if fold else text) is not None
+            if hit:
+                verdict.matched.append(rule['id'])
+                score += rule['weight']
+            for ex, fold_ex in exculpatory:
+                if ex.search(lowered if fold_ex else text):
+                    verdict.exculpatory.append(rule['id'] + ":ex")
+                    score -= EXCULPATORY_PENALTY
+        verdict.score = max(0.0, min(1.0, score))
+        return verdict
+
+    def _evaluate_rules(self, text: str) -> Verdict:
+        """Every rule's own patterns, as compiled; used for non-ASCII text."""
+        score = 0.0
+        verdict = Verdict(0.0)
+        for rule in self.rules:
+            if rule['pattern'].search(text):
+                verdict.matched.append(rule['id'])
+                score += rule['weight']
+            for ex in rule['exculpatory']:
+                if ex.search(text):
+                    verdict.exculpatory.append(rule['id'] + ":ex")
+                    score -= EXCULPATORY_PENALTY  # small deduction for benign context
+        verdict.score = max(0.0, min(1.0, score))  # clamp
+        return verdict
+
+MarkRow = Tuple[str, Optional[str], Optional[str], Optional[str], str, str, float]
+
+def judge_items(
+    engine: DetectorEngine,
+    items: Iterable[Tuple[str, Optional[str], Optional[str], Optional[str]]],
+    th_mark: float,
+    th_acquit: float,
+    reasoning_stub: Optional[LLMReasoningStub] = None,
+) -> Tuple[List[MarkRow], List[MarkRow]]:
+    """Score ``(item_id, subreddit, body, post_meta_json)`` items into mark and acquittal rows.
+
+    Items between the thresholds are held back (neither list).
+    """
+    reasoning_stub = reasoning_stub or LLMReasoningStub()
+    marks, acquittals = [], []
+    for item_id, subreddit, body, post_meta_json in items:
+        verdict = engine.evaluate(body or '')
+        if verdict.score >= th_mark:
+            reasoning = reasoning_stub.explain_mark(verdict.matched, verdict.score, th_mark)
+            marks.append((item_id, subreddit, body, post_meta_json, reasoning.reasoning,
+                          json.dumps(verdict.matched), reasoning.confidence))
+        elif verdict.score <= th_acquit:
+            reasoning = reasoning_stub.explain_acquittal(verdict.matched, verdict.exculpatory, verdict.score, th_acquit)
+            acquittals.append((item_id, subreddit, body, post_meta_json, reasoning.reasoning,
+                               json.dumps(verdict.matched + verdict.exculpatory), reasoning.confidence))
+    return marks, acquittals
+
+def write_verdicts(cur, marks: List[MarkRow], acquittals: List[MarkRow]) -> None:
+    """Insert judged rows with one ``executemany`` per table (no commit)."""
+    if marks:
+        cur.executemany('''INSERT INTO detector_marks (item_id, subreddit, comment_text, post_meta_json, reasoning_for_mark, rules_triggered, degree_of_confidence)
+                           VALUES (?,?,?,?,?,?,?)''', marks)
+    if acquittals:
+        cur.executemany('''INSERT INTO detector_acquittals (item_id, subreddit, comment_text, post_meta_json, reasoning_for_acquittal, rules_triggered, degree_of_confidence)
+                           VALUES (?,?,?,?,?,?,?)''', acquittals)
+
+def run_detector_to_db(settings, conn, rules=None, *, chunk: int = CHUNK_SIZE):
+    """Judge unprocessed ``scrape_hits`` rows into marks and acquittals.
+
+    Args:
+        settings: Project settings (rules and thresholds).
+        conn (sqlite3.Connection): Open database connection.
+        rules (optional): A :class:`DetectorEngine` or compiled rules to use
+            instead of building them from ``settings``.
+        chunk (int, optional): Rows read and written per batch.
+
+    Returns:
+        Tuple[int, int]: Number of items marked and acquitted.
+    """
+    if isinstance(rules, DetectorEngine):
+        engine = rules
+    else:
+        engine = DetectorEngine(rules if rules is not None else compile_rules(settings.detector.get('rules', [])))
     th_mark = float(settings.detector.get('thresholds', {}).get('mark', 0.65))
     th_acquit = float(settings.detector.get('thresholds', {}).get('acquit', 0.35))
     reasoning_stub = LLMReasoningStub()
@@ -34,38 +245,21 @@ def run_detector_to_db(settings, conn):
     processed = {row[0] for row in cur.fetchall()}
     cur.execute("SELECT item_id FROM detector_acquittals")
     processed.update(row[0] for row in cur.fetchall())
-    cur.execute("SELECT item_id, subreddit, body, post_meta_json FROM scrape_hits")
-    rows = cur.fetchall()
     n_mark = n_acquit = 0
-    for item_id, subreddit, body, post_meta_json in rows:
-        if item_id in processed:
-            continue
-        matched_ids = []
-        exculp_ids = []
-        score = 0.0
-        for r in rules:
-            if r['pattern'].search(body or ''):
-                matched_ids.append(r['id'])
-                score += r['weight']
-            for ex in r['exculpatory']:
-                if ex.search(body or ''):
-                    exculp_ids.append(r['id'] + ":ex")
-                    score -= 0.2  # small deduction for benign context
-        score = max(0.0, min(1.0, score))  # clamp
-        if score >= th_mark:
-            reasoning = reasoning_stub.explain_mark(matched_ids, score, th_mark)
-            cur.execute('''INSERT INTO detector_marks (item_id, subreddit, comment_text, post_meta_json, reasoning_for_mark, rules_triggered, degree_of_confidence)
-                           VALUES (?,?,?,?,?,?,?)''',
-                        (item_id, subreddit, body, post_meta_json, reasoning.reasoning, json.dumps(matched_ids), reasoning.confidence))
-            n_mark += 1
-        elif score <= th_acquit:
-            reasoning = reasoning_stub.explain_acquittal(matched_ids, exculp_ids, score, th_acquit)
-            cur.execute('''INSERT INTO detector_acquittals (item_id, subreddit, comment_text, post_meta_json, reasoning_for_acquittal, rules_triggered, degree_of_confidence)
-                           VALUES (?,?,?,?,?,?,?)''',
-                        (item_id, subreddit, body, post_meta_json, reasoning.reasoning, json.dumps(matched_ids + exculp_ids), reasoning.confidence))
-            n_acquit += 1
-        else:
-            # hold for later, neither marked nor acquitted (still stored only in scrape_hits)
-            pass
+    last_rowid = 0
+    while True:
+        rows = cur.execute(
+            "SELECT rowid, item_id, subreddit, body, post_meta_json FROM scrape_hits WHERE rowid > ? ORDER BY rowid LIMIT ?",
+            (last_rowid, chunk),
+        ).fetchall()
+        if not rows:
+            break
+        last_rowid = rows[-1][0]
+        marks, acquittals = judge_items(
+            engine, (row[1:] for row in rows if row[1] not in processed), th_mark, th_acquit, reasoning_stub
+        )
+        write_verdicts(cur, marks, acquittals)
+        n_mark += len(marks)
+        n_acquit += len(acquittals)
     conn.commit()
     return n_mark, n_acquit
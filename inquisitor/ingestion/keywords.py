@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, List, Mapping
+
+
+_BOUNDARY = re.compile(r"\b")
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Regex for a set of literals, factored as a trie so the engine never re-tests a shared prefix.
+
+    At every node the longer continuations are tried before stopping, so the
+    match at a position is the longest keyword starting there.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return f"(?:{body})?" if len(branches) == 1 else body + "?"
+        return body
+
+    return build(trie)
+
+
+class KeywordAutomaton:
+    """Multi-keyword matcher reporting every category with a hit in one pass.
+
+    The keywords are compiled into a single trie-shaped regex and
+    ``finditer`` walks the text once, the regex engine skipping in C to the
+    next position where some keyword can start.  Each match is the longest
+    keyword starting there; keywords that are prefixes of it also match and
+    are added from a precomputed table.  A keyword that starts inside a
+    match (an overlap) can only start at an offset where its beginning
+    agrees with the rest of the matched keyword, and only those offsets are
+    re-tested.  Every text position is thus examined a bounded number of
+    times, so a scan is linear in the text length.
+
+    Text is lower-cased before matching and keywords are used verbatim, so
+    by default the result equals running ``keyword in text.lower()`` for
+    each keyword.  With ``word_boundary=True`` a keyword only counts when it
+    starts and ends on a word boundary (``\\b``), as in ``\\bkeyword\\b``.
+
+    Args:
+        categories (Mapping[str, Iterable[str]]): Category name to keywords,
+            in the order categories are reported.
+        word_boundary (bool, optional): Require whole-word matches.
+    """
+
+    def __init__(self, categories: Mapping[str, Iterable[str]], *, word_boundary: bool = False):
+        self.word_boundary = word_boundary
+        self.categories = list(categories)
+        self.keywords: List[str] = []
+        # keyword -> category indexes, one entry per occurrence in the config
+        self._owners: Dict[str, List[int]] = {}
+        for index, name in enumerate(self.categories):
+            for word in categories[name]:
+                if word not in self._owners:
+                    self.keywords.append(word)
+                    self._owners[word] = []
+                self._owners[word].append(index)
+        words = [w for w in self.keywords if w]
+        # A prefix ends inside the longer keyword, so whether it ends on a word
+        # boundary there depends only on the keyword's own characters.
+        self._prefixes = {
+            w: [p for p in words if p != w and w.startswith(p) and (not word_boundary or _BOUNDARY.match(w, len(p)))]
+            for w in words
+        }
+        # Offsets inside each keyword where an overlapping keyword could start
+        self._overlaps = {
+            w: [k for k in range(1, len(w)) if any(u.startswith(w[k:]) or w[k:].startswith(u) for u in words)]
+            for w in words
+        }
+        self._pattern = re.compile(_trie_pattern(words) + (r"\b" if word_boundary else "")) if words else None
+        # An empty keyword is "in" every string; whole-word matching ignores it.
+        self._always = [w for w in self.keywords if not w] if not word_boundary else []
+
+    def find(self, text: str) -> set:
+        """Distinct keywords present in ``text``."""
+        found = set(self._always)
+        if self._pattern is None:
+            return found
+        lowered = text.lower()
+        match_at = self._pattern.match
+        for match in self._pattern.finditer(lowered):
+            start, word = match.start(), match.group()
+            self._add(found, lowered, start, word)
+            for offset in self._overlaps[word]:
+                inner = match_at(lowered, start + offset)
+                if inner is not None:
+                    self._add(found, lowered, start + offset, inner.group())
+            if len(found) == len(self._owners):
+                break
+        return found
+
+    def _add(self, found: set, lowered: str, start: int, word: str) -> None:
+        # The pattern checks the end boundary; the start one is checked here
+        if not self.word_boundary or _BOUNDARY.match(lowered, start):
+            found.add(word)
+            found.update(self._prefixes[word])
+
+    def matched(self, text: str) -> List:
+        """Categories with at least one keyword in ``text``, in definition order."""
+        hits = {i for w in self.find(text) for i in self._owners[w]}
+        return [self.categories[i] for i in sorted(hits)]
@@ -3,7 +3,6 @@ from pathlib import Path
 import json, re, time, os
 from typing import Dict, Any, List, Iterable, Optional
 
-from core.reddit_client import RedditClient
 from inquisitor.policy.gate import load_rules, evaluate_text
 
 def regex_list(patterns: List[str]) -> List[re.Pattern]:
@@ -111,6 +110,7 @@ def run_scraper_to_db(settings, conn):
     elif mode == 'offline':
         stream = iter_offline_db(conn, offline_table, read_limit)
     elif mode == 'api':
+        from core.reddit_client import RedditClient  # deferred: pulls in praw
         rcfg = {
             "client_id": os.getenv("REDDIT_CLIENT_ID"),
             "client_secret": os.getenv("REDDIT_CLIENT_SECRET"),
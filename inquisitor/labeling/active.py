@@ -0,0 +1,233 @@
+# inquisitor/labeling/active.py
+"""Active-learning ordering for ``label_queue``.
+
+Every unlabeled detector verdict is scored from three signals:
+
+* ``uncertainty`` - how close the detector score sits to ``thresholds.mark``
+  or ``thresholds.acquit``;
+* ``coverage`` - posterior variance of the per-rule precision (marks) or
+  acquittal accuracy (acquittals) for the least-covered rule the item hit,
+  so rules with few or contradictory labels are sampled first;
+* ``conflict`` - a rule matched and its exculpatory pattern fired too.
+
+Passes are incremental: new detector rows and new labels are read past
+rowid watermarks kept in ``label_queue_state``, and only queued items whose
+rules changed label coverage are rescored.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from inquisitor.ingestion.db import MIGRATIONS_DIR, column_exists, migrate, table_exists
+from inquisitor.labeling.queue import (
+    CHUNK_SIZE,
+    _SOURCES,
+    _iter_rows,
+    _labeled_ids,
+    _score_band,
+    ensure_queue_table,
+    load_thresholds,
+    threshold_distance,
+)
+
+# Threshold distance at which the uncertainty signal reaches zero.
+UNCERTAINTY_SPAN = 0.35
+
+# Variance of Beta(1, 1); normalises the coverage signal to [0, 1].
+_MAX_BETA_VAR = 1.0 / 12.0
+
+_SLOT = {"TP": 0, "FP": 1, "TN": 2, "FN": 3}
+
+RuleCounts = Tuple[int, int, int, int]
+
+
+@dataclass
+class ActiveWeights:
+    # Coverage drives per-rule precision estimates; the other two mostly break ties.
+    uncertainty: float = 0.1
+    coverage: float = 1.0
+    conflict: float = 0.1
+
+
+def ensure_active_tables(conn: sqlite3.Connection) -> None:
+    ensure_queue_table(conn)
+    if not column_exists(conn, "label_queue", "uncertainty"):
+        migrate(conn, MIGRATIONS_DIR / "011_active_learning.sql")
+
+
+def split_rules(rules_json: Optional[str]) -> Tuple[List[str], List[str]]:
+    """Split a ``rules_triggered`` JSON array into matched and exculpated rule ids."""
+    try:
+        ids = json.loads(rules_json) if rules_json else []
+    except ValueError:
+        ids = []
+    matched = [r for r in ids if not r.endswith(":ex")]
+    exculpated = [r[:-3] for r in ids if r.endswith(":ex")]
+    return matched, exculpated
+
+
+def uncertainty_score(score: float, thresholds: Tuple[float, float]) -> float:
+    return max(0.0, 1.0 - threshold_distance(score, thresholds) / UNCERTAINTY_SPAN)
+
+
+def conflict_score(matched: Sequence[str], exculpated: Sequence[str]) -> float:
+    if set(matched) & set(exculpated):
+        return 1.0
+    return 0.5 if matched and exculpated else 0.0
+
+
+def coverage_score(verdict: str, matched: Iterable[str], stats: Dict[str, RuleCounts]) -> float:
+    """Largest normalised Beta posterior variance among the item's rules."""
+    best = 0.0
+    for rule_id in matched:
+        tp, fp, tn, fn = stats.get(rule_id, (0, 0, 0, 0))
+        a, b = (tp + 1, fp + 1) if verdict == "mark" else (tn + 1, fn + 1)
+        var = a * b / ((a + b) ** 2 * (a + b + 1))
+        best = max(best, var / _MAX_BETA_VAR)
+    return best
+
+
+def rule_label_stats(conn: sqlite3.Connection) -> Dict[str, RuleCounts]:
+    """TP/FP/TN/FN counts per matched rule over all labels, in one grouped scan."""
+    if not (table_exists(conn, "labels") and table_exists(conn, "detector_marks")):
+        return {}
+    cur = conn.execute("""
+        SELECT l.label, d.rules_triggered, COUNT(*)
+        FROM labels l
+        JOIN (
+            SELECT item_id, rules_triggered FROM detector_marks
+            UNION ALL
+            SELECT item_id, rules_triggered FROM detector_acquittals
+        ) d ON d.item_id = l.item_id
+        WHERE l.label IN ('TP','FP','TN','FN')
+        GROUP BY l.label, d.rules_triggered
+    """)
+    stats: Dict[str, List[int]] = {}
+    for label, rules_json, n in cur.fetchall():
+        matched, _ = split_rules(rules_json)
+        for rule_id in set(matched):
+            stats.setdefault(rule_id, [0, 0, 0, 0])[_SLOT[label]] += n
+    return {k: tuple(v) for k, v in stats.items()}
+
+
+def _load_state(conn: sqlite3.Connection) -> Dict[str, int]:
+    return dict(conn.execute("SELECT name, last_id FROM label_queue_state").fetchall())
+
+
+def _max_rowid(conn: sqlite3.Connection, table: str) -> int:
+    if not table_exists(conn, table):
+        return 0
+    return conn.execute(f"SELECT COALESCE(MAX(rowid), 0) FROM {table}").fetchone()[0]
+
+
+def rank_active_queue(
+    conn: sqlite3.Connection,
+    *,
+    weights: Optional[ActiveWeights] = None,
+    thresholds: Optional[Tuple[float, float]] = None,
+    rebuild: bool = False,
+    chunk: int = CHUNK_SIZE,
+) -> int:
+    """Bring ``label_queue`` up to date with active-learning priorities.
+
+    The first pass (or ``rebuild=True``, or a queue last built by
+    :func:`~inquisitor.labeling.queue.build_label_queue`) enqueues every
+    unlabeled verdict.  Later passes only add detector rows and drop labeled
+    items past the stored watermarks, then rescore queued items whose rules
+    gained or changed labels.
+
+    Args:
+        conn (sqlite3.Connection): Open database connection.
+        weights (ActiveWeights, optional): Signal weights. Defaults to :class:`ActiveWeights`.
+        thresholds (Tuple[float, float], optional): ``(mark, acquit)``; read from config when omitted.
+        rebuild (bool, optional): Discard the queue and watermarks first. Defaults to False.
+        chunk (int, optional): Rows fetched per rowid range.
+
+    Returns:
+        int: Number of queue rows inserted or rescored.
+    """
+    weights = weights or ActiveWeights()
+    thresholds = thresholds or load_thresholds()
+    ensure_active_tables(conn)
+    state = {} if rebuild else _load_state(conn)
+    stats = rule_label_stats(conn)
+    previous = {} if not state else {
+        row[0]: tuple(row[1:]) for row in conn.execute("SELECT rule_id, tp, fp, tn, fn FROM label_rule_stats")
+    }
+    changed = {r for r in stats.keys() | previous.keys() if stats.get(r) != previous.get(r)}
+    # Taken before scanning: rows landing mid-pass are picked up again next time
+    # and deduplicated by the upsert below, never skipped.
+    watermarks = [(t, _max_rowid(conn, t)) for t in ("detector_marks", "detector_acquittals", "labels")]
+
+    def priority(verdict, matched, uncertainty, conflict):
+        return (weights.uncertainty * uncertainty
+                + weights.coverage * coverage_score(verdict, matched, stats)
+                + weights.conflict * conflict)
+
+    labels_last = state.get("labels", 0)
+    new_labeled: List[str] = []
+    if state and table_exists(conn, "labels"):
+        new_labeled = [row[0] for row in conn.execute("SELECT item_id FROM labels WHERE rowid > ?", (labels_last,))]
+    labeled = _labeled_ids(conn)
+
+    inserts = []
+    for table, verdict, to_score in _SOURCES:
+        if not table_exists(conn, table):
+            continue
+        for _, item_id, subreddit, conf, rules in _iter_rows(conn, table, chunk, after=state.get(table, 0)):
+            if item_id in labeled:
+                continue
+            score = to_score(float(conf or 0.0))
+            matched, exculpated = split_rules(rules)
+            u = uncertainty_score(score, thresholds)
+            c = conflict_score(matched, exculpated)
+            stratum = f"{verdict}|{subreddit or ''}|{_score_band(score)}"
+            inserts.append((item_id, verdict, subreddit, score, rules, stratum,
+                            priority(verdict, matched, u, c), u, c))
+
+    rescored = []
+    if state and changed:
+        marks = ",".join("?" * len(changed))
+        cur = conn.execute(
+            f"""
+            SELECT item_id, verdict, rules_triggered, uncertainty, conflict FROM label_queue q
+            WHERE EXISTS (SELECT 1 FROM json_each(q.rules_triggered) j WHERE j.value IN ({marks}))
+            """,
+            sorted(changed),
+        )
+        dropped = set(new_labeled)
+        for item_id, verdict, rules, u, c in cur.fetchall():
+            if item_id in dropped:
+                continue
+            matched, _ = split_rules(rules)
+            rescored.append((priority(verdict, matched, u or 0.0, c or 0.0), item_id))
+
+    with conn:
+        if not state:
+            conn.execute("DELETE FROM label_queue")
+        conn.executemany("DELETE FROM label_queue WHERE item_id = ?", ((i,) for i in new_labeled))
+        conn.executemany(
+            """
+            INSERT INTO label_queue
+              (item_id, verdict, subreddit, score, rules_triggered, stratum, priority, uncertainty, conflict)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(item_id) DO UPDATE SET
+              priority = excluded.priority, uncertainty = excluded.uncertainty, conflict = excluded.conflict
+            """,
+            inserts,
+        )
+        conn.executemany("UPDATE label_queue SET priority = ? WHERE item_id = ?", rescored)
+        conn.execute("DELETE FROM label_rule_stats")
+        conn.executemany(
+            "INSERT INTO label_rule_stats (rule_id, tp, fp, tn, fn) VALUES (?, ?, ?, ?, ?)",
+            [(k, *v) for k, v in stats.items()],
+        )
+        conn.executemany(
+            "INSERT INTO label_queue_state (name, last_id) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET last_id = excluded.last_id",
+            watermarks,
+        )
+    return len(inserts) + len(rescored)
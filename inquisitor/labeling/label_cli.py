@@ -1,8 +1,16 @@
 # inquisitor/labeling/label_cli.py
-import argparse, sqlite3, sys
+import argparse, csv, json, sqlite3, sys
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from inquisitor.labeling.active import rank_active_queue
+from inquisitor.labeling.queue import build_label_queue, next_items
+from inquisitor.ingestion.db import table_exists
+from inquisitor.metrics.metrics_job import compute_metrics, ensure_label_rollups, write_metrics_to_db
+
 DB_DEFAULT = "inquisitor_net_phase1.db"
+VALID_LABELS = ("TP", "FP", "TN", "FN")  # mirrors the CHECK constraint in 002_phase2.sql
+_LOOKUP_CHUNK = 500
 
 SCHEMA = {
     "labels": "CREATE TABLE IF NOT EXISTS labels(item_id TEXT PRIMARY KEY, label TEXT, notes TEXT, created_at DATETIME DEFAULT CURRENT_TIMESTAMP)"
@@ -11,33 +19,150 @@ SCHEMA = {
 def ensure_schema(conn):
     for ddl in SCHEMA.values():
         conn.execute(ddl)
+    ensure_label_rollups(conn)
 
-def sample_items(conn, near_threshold_only=False, limit=20):
-    # Heuristic: sample from detector_marks plus near-threshold in a 'scores' view if available
-    cur = conn.cursor()
-    items = []
-    try:
-        if near_threshold_only:
-            # Attempt to read detector_scores if exists; else fallback
-            cur.execute("""
-                SELECT item_id FROM detector_marks ORDER BY RANDOM() LIMIT ?
-            """, (limit,))
-        else:
-            cur.execute("""
-                SELECT item_id FROM detector_marks
-                UNION
-                SELECT item_id FROM detector_acquittals
-                ORDER BY RANDOM() LIMIT ?
-            """, (limit,))
-        items = [r[0] for r in cur.fetchall()]
-    except sqlite3.OperationalError:
-        cur.execute("SELECT item_id FROM detector_marks ORDER BY RANDOM() LIMIT ?", (limit,))
-        items = [r[0] for r in cur.fetchall()]
+def labels_keyed_by_item(conn) -> bool:
+    """True if labels.item_id is the primary key (SCHEMA above), False for 002_phase2.sql's shape."""
+    return any(row[1] == "item_id" and row[5] for row in conn.execute("PRAGMA table_info(labels)"))
+
+def upsert_label(conn, item_id, label, notes=None, keyed=None):
+    """Store one label; pass ``keyed`` (from :func:`labels_keyed_by_item`) when writing many."""
+    if keyed is None:
+        keyed = labels_keyed_by_item(conn)
+    # Upsert rather than INSERT OR REPLACE so the metrics rollup triggers see the change.
+    if keyed:
+        conn.execute(
+            "INSERT INTO labels(item_id, label, notes) VALUES (?,?,?) "
+            "ON CONFLICT(item_id) DO UPDATE SET label = excluded.label, notes = excluded.notes",
+            (item_id, label, notes),
+        )
+    else:
+        conn.execute("INSERT INTO labels(item_id, label, notes) VALUES (?,?,?)", (item_id, label, notes))
+
+def sample_items(conn, near_threshold_only=False, limit=20, rebuild=False, per_stratum=5, active=False):
+    """Serve items from the persisted label_queue, building it on first use.
+
+    ``near_threshold_only`` weights the (re)build towards scores near the
+    detector thresholds; pass ``rebuild=True`` to resample.  With ``active``
+    the queue is ranked by :func:`rank_active_queue`, refreshed incrementally
+    on every call.
+    """
+    if active:
+        rank_active_queue(conn, rebuild=rebuild)
+        return next_items(conn, limit)
+    items = [] if rebuild else next_items(conn, limit)
+    if not items:
+        build_label_queue(conn, per_stratum=per_stratum, near_threshold=near_threshold_only)
+        items = next_items(conn, limit)
     return items
 
+@dataclass
+class ImportReport:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    kept: int = 0
+    invalid: list = field(default_factory=list)    # (line, reason)
+    conflicts: list = field(default_factory=list)  # (item_id, existing label, imported label)
+
+def read_label_file(path):
+    """Parse a CSV (header item_id,label[,notes]) or JSONL label file.
+
+    Returns ``(rows, invalid)``: validated ``(item_id, label, notes)`` tuples
+    and ``(line, reason)`` pairs for rows that were rejected.  When an item
+    appears more than once the last row wins.
+    """
+    path = Path(path)
+    if path.suffix.lower() in (".jsonl", ".ndjson"):
+        with open(path, encoding="utf-8") as fh:
+            records = []
+            for n, line in enumerate(fh, start=1):
+                if line.strip():
+                    try:
+                        records.append((n, json.loads(line)))
+                    except ValueError as exc:
+                        records.append((n, exc))
+    else:
+        with open(path, newline="", encoding="utf-8-sig") as fh:
+            records = [(n, rec) for n, rec in enumerate(csv.DictReader(fh), start=2)]
+    rows, invalid = {}, []
+    for n, rec in records:
+        if not isinstance(rec, dict):
+            invalid.append((n, f"unparseable row: {rec}"))
+            continue
+        item_id = str(rec.get("item_id") or "").strip()
+        label = str(rec.get("label") or "").strip().upper()
+        notes = (rec.get("notes") or "").strip() or None
+        if not item_id:
+            invalid.append((n, "missing item_id"))
+        elif label not in VALID_LABELS:
+            invalid.append((n, f"label {label!r} not in {'/'.join(VALID_LABELS)}"))
+        else:
+            rows[item_id] = (item_id, label, notes)
+    return list(rows.values()), invalid
+
+def _existing_labels(conn, item_ids):
+    out = {}
+    for i in range(0, len(item_ids), _LOOKUP_CHUNK):
+        chunk = item_ids[i:i + _LOOKUP_CHUNK]
+        marks = ",".join("?" * len(chunk))
+        # Latest row per item when labels is not keyed by item_id.
+        cur = conn.execute(
+            f"SELECT item_id, label, notes FROM labels WHERE item_id IN ({marks}) ORDER BY rowid", chunk)
+        out.update((item_id, (label, notes)) for item_id, label, notes in cur)
+    return out
+
+def import_labels(conn, rows, keep_existing=False):
+    """Upsert validated label rows with executemany in one transaction.
+
+    Works with both ``labels`` shapes: an ``ON CONFLICT`` upsert when
+    ``item_id`` is the primary key, otherwise UPDATE of the existing rows plus
+    INSERT of new ones.  An existing label that differs from the imported one
+    is reported as a conflict and overwritten unless ``keep_existing``; empty
+    imported notes keep the stored ones.
+    The metrics_label_daily triggers see every change.
+    """
+    ensure_schema(conn)
+    report = ImportReport()
+    existing = _existing_labels(conn, [r[0] for r in rows])
+    inserts, updates = [], []
+    for item_id, label, notes in rows:
+        if item_id not in existing:
+            inserts.append((item_id, label, notes))
+            continue
+        old_label, old_notes = existing[item_id]
+        notes = old_notes if notes is None else notes
+        if old_label != label:
+            report.conflicts.append((item_id, old_label, label))
+            if keep_existing:
+                report.kept += 1
+                continue
+        elif old_notes == notes:
+            report.unchanged += 1
+            continue
+        updates.append((label, notes, item_id))
+    with conn:
+        if labels_keyed_by_item(conn):
+            conn.executemany(
+                "INSERT INTO labels(item_id, label, notes) VALUES (?,?,?) "
+                "ON CONFLICT(item_id) DO UPDATE SET label = excluded.label, notes = excluded.notes",
+                inserts + [(item_id, label, notes) for label, notes, item_id in updates],
+            )
+        else:
+            conn.executemany("UPDATE labels SET label = ?, notes = ? WHERE item_id = ?", updates)
+            conn.executemany("INSERT INTO labels(item_id, label, notes) VALUES (?,?,?)", inserts)
+    report.inserted, report.updated = len(inserts), len(updates)
+    return report
+
+def refresh_daily_metrics(conn, days=7):
+    """Recompute today's metrics_detector_daily row from the label rollups."""
+    if table_exists(conn, "metrics_detector_daily"):
+        write_metrics_to_db(conn, compute_metrics(conn, days))
+
 def label_loop(conn, items):
     print("Label items as TP/FP/TN/FN. Enter to skip. Ctrl+C to exit.")
     ensure_schema(conn)
+    keyed = labels_keyed_by_item(conn)
     for it in items:
         print(f"Item: {it}")
         label = input("Label [TP/FP/TN/FN/skip]: ").strip().upper()
@@ -47,20 +172,37 @@ def label_loop(conn, items):
         if label not in {"TP","FP","TN","FN"}:
             print("Invalid label; skipping.")
             continue
-        conn.execute(
-            "INSERT OR REPLACE INTO labels(item_id, label, notes) VALUES (?,?,?)",
-            (it, label, notes or None),
-        )
+        upsert_label(conn, it, label, notes or None, keyed=keyed)
 
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--db", default=DB_DEFAULT)
     ap.add_argument("--limit", type=int, default=20)
-    ap.add_argument("--near-threshold", action="store_true")
-    ap.add_argument("--notes", default=None, help="Notes to apply in non-interactive mode")
+    ap.add_argument("--near-threshold", action="store_true", help="Weight the queue towards scores near the thresholds")
+    ap.add_argument("--rebuild-queue", action="store_true", help="Resample label_queue before serving")
+    ap.add_argument("--per-stratum", type=int, default=5, help="Queue items per verdict/subreddit/score band")
+    ap.add_argument("--active", action="store_true", help="Serve the most informative items first (active learning)")
+    ap.add_argument("--notes", default=None, help="Notes for imported rows that have none")
+    ap.add_argument("--import", dest="import_path", default=None, help="Bulk-import labels from a CSV or JSONL file")
+    ap.add_argument("--keep-existing", action="store_true", help="On import, keep labels that conflict with the file")
     args = ap.parse_args()
+    if args.import_path:
+        rows, invalid = read_label_file(args.import_path)
+        rows = [(item_id, label, notes or args.notes) for item_id, label, notes in rows]
+        with sqlite3.connect(args.db) as conn:
+            report = import_labels(conn, rows, keep_existing=args.keep_existing)
+            refresh_daily_metrics(conn)
+        report.invalid = invalid
+        print(f"Imported {report.inserted} new, {report.updated} updated, {report.unchanged} unchanged; "
+              f"{len(report.conflicts)} conflicts ({report.kept} kept), {len(invalid)} invalid rows")
+        for item_id, old, new in report.conflicts:
+            print(f"conflict {item_id}: {old} -> {new}" + (" (kept)" if args.keep_existing else ""))
+        for line, reason in invalid:
+            print(f"invalid line {line}: {reason}")
+        return
     with sqlite3.connect(args.db) as conn:
-        items = sample_items(conn, near_threshold_only=args.near_threshold, limit=args.limit)
+        items = sample_items(conn, near_threshold_only=args.near_threshold, limit=args.limit,
+                             rebuild=args.rebuild_queue, per_stratum=args.per_stratum, active=args.active)
         if not sys.stdin.isatty():
             print("Non-interactive session; listing items only:")
             for it in items:
@@ -0,0 +1,168 @@
+# inquisitor/labeling/queue.py
+"""Persisted, stratified labeling queue.
+
+The queue is built in one pass over ``detector_marks`` and
+``detector_acquittals`` in rowid order (indexed range scans, no sort), keeping
+a weighted reservoir per stratum (verdict, subreddit, score band).  With
+``near_threshold=True`` the reservoir weights favour items whose score sits
+closest to ``thresholds.mark`` / ``thresholds.acquit``.  The result is
+written to ``label_queue`` so labelers only read an indexed table.
+"""
+from __future__ import annotations
+
+import heapq
+import random
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from inquisitor.ingestion.config import load_yaml
+from inquisitor.ingestion.db import MIGRATIONS_DIR, migrate, table_exists
+
+BASE = Path(__file__).resolve().parents[2]
+
+SCORE_BANDS = 10
+CHUNK_SIZE = 1000
+
+# (table, verdict, confidence -> detector score)
+_SOURCES = (
+    ("detector_marks", "mark", lambda conf: conf),
+    ("detector_acquittals", "acquittal", lambda conf: 1.0 - conf),
+)
+
+
+def ensure_queue_table(conn: sqlite3.Connection) -> None:
+    if not table_exists(conn, "label_queue"):
+        migrate(conn, MIGRATIONS_DIR / "010_label_queue.sql")
+    if table_exists(conn, "labels"):
+        # next_items() probes labels by item_id; 002_phase2.sql has no index for that.
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_labels_item ON labels(item_id)")
+
+
+def load_thresholds(base: str | Path = BASE) -> Tuple[float, float]:
+    cfg = load_yaml(Path(base) / "config" / "detector_rules.yml") or {}
+    th = cfg.get("thresholds", {})
+    return float(th.get("mark", 0.65)), float(th.get("acquit", 0.35))
+
+
+def threshold_distance(score: float, thresholds: Tuple[float, float]) -> float:
+    return min(abs(score - thresholds[0]), abs(score - thresholds[1]))
+
+
+def _score_band(score: float) -> int:
+    return min(max(int(score * SCORE_BANDS), 0), SCORE_BANDS - 1)
+
+
+def _labeled_ids(conn: sqlite3.Connection) -> set:
+    if not table_exists(conn, "labels"):
+        return set()
+    return {row[0] for row in conn.execute("SELECT DISTINCT item_id FROM labels")}
+
+
+def _iter_rows(conn: sqlite3.Connection, table: str, chunk: int, after: int = 0):
+    last_id = after
+    while True:
+        rows = conn.execute(
+            f"""
+            SELECT id, item_id, subreddit, degree_of_confidence, rules_triggered
+            FROM {table} WHERE id > ? ORDER BY id LIMIT ?
+            """,
+            (last_id, chunk),
+        ).fetchall()
+        if not rows:
+            return
+        yield from rows
+        last_id = rows[-1][0]
+
+
+def build_label_queue(
+    conn: sqlite3.Connection,
+    *,
+    per_stratum: int = 5,
+    near_threshold: bool = False,
+    thresholds: Optional[Tuple[float, float]] = None,
+    seed: Optional[int] = None,
+    chunk: int = CHUNK_SIZE,
+) -> int:
+    """Rebuild ``label_queue`` from the detector tables.
+
+    Args:
+        conn (sqlite3.Connection): Open database connection.
+        per_stratum (int, optional): Items kept per (verdict, subreddit, score band). Defaults to 5.
+        near_threshold (bool, optional): Weight sampling towards scores near the thresholds.
+        thresholds (Tuple[float, float], optional): ``(mark, acquit)``; read from config when omitted.
+        seed (int, optional): Seed for reproducible sampling.
+        chunk (int, optional): Rows fetched per rowid range.
+
+    Returns:
+        int: Number of queued items.
+    """
+    thresholds = thresholds or load_thresholds()
+    rng = random.Random(seed)
+    labeled = _labeled_ids(conn)
+    reservoirs: Dict[str, List[tuple]] = {}
+    n_seen = 0
+    for table, verdict, to_score in _SOURCES:
+        if not table_exists(conn, table):
+            continue
+        for _, item_id, subreddit, conf, rules in _iter_rows(conn, table, chunk):
+            if item_id in labeled:
+                continue
+            score = to_score(float(conf or 0.0))
+            dist = threshold_distance(score, thresholds)
+            stratum = f"{verdict}|{subreddit or ''}|{_score_band(score)}"
+            # A-Res weighted reservoir: keep the k largest u ** (1 / w).
+            weight = 1.0 / (0.01 + dist) if near_threshold else 1.0
+            key = rng.random() ** (1.0 / weight)
+            heap = reservoirs.setdefault(stratum, [])
+            entry = (key, n_seen, (item_id, verdict, subreddit, score, rules, stratum, dist))
+            n_seen += 1
+            if len(heap) < per_stratum:
+                heapq.heappush(heap, entry)
+            elif key > heap[0][0]:
+                heapq.heapreplace(heap, entry)
+
+    # Serve strata round-robin; within a round, closest-to-threshold first.
+    rounds: List[List[tuple]] = []
+    for heap in reservoirs.values():
+        for i, (_, _, row) in enumerate(sorted(heap, key=lambda e: e[2][6])):
+            if i == len(rounds):
+                rounds.append([])
+            rounds[i].append(row)
+    rows = []
+    n_rounds = len(rounds)
+    for i, members in enumerate(rounds):
+        for item_id, verdict, subreddit, score, rules, stratum, dist in members:
+            priority = (n_rounds - i) + 1.0 / (1.0 + dist)
+            rows.append((item_id, verdict, subreddit, score, rules, stratum, priority))
+
+    ensure_queue_table(conn)
+    with conn:
+        conn.execute("DELETE FROM label_queue")
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO label_queue (item_id, verdict, subreddit, score, rules_triggered, stratum, priority)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        if table_exists(conn, "label_queue_state"):
+            # The active ranker's watermarks no longer describe this queue.
+            conn.execute("DELETE FROM label_queue_state")
+    return len(rows)
+
+
+def next_items(conn: sqlite3.Connection, limit: int = 20) -> List[str]:
+    """Highest-priority queued items that have not been labeled yet."""
+    if not table_exists(conn, "label_queue"):
+        return []
+    # The labels index used below is created with the queue (ensure_queue_table).
+    if table_exists(conn, "labels"):
+        sql = """
+            SELECT q.item_id FROM label_queue q
+            WHERE NOT EXISTS (SELECT 1 FROM labels l WHERE l.item_id = q.item_id)
+            ORDER BY q.priority DESC LIMIT ?
+        """
+    else:
+        sql = "SELECT item_id FROM label_queue ORDER BY priority DESC LIMIT ?"
+    return [row[0] for row in conn.execute(sql, (limit,))]
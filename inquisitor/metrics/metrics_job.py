@@ -1,22 +1,149 @@
 # inquisitor/metrics/metrics_job.py
-import argparse, sqlite3, csv
+import argparse, sqlite3, csv, json
 from pathlib import Path
 from datetime import datetime, timedelta
 
-def compute_metrics(conn, days=7):
-    cur = conn.cursor()
-    cur.execute("""
-        SELECT label, COUNT(*) FROM labels
-        WHERE created_at >= datetime('now', ?)
-        GROUP BY label
-    """, (f'-{days} days',))
-    counts = {row[0]: row[1] for row in cur.fetchall()}
-    tp = counts.get('TP',0); fp = counts.get('FP',0); tn = counts.get('TN',0); fn = counts.get('FN',0)
+from inquisitor.ingestion.db import MIGRATIONS_DIR, migrate, table_exists
+
+def ensure_label_rollups(conn) -> bool:
+    """Install the metrics_label_daily rollup and its labels triggers.
+
+    The first install backfills the rollup from existing labels; after that
+    the triggers keep it current.  Returns False if there is no labels table yet.
+    """
+    if not table_exists(conn, "labels"):
+        return False
+    if table_exists(conn, "metrics_label_daily"):
+        return True
+    migrate(conn, MIGRATIONS_DIR / "007_metrics_label_daily.sql")
+    rebuild_label_rollups(conn)
+    return True
+
+# Per-day label counts straight from labels; the rollup holds the same rows.
+_LABEL_DAILY_COUNTS = """
+    SELECT COALESCE(date(created_at), date('now')) AS day,
+           SUM(label = 'TP'), SUM(label = 'FP'), SUM(label = 'TN'), SUM(label = 'FN')
+    FROM labels WHERE label IN ('TP','FP','TN','FN')
+    GROUP BY 1
+"""
+
+def rebuild_label_rollups(conn) -> None:
+    """Recount metrics_label_daily from labels (e.g. after REPLACE-style writes)."""
+    with conn:
+        conn.execute("DELETE FROM metrics_label_daily")
+        conn.execute("INSERT INTO metrics_label_daily (day, tp, fp, tn, fn) " + _LABEL_DAILY_COUNTS)
+
+def _metrics_from_counts(tp, fp, tn, fn):
     precision = tp / (tp + fp) if (tp+fp) else 0.0
     recall = tp / (tp + fn) if (tp+fn) else 0.0
     f1 = 2*precision*recall/(precision+recall) if (precision+recall) else 0.0
     return {"tp":tp,"fp":fp,"tn":tn,"fn":fn,"precision":precision,"recall":recall,"f1":f1}
 
+def compute_metrics_windows(conn, windows=(7, 30, 90)):
+    """Metrics for several trailing windows from one read of the daily rollup.
+
+    A window of N days covers rollup days on or after ``date('now', '-N days')``.
+    Read-only: without the rollup (see :func:`ensure_label_rollups`) the same
+    daily counts are grouped from labels directly.
+    """
+    windows = sorted(set(windows))
+    if not windows:
+        return {}
+    if table_exists(conn, "metrics_label_daily"):
+        daily = "SELECT day, tp, fp, tn, fn FROM metrics_label_daily"
+    elif table_exists(conn, "labels"):
+        daily = _LABEL_DAILY_COUNTS
+    else:
+        return {w: _metrics_from_counts(0, 0, 0, 0) for w in windows}
+    cur = conn.execute(
+        f"WITH daily(day, tp, fp, tn, fn) AS ({daily}) SELECT * FROM daily WHERE day >= date('now', ?)",
+        (f'-{windows[-1]} days',),
+    )
+    rows = cur.fetchall()
+    out = {}
+    for w in windows:
+        cutoff = (datetime.utcnow().date() - timedelta(days=w)).isoformat()
+        sums = [0, 0, 0, 0]
+        for day, *counts in rows:
+            if day >= cutoff:
+                for i, c in enumerate(counts):
+                    sums[i] += c
+        out[w] = _metrics_from_counts(*sums)
+    return out
+
+def compute_metrics(conn, days=7):
+    return compute_metrics_windows(conn, (days,))[days]
+
+def compute_breakdowns(conn, days=7):
+    """Per-rule and per-subreddit metrics from one grouped scan of labels x detector verdicts.
+
+    Labels are joined to detector_marks/detector_acquittals on item_id and
+    grouped by (label, subreddit, rules_triggered), so each distinct rule list
+    is parsed once however many labels share it.  Returns
+    ``{"rules": {rule_id: metrics}, "subreddits": {subreddit: metrics}}``.
+    """
+    if not (table_exists(conn, "labels") and table_exists(conn, "detector_marks")):
+        return {"rules": {}, "subreddits": {}}
+    cur = conn.execute("""
+        SELECT l.label, d.subreddit, d.rules_triggered, COUNT(*)
+        FROM labels l
+        JOIN (
+            SELECT item_id, subreddit, rules_triggered FROM detector_marks
+            UNION ALL
+            SELECT item_id, subreddit, rules_triggered FROM detector_acquittals
+        ) d ON d.item_id = l.item_id
+        WHERE l.created_at >= date('now', ?) AND l.label IN ('TP','FP','TN','FN')
+        GROUP BY l.label, d.subreddit, d.rules_triggered
+    """, (f'-{days} days',))
+    slot = {'TP': 0, 'FP': 1, 'TN': 2, 'FN': 3}
+    by_rule: dict = {}
+    by_sub: dict = {}
+    for label, subreddit, rules_json, n in cur.fetchall():
+        i = slot[label]
+        by_sub.setdefault(subreddit or '', [0, 0, 0, 0])[i] += n
+        try:
+            rule_ids = json.loads(rules_json) if rules_json else []
+        except ValueError:
+            rule_ids = []
+        for rule_id in set(rule_ids):
+            by_rule.setdefault(rule_id, [0, 0, 0, 0])[i] += n
+    return {
+        "rules": {k: _metrics_from_counts(*v) for k, v in sorted(by_rule.items())},
+        "subreddits": {k: _metrics_from_counts(*v) for k, v in sorted(by_sub.items())},
+    }
+
+def ensure_breakdown_tables(conn) -> bool:
+    """Create the breakdown tables and the item_id indexes compute_breakdowns joins on.
+
+    Returns False if there are no detector tables yet.
+    """
+    if not table_exists(conn, "detector_marks"):
+        return False
+    if not table_exists(conn, "metrics_rule_daily"):
+        migrate(conn, MIGRATIONS_DIR / "008_metrics_breakdowns.sql")
+    return True
+
+def write_breakdowns_to_db(conn, breakdowns: dict, day: str | None = None) -> None:
+    if day is None:
+        day = datetime.utcnow().strftime('%Y-%m-%d')
+    ensure_breakdown_tables(conn)
+    for table, key_col, section in (
+        ("metrics_rule_daily", "rule_id", "rules"),
+        ("metrics_subreddit_daily", "subreddit", "subreddits"),
+    ):
+        conn.execute(f"DELETE FROM {table} WHERE day = ?", (day,))
+        conn.executemany(
+            f"""
+            INSERT INTO {table} (day, {key_col}, precision, recall, f1, tp, fp, tn, fn)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (day, key, m["precision"], m["recall"], m["f1"], m["tp"], m["fp"], m["tn"], m["fn"])
+                for key, m in breakdowns.get(section, {}).items()
+            ],
+        )
+    conn.commit()
+
 def write_metrics_to_db(conn, metrics: dict, day: str | None = None) -> None:
     if day is None:
         day = datetime.utcnow().strftime('%Y-%m-%d')
@@ -39,7 +166,16 @@ def write_metrics_to_db(conn, metrics: dict, day: str | None = None) -> None:
     )
     conn.commit()
 
-def write_reports(metrics: dict, out_dir: Path):
+def _breakdown_markdown(title: str, key_name: str, rows: dict) -> str:
+    lines = [f"## {title}", "",
+             f"| {key_name} | TP | FP | TN | FN | Precision | Recall | F1 |",
+             "|---|---:|---:|---:|---:|---:|---:|---:|"]
+    for key, m in rows.items():
+        lines.append(f"| {key} | {m['tp']} | {m['fp']} | {m['tn']} | {m['fn']} | "
+                     f"{m['precision']:.3f} | {m['recall']:.3f} | {m['f1']:.3f} |")
+    return "\n".join(lines) + "\n"
+
+def write_reports(metrics: dict, out_dir: Path, breakdowns: dict | None = None):
     out_dir.mkdir(parents=True, exist_ok=True)
     ts = datetime.utcnow().strftime('%Y%m%d')
     # CSV
@@ -57,20 +193,57 @@ def write_reports(metrics: dict, out_dir: Path):
 - Recall: {metrics['recall']:.3f}
 - F1: {metrics['f1']:.3f}
 """
+    if breakdowns:
+        cols = ['tp','fp','tn','fn','precision','recall','f1']
+        for section, key_name in (("rules", "rule_id"), ("subreddits", "subreddit")):
+            with (out_dir / f'metrics_{section}_{ts}.csv').open('w', newline='') as f:
+                w = csv.writer(f)
+                w.writerow([key_name] + cols)
+                for key, m in breakdowns.get(section, {}).items():
+                    w.writerow([key] + [m[k] for k in cols])
+        md += "\n" + _breakdown_markdown("Per rule", "Rule", breakdowns.get("rules", {}))
+        md += "\n" + _breakdown_markdown("Per subreddit", "Subreddit", breakdowns.get("subreddits", {}))
     (out_dir / f'metrics_{ts}.md').write_text(md)
 
+def write_window_reports(results: dict, out_dir: Path):
+    out_dir.mkdir(parents=True, exist_ok=True)
+    ts = datetime.utcnow().strftime('%Y%m%d')
+    cols = ['tp','fp','tn','fn','precision','recall','f1']
+    with (out_dir / f'metrics_windows_{ts}.csv').open('w', newline='') as f:
+        w = csv.writer(f)
+        w.writerow(['days'] + cols)
+        for days, m in sorted(results.items()):
+            w.writerow([days] + [m[k] for k in cols])
+    lines = [f"# Detector Metrics by Window ({ts})", "",
+             "| Days | TP | FP | TN | FN | Precision | Recall | F1 |",
+             "|---:|---:|---:|---:|---:|---:|---:|---:|"]
+    for days, m in sorted(results.items()):
+        lines.append(f"| {days} | {m['tp']} | {m['fp']} | {m['tn']} | {m['fn']} | "
+                     f"{m['precision']:.3f} | {m['recall']:.3f} | {m['f1']:.3f} |")
+    (out_dir / f'metrics_windows_{ts}.md').write_text("\n".join(lines) + "\n")
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument('--db', default='inquisitor_net.db')
     ap.add_argument('--days', type=int, default=7)
     ap.add_argument('--out', default='reports/metrics')
     ap.add_argument('--write-db', action='store_true', help='Persist metrics to DB table')
+    ap.add_argument('--windows', type=int, nargs='*', default=[], help='Extra trailing windows in days, e.g. 7 30 90')
+    ap.add_argument('--rebuild-rollups', action='store_true', help='Recount metrics_label_daily from labels first')
     args = ap.parse_args()
     with sqlite3.connect(args.db) as conn:
-        m = compute_metrics(conn, days=args.days)
+        if ensure_label_rollups(conn) and args.rebuild_rollups:
+            rebuild_label_rollups(conn)
+        ensure_breakdown_tables(conn)
+        results = compute_metrics_windows(conn, [args.days, *args.windows])
+        m = results[args.days]
+        breakdowns = compute_breakdowns(conn, days=args.days)
         if args.write_db:
             write_metrics_to_db(conn, m)
-    write_reports(m, Path(args.out))
+            write_breakdowns_to_db(conn, breakdowns)
+    write_reports(m, Path(args.out), breakdowns)
+    if args.windows:
+        write_window_reports(results, Path(args.out))
     print("Metrics written to", args.out)
 
 if __name__ == '__main__':
@@ -1,31 +1,150 @@
 # inquisitor/operations/bots/base.py
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Dict, Any, Optional
+import math
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, Sequence, Tuple
+
+from inquisitor.ingestion.config import cached_load
+
+PERSONAS_CONFIG = Path(__file__).resolve().parents[3] / "config" / "personas.yml"
+# Smaller batches are decided with bisect, which beats importing numpy for
+# a CLI run (inquisitor_cli plans 500 marks per batch).
+NUMPY_MIN_BATCH = 4096
+
+@dataclass(frozen=True)
+class ThresholdTable:
+    """Score tiers, ascending by ``mins``; a score maps to the last tier whose min it reaches."""
+    mins: Tuple[float, ...]
+    actions: Tuple[str, ...]
+    labels: Tuple[str, ...]
+    priorities: Tuple[str, ...]
+
+    @classmethod
+    def from_config(cls, tiers: Sequence[Dict[str, Any]]) -> "ThresholdTable":
+        if not tiers:
+            raise ValueError("A threshold table needs at least one tier")
+        ordered = sorted(tiers, key=lambda t: float(t["min"]))
+        return cls(
+            mins=tuple(float(t["min"]) for t in ordered),
+            actions=tuple(t["action"] for t in ordered),
+            labels=tuple(t.get("label", t["action"]) for t in ordered),
+            priorities=tuple(t.get("priority", "low") for t in ordered),
+        )
+
+    def tier(self, score: float) -> int:
+        if math.isnan(score):
+            score = 0.0
+        return max(bisect_right(self.mins, score) - 1, 0)
+
+DEFAULT_THRESHOLDS = ThresholdTable.from_config([
+    {"min": 0.8, "action": "post", "label": "heretical", "priority": "high"},
+    {"min": 0.5, "action": "dossier", "label": "uncertain", "priority": "medium"},
+    {"min": 0.0, "action": "log", "label": "not_heretical", "priority": "low"},
+])
 
 @dataclass
 class InquisitorPersonality:
     name: str
     style: str = "formal"
     traits: Dict[str, Any] = None
+    thresholds: ThresholdTable = DEFAULT_THRESHOLDS
+
+@dataclass
+class DecisionBatch:
+    """Columnar decisions aligned with the input ids: lists, or numpy arrays for large batches."""
+    ids: Any
+    tier: Any         # index into the persona's ThresholdTable
+    action: Any
+    label: Any
+    priority: Any
+    counts: Dict[str, int] = field(default_factory=dict)
+
+def _build_personas(raw: bytes) -> Dict[str, InquisitorPersonality]:
+    import yaml  # deferred like the other config loaders
+
+    data = yaml.load(raw, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
+    default = data.get("default", {})
+    base_table = ThresholdTable.from_config(default["thresholds"]) if default.get("thresholds") else DEFAULT_THRESHOLDS
+    personas = {}
+    for name, cfg in (data.get("personas") or {}).items():
+        cfg = cfg or {}
+        personas[name] = InquisitorPersonality(
+            name=name,
+            style=cfg.get("style", default.get("style", "formal")),
+            traits=cfg.get("traits"),
+            thresholds=ThresholdTable.from_config(cfg["thresholds"]) if cfg.get("thresholds") else base_table,
+        )
+    return personas
+
+def load_personas(path: str | Path = PERSONAS_CONFIG) -> Dict[str, InquisitorPersonality]:
+    return cached_load(path, "personas", _build_personas)
 
 class BaseBot:
     def __init__(self, persona: InquisitorPersonality):
         self.persona = persona
 
+    @property
+    def thresholds(self) -> ThresholdTable:
+        return self.persona.thresholds or DEFAULT_THRESHOLDS
+
+    def action_for(self, tier: int, mark: Dict[str, Any]) -> Dict[str, Any]:
+        """Planned-action payload for a mark that fell into ``tier``."""
+        action = self.thresholds.actions[tier]
+        if action == "post":
+            return {"type":"post", "payload":{"title":"Draft: Heresy Found", "body": mark.get("rationale","")[:800]}}
+        if action == "dossier":
+            return {"type":"dossier", "payload":{"subject_token": "SUBJ-001"}}
+        return {"type":action, "payload":{}}
+
     def decide(self, mark: Dict[str, Any]) -> Dict[str, Any]:
-        # Minimal rule: high score => post draft; medium => dossier; low => log
-        score = float(mark.get("score", 0.0))
-        if score >= 0.8:
-            action = {"type":"post", "payload":{"title":"Draft: Heresy Found", "body": mark.get("rationale","")[:800]}}
-            label = "heretical"
-            priority = "high"
-        elif score >= 0.5:
-            action = {"type":"dossier", "payload":{"subject_token": "SUBJ-001"}}
-            label = "uncertain"
-            priority = "medium"
-        else:
-            action = {"type":"log", "payload":{}}
-            label = "not_heretical"
-            priority = "low"
-        return {"label":label, "priority":priority, "rationale": mark.get("rationale",""), "planned_action": action}
+        # Per-persona tiers; the defaults are high score => post draft; medium => dossier; low => log
+        table = self.thresholds
+        tier = table.tier(float(mark.get("score", 0.0)))
+        return {"label":table.labels[tier], "priority":table.priorities[tier], "rationale": mark.get("rationale",""),
+                "planned_action": self.action_for(tier, mark)}
+
+    def decide_batch(self, ids: Sequence[Any], scores: Any) -> DecisionBatch:
+        """Vectorised :meth:`decide` over a columnar batch.
+
+        Args:
+            ids (Sequence[Any]): Item ids, aligned with ``scores``.
+            scores (array-like): Detector scores; NaN counts as 0.
+
+        Returns:
+            DecisionBatch: Tier index, action, label and priority columns;
+            lists below ``NUMPY_MIN_BATCH`` items, numpy arrays from there on.
+        """
+        table = self.thresholds
+        if len(ids) < NUMPY_MIN_BATCH:
+            tier = [table.tier(float(score)) for score in scores]
+            counts: Dict[str, int] = dict.fromkeys(table.actions, 0)
+            for t in tier:
+                counts[table.actions[t]] += 1
+            return DecisionBatch(
+                ids=list(ids),
+                tier=tier,
+                action=[table.actions[t] for t in tier],
+                label=[table.labels[t] for t in tier],
+                priority=[table.priorities[t] for t in tier],
+                counts=counts,
+            )
+
+        import numpy as np  # deferred: only large batches use it
+        scores = np.nan_to_num(np.asarray(scores, dtype=np.float64), nan=0.0)
+        tier = np.searchsorted(np.asarray(table.mins), scores, side="right") - 1
+        np.clip(tier, 0, len(table.mins) - 1, out=tier)
+        actions = np.asarray(table.actions)[tier]
+        hist = np.bincount(tier, minlength=len(table.mins))
+        counts = {}
+        for name, n in zip(table.actions, hist.tolist()):
+            counts[name] = counts.get(name, 0) + n
+        return DecisionBatch(
+            ids=np.asarray(ids),
+            tier=tier,
+            action=actions,
+            label=np.asarray(table.labels)[tier],
+            priority=np.asarray(table.priorities)[tier],
+            counts=counts,
+        )
@@ -0,0 +1,392 @@
+# inquisitor/operations/executor.py
+"""Durable executor for ``planned_actions``.
+
+Worker threads claim queued rows with a single ``UPDATE ... RETURNING``
+statement, so two workers can never run the same action.  Each action is
+dispatched by ``type`` to a pluggable executor; failures are retried with
+exponential backoff (``status='retry'`` plus ``next_attempt_at``) until
+``max_attempts``, after which the row is marked ``failed``.
+
+Everything runs against SQLite and :class:`FakeRedditClient`, so the whole
+path is testable offline.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import closing
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Protocol
+
+from inquisitor.operations.inquisitor_cli import create_dossier, ensure_action_queue
+
+logger = logging.getLogger(__name__)
+
+_NOW = "strftime('%Y-%m-%d %H:%M:%f', 'now')"
+
+
+class PermanentActionError(Exception):
+    """Raised by an executor when retrying cannot help (bad payload, rejected post)."""
+
+
+@dataclass
+class ClaimedAction:
+    id: int
+    item_id: str
+    type: str
+    payload: Dict[str, Any]
+    attempts: int
+
+
+class ActionHandler(Protocol):
+    def __call__(self, action: ClaimedAction, conn: sqlite3.Connection) -> Optional[Dict[str, Any]]: ...
+
+
+def connect(db_path: str | Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path, timeout=30.0)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA busy_timeout=30000")
+    return conn
+
+
+def claim_actions(conn: sqlite3.Connection, worker: str, limit: int = 1) -> List[ClaimedAction]:
+    """Atomically move up to ``limit`` due actions to ``running`` for ``worker``."""
+    with conn:
+        rows = conn.execute(
+            f"""
+            UPDATE planned_actions
+            SET status = 'running', claimed_by = ?, claimed_at = {_NOW}, attempts = attempts + 1
+            WHERE id IN (
+                SELECT id FROM planned_actions
+                WHERE status IN ('queued', 'retry')
+                  AND (next_attempt_at IS NULL OR next_attempt_at <= {_NOW})
+                ORDER BY id LIMIT ?
+            )
+            RETURNING id, item_id, type, payload_json, attempts
+            """,
+            (worker, limit),
+        ).fetchall()
+    out = []
+    for action_id, item_id, kind, payload_json, attempts in sorted(rows):
+        try:
+            payload = json.loads(payload_json) if payload_json else {}
+        except ValueError:
+            payload = {"_raw": payload_json}
+        out.append(ClaimedAction(action_id, item_id, kind, payload, attempts))
+    return out
+
+
+def requeue_stale(conn: sqlite3.Connection, older_than_seconds: float) -> int:
+    """Return ``running`` rows whose worker vanished to the queue."""
+    with conn:
+        cur = conn.execute(
+            f"""
+            UPDATE planned_actions SET status = 'retry', claimed_by = NULL
+            WHERE status = 'running' AND claimed_at <= strftime('%Y-%m-%d %H:%M:%f', 'now', ?)
+            """,
+            (f"-{older_than_seconds} seconds",),
+        )
+    return cur.rowcount
+
+
+def queue_depth(conn: sqlite3.Connection) -> Dict[str, int]:
+    return dict(conn.execute("SELECT status, COUNT(*) FROM planned_actions GROUP BY status").fetchall())
+
+
+def _percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+@dataclass
+class ExecutorStats:
+    """Outcome counters and latency samples (ms), safe to update from workers."""
+    outcomes: Dict[str, int] = field(default_factory=dict)
+    run_ms: List[float] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, outcome: str, run_ms: float) -> None:
+        with self._lock:
+            self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+            self.run_ms.append(run_ms)
+
+    def snapshot(self, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
+        with self._lock:
+            samples = list(self.run_ms)
+            snap: Dict[str, Any] = {"outcomes": dict(self.outcomes)}
+        snap["run_ms_p50"] = _percentile(samples, 0.50)
+        snap["run_ms_p95"] = _percentile(samples, 0.95)
+        if conn is not None:
+            snap["queue_depth"] = queue_depth(conn)
+            # Queue-to-finish latency of completed actions, from the table itself.
+            row = conn.execute(
+                """
+                SELECT AVG((julianday(finished_at) - julianday(created_at)) * 86400000.0),
+                       MAX((julianday(finished_at) - julianday(created_at)) * 86400000.0)
+                FROM planned_actions WHERE status = 'done'
+                """
+            ).fetchone()
+            snap["done_latency_ms_avg"], snap["done_latency_ms_max"] = row
+        return snap
+
+
+# -- executors ------------------------------------------------------------
+
+class FakeRedditClient:
+    """In-memory stand-in for a posting Reddit client.
+
+    ``fail_first`` makes the first N submissions raise, to exercise retries.
+    ``log_path`` appends every accepted post as JSONL.
+    """
+
+    def __init__(self, fail_first: int = 0, log_path: str | Path | None = None):
+        self.fail_first = fail_first
+        self.log_path = Path(log_path) if log_path else None
+        self.posts: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def submit(self, subreddit: str, title: str, body: str) -> str:
+        with self._lock:
+            if self.fail_first > 0:
+                self.fail_first -= 1
+                raise ConnectionError("fake reddit: transient failure")
+            post = {"id": f"fake_{len(self.posts) + 1}", "subreddit": subreddit, "title": title, "body": body}
+            self.posts.append(post)
+            if self.log_path:
+                with self.log_path.open("a", encoding="utf-8") as fh:
+                    fh.write(json.dumps(post) + "\n")
+            return post["id"]
+
+
+class PostExecutor:
+    def __init__(self, client: Any, default_subreddit: str = "InquisitorNet_Sandbox"):
+        self.client = client
+        self.default_subreddit = default_subreddit
+
+    def __call__(self, action: ClaimedAction, conn: sqlite3.Connection) -> Dict[str, Any]:
+        body = action.payload.get("body")
+        if not body:
+            raise PermanentActionError("post payload has no body")
+        subreddit = action.payload.get("subreddit", self.default_subreddit)
+        post_id = self.client.submit(subreddit, action.payload.get("title", ""), body)
+        return {"post_id": post_id, "subreddit": subreddit}
+
+
+class DossierExecutor:
+    """Publishes the item's dossier, creating it when the planner did not."""
+
+    def __init__(self, out_dir: str | Path | None = None):
+        self.out_dir = Path(out_dir) if out_dir else None
+
+    def __call__(self, action: ClaimedAction, conn: sqlite3.Connection) -> Dict[str, Any]:
+        row = conn.execute(
+            "SELECT id, markdown FROM dossiers WHERE item_id = ? ORDER BY id DESC LIMIT 1", (action.item_id,)
+        ).fetchone()
+        if row is None:
+            mark = {"item_id": action.item_id}
+            if action.payload.get("rationale"):
+                mark["rationale"] = action.payload["rationale"]
+            markdown = create_dossier(mark)
+            with conn:
+                cur = conn.execute(
+                    "INSERT INTO dossiers(item_id, subject_token, markdown) VALUES (?, ?, ?)",
+                    (action.item_id, action.payload.get("subject_token", "SUBJ-001"), markdown),
+                )
+            row = (cur.lastrowid, markdown)
+        result: Dict[str, Any] = {"dossier_id": row[0]}
+        if self.out_dir is not None:
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+            path = self.out_dir / f"{action.item_id}.md"
+            path.write_text(row[1], encoding="utf-8")
+            result["path"] = str(path)
+        return result
+
+
+def log_executor(action: ClaimedAction, conn: sqlite3.Connection) -> None:
+    logger.info("Logged action %s for item %s", action.id, action.item_id)
+
+
+def default_executors(client: Any, dossier_dir: str | Path | None = None) -> Dict[str, ActionHandler]:
+    return {"post": PostExecutor(client), "dossier": DossierExecutor(dossier_dir), "log": log_executor}
+
+
+# -- worker pool ----------------------------------------------------------
+
+class ActionExecutor:
+    """Pool of worker threads draining ``planned_actions``.
+
+    Each worker owns its SQLite connection; claims are atomic, so the pool
+    can also run alongside executors in other processes.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        executors: Dict[str, ActionHandler],
+        *,
+        workers: int = 4,
+        max_attempts: int = 5,
+        backoff_base: float = 2.0,
+        backoff_max: float = 300.0,
+        poll_interval: float = 0.5,
+        stale_after: float = 600.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.db_path = str(db_path)
+        self.executors = executors
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self.sleep = sleep
+        self.stats = ExecutorStats()
+        # Prefix of every claim token this pool hands out
+        self.pool_id = uuid.uuid4().hex[:8]
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        with closing(connect(self.db_path)) as conn:
+            ensure_action_queue(conn)
+
+    def backoff(self, attempts: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempts - 1)))
+        return delay * random.uniform(0.5, 1.0)  # jitter so retries do not stampede
+
+    def _finish(self, conn, action: ClaimedAction, worker: str, status: str, *, result=None, error=None,
+                delay: float = 0.0) -> None:
+        with conn:
+            conn.execute(
+                f"""
+                UPDATE planned_actions
+                SET status = ?, finished_at = CASE WHEN ? IN ('done', 'failed') THEN {_NOW} END,
+                    next_attempt_at = CASE WHEN ? = 'retry'
+                        THEN strftime('%Y-%m-%d %H:%M:%f', 'now', ?) END,
+                    last_error = ?, result_json = ?, claimed_by = NULL
+                WHERE id = ? AND claimed_by = ?
+                """,
+                (status, status, status, f"+{delay} seconds", error,
+                 json.dumps(result) if result is not None else None, action.id, worker),
+            )
+
+    def run_one(self, conn: sqlite3.Connection, action: ClaimedAction, worker: str) -> str:
+        started = time.perf_counter()
+        handler = self.executors.get(action.type)
+        try:
+            if handler is None:
+                raise PermanentActionError(f"no executor for action type {action.type!r}")
+            result = handler(action, conn)
+            status, error, delay = "done", None, 0.0
+        except PermanentActionError as exc:
+            result, status, error, delay = None, "failed", str(exc), 0.0
+        except Exception as exc:
+            result, error = None, repr(exc)
+            if action.attempts >= self.max_attempts:
+                status, delay = "failed", 0.0
+            else:
+                status, delay = "retry", self.backoff(action.attempts)
+            logger.warning("Action %s attempt %d failed: %s", action.id, action.attempts, error)
+        self._finish(conn, action, worker, status, result=result, error=error, delay=delay)
+        self.stats.record(status, (time.perf_counter() - started) * 1000.0)
+        return status
+
+    def _pending(self, conn) -> bool:
+        """Work a draining pool still waits for: queued or retrying rows, or rows its own workers run."""
+        return conn.execute(
+            """
+            SELECT 1 FROM planned_actions
+            WHERE status IN ('queued', 'retry')
+               OR (status = 'running' AND substr(claimed_by, 1, ?) = ?)
+            LIMIT 1
+            """,
+            (len(self.pool_id) + 1, self.pool_id + "-"),
+        ).fetchone() is not None
+
+    def _worker(self, drain: bool) -> None:
+        worker = f"{self.pool_id}-{threading.current_thread().name}-{uuid.uuid4().hex[:8]}"
+        conn = connect(self.db_path)
+        try:
+            while not self._stop.is_set():
+                claimed = claim_actions(conn, worker)
+                if claimed:
+                    for action in claimed:
+                        self.run_one(conn, action, worker)
+                    continue
+                # Rows left running by a crashed worker (any process) come back as retries.
+                requeue_stale(conn, self.stale_after)
+                if drain and not self._pending(conn):
+                    return
+                self.sleep(self.poll_interval)
+        finally:
+            conn.close()
+
+    def start(self, drain: bool = False) -> None:
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._worker, args=(drain,), name=f"action-worker-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for t in self._threads:
+            t.start()
+
+    def join(self) -> None:
+        for t in self._threads:
+            t.join()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self.join()
+
+    def drain(self) -> Dict[str, Any]:
+        """Run until nothing is queued, retrying or run by this pool; returns a stats snapshot.
+
+        Rows another executor is running are not waited for; once older than
+        ``stale_after`` they are requeued and picked up like any retry.
+        """
+        self.start(drain=True)
+        self.join()
+        with closing(connect(self.db_path)) as conn:
+            return self.stats.snapshot(conn)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Execute queued planned_actions")
+    ap.add_argument("--db", default="inquisitor_net.db")
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--max-attempts", type=int, default=5)
+    ap.add_argument("--dossier-dir", default=None, help="Also write dossiers as Markdown files here")
+    ap.add_argument("--posts-log", default="reports/fake_posts.jsonl", help="Where the local fake Reddit records posts")
+    ap.add_argument("--requeue-stale", type=float, default=600.0, help="Requeue running actions older than N seconds")
+    ap.add_argument("--forever", action="store_true", help="Keep polling instead of exiting when the queue is empty")
+    args = ap.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    Path(args.posts_log).parent.mkdir(parents=True, exist_ok=True)
+    pool = ActionExecutor(args.db, default_executors(FakeRedditClient(log_path=args.posts_log), args.dossier_dir),
+                          workers=args.workers, max_attempts=args.max_attempts, stale_after=args.requeue_stale)
+    with closing(connect(args.db)) as conn:
+        requeue_stale(conn, args.requeue_stale)
+    if args.forever:
+        pool.start()
+        try:
+            while True:
+                time.sleep(60)
+                with closing(connect(args.db)) as conn:
+                    logger.info("Executor stats: %s", pool.stats.snapshot(conn))
+        except KeyboardInterrupt:
+            pool.stop()
+        return
+    print(json.dumps(pool.drain(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,28 @@
 # inquisitor/operations/inquisitor_cli.py
-import argparse, json, sqlite3
+import argparse, json, sqlite3, time
+from collections import Counter
+from itertools import islice
 from pathlib import Path
 
-from inquisitor.operations.bots.base import BaseBot, InquisitorPersonality
-from inquisitor.policy.gate import check_draft
+from inquisitor.ingestion.db import MIGRATIONS_DIR, column_exists, migrate
+from inquisitor.operations.bots.base import PERSONAS_CONFIG, BaseBot, InquisitorPersonality, load_personas
+from inquisitor.operations.mark_feed import DEFAULT_CONSUMER, MarkFeed
+from inquisitor.policy.gate import evaluate_text, load_rules
+
+BATCH_SIZE = 500
 
 def ensure_operations_tables(conn):
-    conn.execute("CREATE TABLE IF NOT EXISTS planned_actions (id INTEGER PRIMARY KEY AUTOINCREMENT, item_id TEXT, type TEXT, payload_json TEXT, status TEXT DEFAULT 'queued', created_at DATETIME DEFAULT CURRENT_TIMESTAMP)")
-    conn.execute("CREATE TABLE IF NOT EXISTS dossiers (id INTEGER PRIMARY KEY AUTOINCREMENT, subject_token TEXT, markdown TEXT, created_at DATETIME DEFAULT CURRENT_TIMESTAMP, visibility TEXT DEFAULT 'private')")
+    # One catalog probe instead of DDL on every start.
+    have = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name IN ('planned_actions','dossiers')")}
+    if len(have) < 2:
+        conn.execute("CREATE TABLE IF NOT EXISTS planned_actions (id INTEGER PRIMARY KEY AUTOINCREMENT, item_id TEXT, type TEXT, payload_json TEXT, status TEXT DEFAULT 'queued', created_at DATETIME DEFAULT CURRENT_TIMESTAMP)")
+        conn.execute("CREATE TABLE IF NOT EXISTS dossiers (id INTEGER PRIMARY KEY AUTOINCREMENT, subject_token TEXT, markdown TEXT, created_at DATETIME DEFAULT CURRENT_TIMESTAMP, visibility TEXT DEFAULT 'private')")
+    ensure_action_queue(conn)
+
+def ensure_action_queue(conn):
+    """Apply the executor's queue columns (and dossiers.item_id) from migration 013."""
+    if not column_exists(conn, "planned_actions", "attempts"):
+        migrate(conn, MIGRATIONS_DIR / "013_action_queue.sql")
 
 def create_dossier(mark: dict) -> str:
     # Minimal dossier format
@@ -19,31 +34,75 @@ def create_dossier(mark: dict) -> str:
           "## Recommendation", "- Review required"]
     return "\n".join(md)
 
+def plan_batch(bot, marks, gate_rules):
+    """Decide a batch of marks and gate all post drafts against preloaded rules.
+
+    Tiers come from one :meth:`BaseBot.decide_batch` call.
+    Returns ``(action_rows, dossier_rows)`` ready for ``executemany``.
+    """
+    batch = bot.decide_batch([m.get("item_id","?") for m in marks], [m.get("score", 0.0) for m in marks])
+    actions = [bot.action_for(tier, mark) for tier, mark in zip(map(int, batch.tier), marks)]
+    posts = [i for i, act in enumerate(actions) if act["type"] == "post"]
+    decisions = [evaluate_text(actions[i]["payload"].get("body",""), gate_rules) for i in posts]
+    for i, d in zip(posts, decisions):
+        if d.decision != "allow":
+            # downgrade to dossier if failed gate
+            actions[i] = {"type":"dossier", "payload":{"subject_token":"SUBJ-001"}}
+    action_rows, dossier_rows = [], []
+    for mark, act in zip(marks, actions):
+        if act["type"] == "dossier":
+            dossier_rows.append((mark.get("item_id","?"), "SUBJ-001", create_dossier(mark)))
+        action_rows.append((mark.get("item_id","?"), act["type"], json.dumps(act["payload"]), "queued"))
+    return action_rows, dossier_rows
+
+def write_plan(conn, action_rows, dossier_rows):
+    # No commit here: callers decide the transaction boundary.
+    conn.executemany("INSERT INTO dossiers(item_id, subject_token, markdown) VALUES (?,?,?)", dossier_rows)
+    conn.executemany("INSERT INTO planned_actions(item_id, type, payload_json, status) VALUES (?,?,?,?)", action_rows)
+
+def _jsonl_batches(f, size):
+    marks = (json.loads(line) for line in f if line.strip())
+    while batch := list(islice(marks, size)):
+        yield batch
+
 def main():
     ap = argparse.ArgumentParser(description="Phase 3 inquisitor stub")
     ap.add_argument("--db", default="inquisitor_net.db")
-    ap.add_argument("--marks-jsonl", required=True, help="Input marks (JSONL with item_id, score, rationale)")
+    src = ap.add_mutually_exclusive_group(required=True)
+    src.add_argument("--marks-jsonl", help="Input marks (JSONL with item_id, score, rationale)")
+    src.add_argument("--from-db", action="store_true", help="Read new marks straight from detector_marks in --db")
+    ap.add_argument("--consumer", default=DEFAULT_CONSUMER, help="Offset name used with --from-db")
     ap.add_argument("--policy-config", default="config/policy_gate.yml")
+    ap.add_argument("--persona", default="Verax", help="Persona whose thresholds drive decisions")
+    ap.add_argument("--personas-config", default=str(PERSONAS_CONFIG))
+    ap.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="Marks planned per batch")
     args = ap.parse_args()
 
-    bot = BaseBot(InquisitorPersonality(name="Verax"))
-    with sqlite3.connect(args.db) as conn, open(args.marks_jsonl) as f:
+    persona = load_personas(args.personas_config).get(args.persona) or InquisitorPersonality(name=args.persona)
+    bot = BaseBot(persona)
+    gate_rules = load_rules(args.policy_config)
+    counts = Counter()
+    started = time.perf_counter()
+    with sqlite3.connect(args.db) as conn:
         ensure_operations_tables(conn)
-        for line in f:
-            mark = json.loads(line)
-            decision = bot.decide(mark)
-            act = decision["planned_action"]
-            # Gate any 'post' actions
-            if act["type"] == "post":
-                text = act["payload"].get("body","")
-                d = check_draft(text, args.policy_config)
-                if d.decision != "allow":
-                    # downgrade to dossier if failed gate
-                    act = {"type":"dossier", "payload":{"subject_token":"SUBJ-001"}}
-            if act["type"] == "dossier":
-                md = create_dossier(mark)
-                conn.execute("INSERT INTO dossiers(subject_token, markdown) VALUES (?,?)", ("SUBJ-001", md))
-            conn.execute("INSERT INTO planned_actions(item_id, type, payload_json, status) VALUES (?,?,?,?)", (mark.get("item_id","?"), act["type"], json.dumps(act["payload"]), "queued"))
+        if args.from_db:
+            feed = MarkFeed(conn, args.consumer, chunk=args.batch_size)
+            for batch in feed.batches():
+                action_rows, dossier_rows = plan_batch(bot, batch, gate_rules)
+                write_plan(conn, action_rows, dossier_rows)
+                feed.commit(batch[-1]["id"])  # commits the batch's rows with the offset
+                counts.update(row[1] for row in action_rows)
+        else:
+            # A single transaction for the whole file, committed on exit.
+            with open(args.marks_jsonl) as f:
+                for batch in _jsonl_batches(f, args.batch_size):
+                    action_rows, dossier_rows = plan_batch(bot, batch, gate_rules)
+                    write_plan(conn, action_rows, dossier_rows)
+                    counts.update(row[1] for row in action_rows)
+    elapsed = time.perf_counter() - started
+    n = sum(counts.values())
+    breakdown = ", ".join(f"{k}={v}" for k, v in sorted(counts.items())) or "none"
+    print(f"Planned {n} marks ({breakdown}) in {elapsed:.3f}s ({n / elapsed if elapsed else 0.0:.0f} marks/s)")
 
 if __name__ == "__main__":
     main()
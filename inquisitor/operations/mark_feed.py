@@ -0,0 +1,55 @@
+# inquisitor/operations/mark_feed.py
+"""Direct DB-backed feed of detector marks for the operations phase.
+
+Marks are read from ``detector_marks`` past the consumer's offset in
+``feed_offsets`` and handed over as plain dicts, with the same keys the
+JSONL export writes, so no serialize/write/read/parse round-trip is needed
+when detector and operations share a database.
+"""
+from __future__ import annotations
+
+import sqlite3
+from typing import Any, Dict, Iterator, List
+
+from inquisitor.exports.marks_export import CHUNK_SIZE, commit_offset, iter_marks, read_offset
+
+DEFAULT_CONSUMER = "inquisitor_cli"
+
+
+class MarkFeed:
+    """Batches of new marks for one named consumer.
+
+    The offset only moves when :meth:`commit` is called.  ``commit`` runs in
+    the connection's transaction, so writes made while handling a batch and
+    the new offset are committed together: a crash re-delivers the batch
+    instead of losing or duplicating its actions.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, consumer: str = DEFAULT_CONSUMER, chunk: int = CHUNK_SIZE):
+        self.conn = conn
+        self.consumer = consumer
+        self.chunk = chunk
+        self.offset = read_offset(conn, consumer)
+
+    def batches(self) -> Iterator[List[Dict[str, Any]]]:
+        batch: List[Dict[str, Any]] = []
+        for mark_id, item_id, subreddit, score, rationale, created_at in iter_marks(
+            self.conn, after_id=self.offset, chunk=self.chunk
+        ):
+            batch.append({
+                "id": mark_id,
+                "item_id": item_id,
+                "score": float(score) if score is not None else 0.0,
+                "rationale": rationale or "",
+                "subreddit": subreddit,
+                "created_at": created_at,
+            })
+            if len(batch) >= self.chunk:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def commit(self, last_id: int) -> None:
+        commit_offset(self.conn, self.consumer, last_id)
+        self.offset = last_id
@@ -12,6 +12,7 @@ def main() -> None:
     ap.add_argument("--drafts", default="fixtures/drafts.jsonl", help="Path to draft JSONL")
     ap.add_argument("--policy-config", default="config/policy_gate.yml", help="Policy gate YAML")
     ap.add_argument("--draft-scope", default="fixtures", help="Label for draft source")
+    ap.add_argument("--storage", choices=["legacy", "compact"], default="legacy", help="policy_checks storage layout")
     ap.add_argument("--skip-metrics", action="store_true", help="Skip metrics aggregation")
     args = ap.parse_args()
 
@@ -28,6 +29,7 @@ def main() -> None:
         policy_config_path=Path(args.policy_config),
         draft_scope=args.draft_scope,
         write_metrics=not args.skip_metrics,
+        storage=args.storage,
     )
     print(f"Stored {stored} policy decisions in {settings.database_path}")
 
@@ -7,9 +7,11 @@ from typing import Iterable
 
 from inquisitor.ingestion.config import Settings
 from inquisitor.ingestion.db import migrate
-from inquisitor.metrics.metrics_job import compute_metrics, write_metrics_to_db
+from inquisitor.metrics.metrics_job import compute_metrics, ensure_label_rollups, write_metrics_to_db
 from inquisitor.policy.gate import evaluate_text_with_raw_matches, load_rules
-from inquisitor.policy.store import insert_policy_check
+from inquisitor.policy.store import PolicyCheck, insert_policy_checks_bulk
+
+BATCH_SIZE = 500
 
 
 def _iter_drafts(path: Path) -> Iterable[dict]:
@@ -28,21 +30,23 @@ def run_policy_pipeline(
     policy_config_path: Path,
     draft_scope: str = "fixtures",
     write_metrics: bool = True,
+    storage: str = "legacy",
 ) -> int:
     migrate(conn, settings.base_path / "migrations" / "002_phase2.sql")
+    if write_metrics:
+        # Metrics then read the incremental per-day rollup rather than grouping all labels
+        ensure_label_rollups(conn)
     rules = load_rules(policy_config_path)
     stored = 0
+    pending = []
     for item in _iter_drafts(drafts_path):
         text = item.get("text") or item.get("body") or ""
         decision, raw_match = evaluate_text_with_raw_matches(text, rules)
-        insert_policy_check(
-            conn,
-            draft_scope=draft_scope,
-            draft_text=text,
-            decision=decision,
-            raw_match=raw_match,
-        )
-        stored += 1
+        pending.append(PolicyCheck(draft_text=text, decision=decision, raw_match=raw_match))
+        if len(pending) >= BATCH_SIZE:
+            stored += insert_policy_checks_bulk(conn, pending, draft_scope=draft_scope, storage=storage)
+            pending = []
+    stored += insert_policy_checks_bulk(conn, pending, draft_scope=draft_scope, storage=storage)
 
     if write_metrics:
         metrics = compute_metrics(conn, days=7)
@@ -0,0 +1,230 @@
+"""In-process job scheduler for metrics, detector backfills and reports.
+
+Jobs run inside one long-lived process and share a warm SQLite connection,
+the loaded :class:`Settings` and the compiled detector rules, instead of
+paying interpreter start-up and config parsing for every run.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from inquisitor.ingestion.config import Settings
+from inquisitor.ingestion.db import MIGRATIONS_DIR, migrate, table_exists
+from inquisitor.ingestion.detector import DetectorEngine, run_detector_to_db
+from inquisitor.metrics.metrics_job import (
+    compute_breakdowns,
+    compute_metrics_windows,
+    ensure_breakdown_tables,
+    ensure_label_rollups,
+    write_breakdowns_to_db,
+    write_metrics_to_db,
+    write_reports,
+    write_window_reports,
+)
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the duration histogram buckets; the last bucket is unbounded.
+DURATION_BUCKETS_MS = (10, 50, 100, 500, 1_000, 5_000, 30_000, 60_000, 300_000)
+
+
+def _bucket_label(duration_ms: float) -> str:
+    for le in DURATION_BUCKETS_MS:
+        if duration_ms <= le:
+            return str(le)
+    return "+Inf"
+
+
+class SchedulerService:
+    """Runs named jobs against a shared connection with overlap protection.
+
+    Each job runs at most once at a time; a trigger that fires while the same
+    job is still running is recorded as ``skipped``.  Different jobs are
+    serialised on the shared connection.  Every run is logged to ``job_runs``
+    and counted in ``job_duration_histogram``.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        *,
+        reports_dir: str | Path = "reports/metrics",
+        metrics_days: int = 7,
+        report_windows: tuple = (7, 30, 90),
+        misfire_grace_time: int = 3600,
+    ):
+        self.settings = settings
+        self.reports_dir = Path(reports_dir)
+        self.metrics_days = metrics_days
+        self.report_windows = tuple(report_windows)
+        self.misfire_grace_time = misfire_grace_time
+        self.detector_engine = DetectorEngine.from_settings(settings)
+        # The scheduler fires jobs from worker threads; the connection is
+        # guarded by _db_lock rather than confined to one thread.
+        Path(settings.database_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(settings.database_path, check_same_thread=False)
+        self._db_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._running: set[str] = set()
+        # Skipped/missed events are queued here and flushed with the next
+        # run record, so reporting them never waits on a running job.
+        self._pending: list[tuple] = []
+        self._scheduler = None
+        self.jobs: Dict[str, Callable[[], None]] = {
+            "metrics": self.run_metrics,
+            "detector_backfill": self.run_detector_backfill,
+            "reports": self.run_reports,
+        }
+        with self._db_lock:
+            if not table_exists(self.conn, "job_runs"):
+                migrate(self.conn, MIGRATIONS_DIR / "009_job_runs.sql")
+            # The metrics jobs read the label rollup and the breakdown indexes;
+            # installing them is a setup step, not a job's.
+            ensure_label_rollups(self.conn)
+            ensure_breakdown_tables(self.conn)
+
+    # -- jobs -----------------------------------------------------------
+    def run_metrics(self) -> None:
+        results = compute_metrics_windows(self.conn, (self.metrics_days,))
+        write_metrics_to_db(self.conn, results[self.metrics_days])
+        write_breakdowns_to_db(self.conn, compute_breakdowns(self.conn, days=self.metrics_days))
+
+    def run_detector_backfill(self) -> None:
+        marked, acquitted = run_detector_to_db(self.settings, self.conn, rules=self.detector_engine)
+        logger.info("Detector backfill marked %d, acquitted %d", marked, acquitted)
+
+    def run_reports(self) -> None:
+        results = compute_metrics_windows(self.conn, (self.metrics_days, *self.report_windows))
+        breakdowns = compute_breakdowns(self.conn, days=self.metrics_days)
+        write_reports(results[self.metrics_days], self.reports_dir, breakdowns)
+        write_window_reports(results, self.reports_dir)
+
+    # -- execution ------------------------------------------------------
+    def run_job(self, name: str) -> str:
+        """Run one job now; returns ``ok``, ``error`` or ``skipped``."""
+        fn = self.jobs[name]
+        started = datetime.utcnow().isoformat(timespec="seconds")
+        with self._state_lock:
+            if name in self._running:
+                logger.warning("Job %s still running; skipping this trigger", name)
+                self._pending.append((name, started, None, "skipped", None))
+                return "skipped"
+            self._running.add(name)
+        t0 = time.perf_counter()
+        status, error = "ok", None
+        try:
+            with self._db_lock:
+                try:
+                    fn()
+                except Exception:
+                    # Drop the job's uncommitted writes before _record commits the failure row
+                    self.conn.rollback()
+                    raise
+        except Exception as exc:  # keep the scheduler alive
+            logger.exception("Job %s failed", name)
+            status, error = "error", repr(exc)
+        finally:
+            with self._state_lock:
+                self._running.discard(name)
+        self._record(name, started, (time.perf_counter() - t0) * 1000.0, status, error)
+        return status
+
+    def _record(self, job: str, started_at: str, duration_ms: Optional[float], status: str,
+                error: Optional[str] = None) -> None:
+        with self._state_lock:
+            rows, self._pending = self._pending, []
+        rows.append((job, started_at, duration_ms, status, error))
+        with self._db_lock, self.conn:
+            self.conn.executemany(
+                "INSERT INTO job_runs (job, started_at, duration_ms, status, error) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            if duration_ms is not None:
+                self.conn.execute(
+                    """
+                    INSERT INTO job_duration_histogram (job, le, count) VALUES (?, ?, 1)
+                    ON CONFLICT(job, le) DO UPDATE SET count = count + 1
+                    """,
+                    (job, _bucket_label(duration_ms)),
+                )
+
+    def _on_missed(self, event) -> None:
+        logger.warning("Job %s missed its %s run", event.job_id, event.scheduled_run_time)
+        with self._state_lock:
+            self._pending.append(
+                (event.job_id, event.scheduled_run_time.isoformat(timespec="seconds"), None, "missed", None)
+            )
+
+    def _on_max_instances(self, event) -> None:
+        # APScheduler dropped the run because the previous one is still going.
+        logger.warning("Job %s still running; skipped %d run(s)", event.job_id, len(event.scheduled_run_times))
+        with self._state_lock:
+            self._pending.extend(
+                (event.job_id, run_time.isoformat(timespec="seconds"), None, "skipped", None)
+                for run_time in event.scheduled_run_times
+            )
+
+    def start(self, *, backfill_minutes: int = 15, blocking: bool = True) -> None:
+        """Register the default schedule and start APScheduler."""
+        from apscheduler.events import EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED
+
+        if blocking:
+            from apscheduler.schedulers.blocking import BlockingScheduler as Scheduler
+        else:
+            from apscheduler.schedulers.background import BackgroundScheduler as Scheduler
+
+        sched = Scheduler(job_defaults={
+            "coalesce": True,
+            "max_instances": 1,
+            "misfire_grace_time": self.misfire_grace_time,
+        })
+        sched.add_job(self.run_job, "cron", args=["metrics"], id="metrics", hour=2, minute=0)
+        sched.add_job(self.run_job, "cron", args=["reports"], id="reports", hour=2, minute=10)
+        sched.add_job(self.run_job, "interval", args=["detector_backfill"], id="detector_backfill",
+                      minutes=backfill_minutes)
+        sched.add_listener(self._on_missed, EVENT_JOB_MISSED)
+        sched.add_listener(self._on_max_instances, EVENT_JOB_MAX_INSTANCES)
+        self._scheduler = sched
+        sched.start()
+
+    def shutdown(self) -> None:
+        if self._scheduler is not None and self._scheduler.running:
+            self._scheduler.shutdown()
+        with self._db_lock:
+            self.conn.close()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="In-process scheduler for metrics, detector backfills and reports")
+    ap.add_argument("--db", default=None, help="Path to SQLite DB (defaults to the Phase 1 DB)")
+    ap.add_argument("--out", default="reports/metrics", help="Report output directory")
+    ap.add_argument("--days", type=int, default=7, help="Primary metrics window")
+    ap.add_argument("--backfill-minutes", type=int, default=15, help="Detector backfill interval")
+    ap.add_argument("--run-once", choices=["metrics", "detector_backfill", "reports"], help="Run a single job and exit")
+    args = ap.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    settings = Settings(Path(__file__).resolve().parents[2])
+    if args.db:
+        settings.database_path = args.db
+    service = SchedulerService(settings, reports_dir=args.out, metrics_days=args.days)
+    try:
+        if args.run_once:
+            print(f"{args.run_once}: {service.run_job(args.run_once)}")
+            return
+        service.start(backfill_minutes=args.backfill_minutes)
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        service.shutdown()
+
+
+if __name__ == "__main__":
+    main()
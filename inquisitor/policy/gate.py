@@ -3,13 +3,16 @@ from __future__ import annotations
 import re
 import json
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
-try:
-    import yaml  # type: ignore
-except Exception as e:  # pragma: no cover
-    yaml = None
+from inquisitor.ingestion.config import cached_load
+
+
+@lru_cache(maxsize=None)
+def _compile(pattern: str, flags: int) -> re.Pattern:
+    return re.compile(pattern, flags)
 
 @dataclass
 class GateRule:
@@ -21,7 +24,7 @@ class GateRule:
     category: str = "general"
 
     def compiled(self):
-        return re.compile(self.pattern, self.flags)
+        return _compile(self.pattern, self.flags)
 
 @dataclass
 class GateDecision:
@@ -29,11 +32,12 @@ class GateDecision:
     reasons: List[Dict[str, Any]] = field(default_factory=list)
     llm_reason: Optional[str] = None
 
-def load_rules(config_path: str | Path) -> List[GateRule]:
-    path = Path(config_path)
-    if yaml is None:
+def _build_rules(raw: bytes) -> List[GateRule]:
+    try:
+        import yaml  # type: ignore
+    except Exception:  # pragma: no cover
         raise RuntimeError("PyYAML is required to load gate rules")
-    data = yaml.safe_load(path.read_text())
+    data = yaml.load(raw, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
     rules = []
     for item in data.get("rules", []):
         rules.append(GateRule(
@@ -45,6 +49,9 @@ def load_rules(config_path: str | Path) -> List[GateRule]:
         ))
     return rules
 
+def load_rules(config_path: str | Path) -> List[GateRule]:
+    return cached_load(config_path, "gate_rules", _build_rules)
+
 def evaluate_text(text: str, rules: List[GateRule]) -> GateDecision:
     hits = []
     block_score = 0.0
@@ -2,7 +2,9 @@
 import argparse, json, sys, sqlite3
 from pathlib import Path
 from .gate import check_draft, evaluate_text_with_raw_matches, load_rules
-from .store import insert_policy_check
+from .store import PolicyCheck, insert_policy_checks_bulk
+
+BATCH_SIZE = 500
 
 def main():
     ap = argparse.ArgumentParser(description="Policy gate CLI")
@@ -11,6 +13,7 @@ def main():
     ap.add_argument("--output", default="policy_gate_results.jsonl", help="Where to write decisions")
     ap.add_argument("--db", help="Optional SQLite DB to store policy_checks")
     ap.add_argument("--draft-scope", default="cli", help="Label for draft source")
+    ap.add_argument("--storage", choices=["legacy", "compact"], default="legacy", help="policy_checks storage layout")
     args = ap.parse_args()
 
     config_path = Path(args.config)
@@ -20,6 +23,7 @@ def main():
     n = 0
     conn = sqlite3.connect(args.db) if args.db else None
     rules = load_rules(config_path) if conn else None
+    pending = []
     with input_path.open() as f_in, out_path.open("w") as f_out:
         for line in f_in:
             if not line.strip():
@@ -36,16 +40,13 @@ def main():
             f_out.write(json.dumps(record) + "\n")
             if conn and rules:
                 eval_decision, raw_match = evaluate_text_with_raw_matches(text, rules)
-                insert_policy_check(
-                    conn,
-                    draft_scope=args.draft_scope,
-                    draft_text=text,
-                    decision=eval_decision,
-                    raw_match=raw_match,
-                )
+                pending.append(PolicyCheck(draft_text=text, decision=eval_decision, raw_match=raw_match))
+                if len(pending) >= BATCH_SIZE:
+                    insert_policy_checks_bulk(conn, pending, draft_scope=args.draft_scope, storage=args.storage)
+                    pending = []
             n += 1
     if conn:
-        conn.commit()
+        insert_policy_checks_bulk(conn, pending, draft_scope=args.draft_scope, storage=args.storage)
         conn.close()
 
     print(f"Wrote {n} decisions to {out_path}")
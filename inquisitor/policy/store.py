@@ -1,11 +1,45 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import sqlite3
-from typing import Any, Dict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Sequence
 
+from inquisitor.ingestion.db import MIGRATIONS_DIR, column_exists, migrate, table_exists
 from inquisitor.policy.gate import GateDecision
 
+# legacy: one policy_checks row per draft with JSON blobs (read by the verifiers)
+# compact: policy_checks_compact + policy_check_hits, drafts deduplicated by hash
+STORAGE_MODES = ("legacy", "compact")
+
+_LOOKUP_CHUNK = 500
+
+
+@dataclass
+class PolicyCheck:
+    draft_text: str
+    decision: GateDecision
+    raw_match: Dict[str, Any]
+
+
+_LEGACY_INSERT = """
+    INSERT INTO policy_checks (draft_scope, draft_text, allow, flags, reasons, raw_match)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+def _legacy_row(draft_scope: str, draft_text: str, decision: GateDecision, raw_match: Dict[str, Any]) -> tuple:
+    flags = [reason["id"] for reason in decision.reasons]
+    return (
+        draft_scope,
+        draft_text,
+        decision.decision == "allow",
+        json.dumps(flags),
+        json.dumps(decision.reasons),
+        json.dumps(raw_match),
+    )
+
 
 def insert_policy_check(
     conn: sqlite3.Connection,
@@ -15,18 +49,114 @@ def insert_policy_check(
     decision: GateDecision,
     raw_match: Dict[str, Any],
 ) -> None:
-    flags = [reason["id"] for reason in decision.reasons]
-    conn.execute(
-        """
-        INSERT INTO policy_checks (draft_scope, draft_text, allow, flags, reasons, raw_match)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """,
-        (
-            draft_scope,
-            draft_text,
-            decision.decision == "allow",
-            json.dumps(flags),
-            json.dumps(decision.reasons),
-            json.dumps(raw_match),
-        ),
+    conn.execute(_LEGACY_INSERT, _legacy_row(draft_scope, draft_text, decision, raw_match))
+
+
+def ensure_compact_tables(conn: sqlite3.Connection) -> None:
+    if not table_exists(conn, "policy_check_hits"):
+        migrate(conn, MIGRATIONS_DIR / "006_policy_checks_compact.sql")
+    if not column_exists(conn, "policy_checks_compact", "raw_match"):
+        migrate(conn, MIGRATIONS_DIR / "014_policy_check_hits_seq.sql")
+
+
+def insert_policy_checks_bulk(
+    conn: sqlite3.Connection,
+    checks: Iterable[PolicyCheck],
+    *,
+    draft_scope: str,
+    storage: str = "legacy",
+) -> int:
+    """Persist many gate decisions with ``executemany`` in one transaction.
+
+    Args:
+        conn (sqlite3.Connection): Open database connection.
+        checks (Iterable[PolicyCheck]): Drafts with their decisions and raw matches.
+        draft_scope (str): Label for the draft source.
+        storage (str, optional): ``"legacy"`` or ``"compact"``. Defaults to ``"legacy"``.
+
+    Returns:
+        int: Number of checks stored.
+    """
+    if storage not in STORAGE_MODES:
+        raise ValueError(f"Unknown storage mode {storage!r}; expected one of {STORAGE_MODES}")
+    checks = list(checks)
+    if not checks:
+        return 0
+    if storage == "compact":
+        ensure_compact_tables(conn)
+    with conn:
+        if storage == "legacy":
+            conn.executemany(
+                _LEGACY_INSERT,
+                [_legacy_row(draft_scope, c.draft_text, c.decision, c.raw_match) for c in checks],
+            )
+        else:
+            _insert_compact(conn, checks, draft_scope)
+    return len(checks)
+
+
+def _lookup_ids(conn: sqlite3.Connection, table: str, key_col: str, keys: Sequence[str]) -> Dict[str, int]:
+    ids: Dict[str, int] = {}
+    for i in range(0, len(keys), _LOOKUP_CHUNK):
+        chunk = keys[i : i + _LOOKUP_CHUNK]
+        marks = ",".join("?" * len(chunk))
+        cur = conn.execute(f"SELECT {key_col}, id FROM {table} WHERE {key_col} IN ({marks})", chunk)
+        ids.update(cur.fetchall())
+    return ids
+
+
+def _insert_compact(conn: sqlite3.Connection, checks: List[PolicyCheck], draft_scope: str) -> None:
+    hashes = [hashlib.sha256(c.draft_text.encode("utf-8")).hexdigest() for c in checks]
+    drafts = dict(zip(hashes, (c.draft_text for c in checks)))
+    conn.executemany(
+        "INSERT OR IGNORE INTO policy_drafts (text_sha256, draft_text) VALUES (?, ?)",
+        drafts.items(),
     )
+    draft_ids = _lookup_ids(conn, "policy_drafts", "text_sha256", list(drafts))
+
+    rules: Dict[str, tuple] = {}
+    for c in checks:
+        for reason in c.decision.reasons:
+            rules[reason["id"]] = (reason.get("category"), reason.get("action"), reason.get("weight"))
+    rule_ids: Dict[str, int] = {}
+    if rules:
+        conn.executemany(
+            """
+            INSERT INTO policy_rules (rule_key, category, action, weight) VALUES (?, ?, ?, ?)
+            ON CONFLICT(rule_key) DO UPDATE SET
+              category = excluded.category, action = excluded.action, weight = excluded.weight
+            """,
+            [(key, *meta) for key, meta in rules.items()],
+        )
+        rule_ids = _lookup_ids(conn, "policy_rules", "rule_key", list(rules))
+
+    hit_rows = []
+    for c, h in zip(checks, hashes):
+        check_id = conn.execute(
+            "INSERT INTO policy_checks_compact (draft_scope, draft_id, decision, raw_match) VALUES (?, ?, ?, ?)",
+            (draft_scope, draft_ids[h], c.decision.decision, json.dumps(c.raw_match)),
+        ).lastrowid
+        # Every hit is kept, in order: a rule id may fire more than once per check
+        for seq, reason in enumerate(c.decision.reasons):
+            hit_rows.append((check_id, seq, rule_ids[reason["id"]], reason.get("snippet")))
+    conn.executemany(
+        "INSERT INTO policy_check_hits (check_id, seq, rule_id, snippet) VALUES (?, ?, ?, ?)",
+        hit_rows,
+    )
+
+
+def rule_hit_counts(conn: sqlite3.Connection, *, storage: str = "legacy") -> Dict[str, int]:
+    """Count how many stored checks each policy rule fired on."""
+    if storage == "compact":
+        cur = conn.execute(
+            """
+            SELECT r.rule_key, COUNT(*)
+            FROM policy_check_hits h JOIN policy_rules r ON r.id = h.rule_id
+            GROUP BY h.rule_id
+            """
+        )
+    else:
+        cur = conn.execute(
+            "SELECT f.value, COUNT(*) FROM policy_checks, json_each(policy_checks.flags) f GROUP BY f.value"
+        )
+    return dict(cur.fetchall())
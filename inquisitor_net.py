@@ -1,9 +1,15 @@
 # InquisitorNet - Warhammer 40K Inquisitor Bot Network
 # Starter Codebase - Phase 1 Implementation
 # -- Generated by Claude Sonnet 4 ... thanks Claude!
+#
+# praw, openai, apscheduler and dotenv are imported on first use so that
+# tools importing this module (e.g. for HeresyScanner or the templates) do
+# not pay for the full Reddit/OpenAI client stacks.
+from __future__ import annotations
+
 import os
-import praw
-import openai
+import re
+import asyncio
 import json
 import sqlite3
 import base64
@@ -11,49 +17,103 @@ import random
 import time
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
-from apscheduler.schedulers.background import BackgroundScheduler
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
+from core.async_runtime import AsyncBotRuntime
+from core.llm_cache import LLMResponseCache
+from core.llm_client import LLMError, LLMPool, LLMRequest, OpenAIProvider
+from core.reddit_cache import ListingCache, ListingSource, PrawListingSource
+from inquisitor.ingestion.detector import DetectorEngine, compile_rules, judge_items, write_verdicts
 
-from dotenv import load_dotenv
-load_dotenv()
+if TYPE_CHECKING:
+    import praw
 
 
+logger = logging.getLogger(__name__)
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('inquisitor_net.log'),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger(__name__)
+def _configure_logging():
+    """Configure root logging for the long-running network process."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('inquisitor_net.log'),
+            logging.StreamHandler()
+        ]
+    )
+
+
+def _load_env():
+    """Load variables from a .env file, if python-dotenv is installed."""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv()
+
+
+class _Env:
+    """Config attribute read from the environment at access time."""
+
+    def __init__(self, name: str, default: Optional[str] = None, cast: Callable = str):
+        self.name = name
+        self.default = default
+        self.cast = cast
+
+    def __get__(self, obj, owner):
+        value = os.getenv(self.name, self.default)
+        return self.cast(value) if value is not None else None
 
 # Configuration
 class Config:
     """Configuration class for InquisitorNet"""
     
     # Reddit API Configuration
-    REDDIT_CLIENT_ID = os.getenv('REDDIT_CLIENT_ID')
-    REDDIT_CLIENT_SECRET = os.getenv('REDDIT_CLIENT_SECRET')
-    REDDIT_USER_AGENT = os.getenv('REDDIT_USER_AGENT', 'InquisitorNet v1.0')
+    REDDIT_CLIENT_ID = _Env('REDDIT_CLIENT_ID')
+    REDDIT_CLIENT_SECRET = _Env('REDDIT_CLIENT_SECRET')
+    REDDIT_USER_AGENT = _Env('REDDIT_USER_AGENT', 'InquisitorNet v1.0')
     
     # OpenAI Configuration
-    OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
-    OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo')
+    OPENAI_API_KEY = _Env('OPENAI_API_KEY')
+    OPENAI_MODEL = _Env('OPENAI_MODEL', 'gpt-3.5-turbo')
+    LLM_MAX_CONCURRENCY = _Env('LLM_MAX_CONCURRENCY', '4', int)
+    LLM_TIMEOUT = _Env('LLM_TIMEOUT', '30', float)  # seconds per attempt
+    LLM_MAX_RETRIES = _Env('LLM_MAX_RETRIES', '3', int)
+    LLM_CACHE_PATH = _Env('LLM_CACHE_PATH')  # defaults to DATABASE_PATH
+    LLM_CACHE_TTL = _Env('LLM_CACHE_TTL', '604800', float)  # seconds; 0 disables the response cache
+    LLM_CACHE_MAX_ENTRIES = _Env('LLM_CACHE_MAX_ENTRIES', '5000', int)
     
     # Bot Configuration
-    SUBREDDIT_NAME = os.getenv('SUBREDDIT_NAME', 'OrdoImperialis')
-    POST_COOLDOWN = int(os.getenv('POST_COOLDOWN', '3600'))  # 1 hour in seconds
-    MAX_DAILY_POSTS = int(os.getenv('MAX_DAILY_POSTS', '5'))
+    SUBREDDIT_NAME = _Env('SUBREDDIT_NAME', 'OrdoImperialis')
+    POST_COOLDOWN = _Env('POST_COOLDOWN', '3600', int)  # 1 hour in seconds
+    MAX_DAILY_POSTS = _Env('MAX_DAILY_POSTS', '5', int)
+    
+    # Activity ticks: every ACTIVITY_INTERVAL_MINUTES plus up to ACTIVITY_JITTER_MINUTES
+    ACTIVITY_INTERVAL_MINUTES = _Env('ACTIVITY_INTERVAL_MINUTES', '30', int)
+    ACTIVITY_JITTER_MINUTES = _Env('ACTIVITY_JITTER_MINUTES', '60', int)
+    ACTIVITY_MAX_ACTIONS = _Env('ACTIVITY_MAX_ACTIONS', '3', int)  # bots acting per tick
+    ACTIVITY_WORKERS = _Env('ACTIVITY_WORKERS', '3', int)
+    ACTIVITY_REPLY_CHANCE = _Env('ACTIVITY_REPLY_CHANCE', '0.5', float)
+    ACTIVITY_LISTING_LIMIT = _Env('ACTIVITY_LISTING_LIMIT', '5', int)
+    
+    # 'threads' (APScheduler ticks) or 'asyncio' (one task per bot on one event loop)
+    RUNTIME = _Env('RUNTIME', 'threads')
+    RUNTIME_IO_WORKERS = _Env('RUNTIME_IO_WORKERS', '16', int)  # threads for blocking bot I/O in asyncio mode
+    
+    # Shared cache of subreddit listings and submissions
+    REDDIT_CACHE_TTL = _Env('REDDIT_CACHE_TTL', '120', float)  # seconds
+    REDDIT_CACHE_MAX_ENTRIES = _Env('REDDIT_CACHE_MAX_ENTRIES', '512', int)
     
     # Database
-    DATABASE_PATH = os.getenv('DATABASE_PATH', 'inquisitor_net.db')
+    DATABASE_PATH = _Env('DATABASE_PATH', 'inquisitor_net.db')
+    MEMORY_BUFFER_SIZE = _Env('MEMORY_BUFFER_SIZE', '50', int)  # recent memories held in process per bot
+    MEMORY_KEEP = _Env('MEMORY_KEEP', '100', int)  # per bot; older memories are rolled into memory_summaries
 
 @dataclass
 class InquisitorPersonality:
@@ -76,11 +136,40 @@ class BotMemory:
     context: str
     response_generated: bool = False
 
+@dataclass
+class PlannedActivity:
+    """One bot action scheduled for an activity tick"""
+    bot_name: str
+    action: str  # 'reply' or 'post'
+    post_id: Optional[str] = None
+
+@dataclass(frozen=True)
+class HeresyScan:
+    """HeresyScanner result for one text"""
+    score: int                 # (category, keyword) pairs present
+    category: Optional[str]    # first category, in definition order, with a hit
+    keywords: Tuple[str, ...]  # distinct keywords found, in definition order
+
+def _digest_memories(memories: List[BotMemory]) -> str:
+    """Plain-text summary of compacted memories: one line per memory context"""
+    lines = [f"{m.timestamp} {m.context or m.content[:80]}" for m in memories]
+    return "\n".join(lines)[:4000]
+
 class DatabaseManager:
-    """Handles all database operations"""
+    """Handles all database operations
     
-    def __init__(self, db_path: str):
+    The newest memories of each bot are also kept in an in-process ring
+    buffer, so prompt building reads them without a query. The buffer only
+    sees this process's writes.
+    """
+    
+    def __init__(self, db_path: str, memory_buffer_size: Optional[int] = None):
         self.db_path = db_path
+        self.memory_buffer_size = memory_buffer_size or Config.MEMORY_BUFFER_SIZE
+        # bot_name -> newest memories first; _complete holds bots whose buffer has every stored memory
+        self._recent: Dict[str, deque] = {}
+        self._complete: set = set()
+        self._memory_lock = threading.Lock()
         self.init_database()
     
     def init_database(self):
@@ -112,6 +201,24 @@ class DatabaseManager:
                 response_generated BOOLEAN DEFAULT FALSE
             )
         ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_bot_memory_bot_time
+            ON bot_memory (bot_name, timestamp)
+        ''')
+        
+        # Compacted memories: one row per maintenance run and bot (migrations/001_init.sql
+        # already has an unrelated `summaries` table when both schemas share a database)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS memory_summaries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                bot_name TEXT NOT NULL,
+                period_start DATETIME NOT NULL,
+                period_end DATETIME NOT NULL,
+                memory_count INTEGER NOT NULL,
+                content TEXT NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
         
         # Heresy investigations (for Phase 2)
         cursor.execute('''
@@ -142,24 +249,57 @@ class DatabaseManager:
     
     def store_memory(self, bot_name: str, memory: BotMemory):
         """Store bot memory"""
+        # Same format and clock (UTC) as the column default, so buffered and queried memories agree
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime())
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         cursor.execute('''
-            INSERT INTO bot_memory (bot_name, post_id, content, context)
-            VALUES (?, ?, ?, ?)
-        ''', (bot_name, memory.post_id, memory.content, memory.context))
+            INSERT INTO bot_memory (bot_name, post_id, content, timestamp, context)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (bot_name, memory.post_id, memory.content, timestamp, memory.context))
         conn.commit()
         conn.close()
+        
+        with self._memory_lock:
+            buffer = self._recent.get(bot_name)
+            if buffer is not None:
+                if len(buffer) == buffer.maxlen:
+                    self._complete.discard(bot_name)
+                buffer.appendleft(BotMemory(
+                    post_id=memory.post_id,
+                    content=memory.content,
+                    timestamp=timestamp,
+                    author=bot_name,
+                    context=memory.context
+                ))
     
     def get_recent_memories(self, bot_name: str, limit: int = 10) -> List[BotMemory]:
-        """Retrieve recent memories for a bot"""
+        """Retrieve recent memories for a bot, newest first"""
+        with self._memory_lock:
+            buffer = self._recent.get(bot_name)
+            if buffer is not None and (limit <= len(buffer) or bot_name in self._complete):
+                return list(buffer)[:limit]
+        
+        if buffer is None:
+            # First read for this bot: fill its buffer. Under the lock, so no
+            # memory stored meanwhile is missed.
+            with self._memory_lock:
+                if bot_name not in self._recent:
+                    memories = self._query_memories(bot_name, self.memory_buffer_size)
+                    self._recent[bot_name] = deque(memories, maxlen=self.memory_buffer_size)
+                    if len(memories) < self.memory_buffer_size:
+                        self._complete.add(bot_name)
+            return self.get_recent_memories(bot_name, limit)
+        return self._query_memories(bot_name, limit)
+    
+    def _query_memories(self, bot_name: str, limit: int) -> List[BotMemory]:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         cursor.execute('''
             SELECT post_id, content, timestamp, context
             FROM bot_memory
             WHERE bot_name = ?
-            ORDER BY timestamp DESC
+            ORDER BY timestamp DESC, id DESC
             LIMIT ?
         ''', (bot_name, limit))
         
@@ -175,6 +315,62 @@ class DatabaseManager:
         
         conn.close()
         return memories
+    
+    def compact_memories(self, keep: int = 100,
+                         summarize: Callable[[List[BotMemory]], str] = _digest_memories) -> int:
+        """Roll each bot's memories beyond the newest ``keep`` into one ``memory_summaries`` row
+        
+        Args:
+            keep (int): Memories left in ``bot_memory`` per bot.
+            summarize (Callable, optional): Builds the summary text from the
+                compacted memories, oldest first.
+        
+        Returns:
+            int: Number of memories compacted.
+        """
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        compacted = 0
+        try:
+            bots = [row[0] for row in cursor.execute(
+                'SELECT bot_name FROM bot_memory GROUP BY bot_name HAVING COUNT(*) > ?', (keep,)
+            )]
+            for bot_name in bots:
+                # Everything older than the newest `keep`, walking the (bot_name, timestamp) index
+                rows = cursor.execute('''
+                    SELECT id, post_id, content, timestamp, context
+                    FROM bot_memory
+                    WHERE bot_name = ?
+                    ORDER BY timestamp DESC, id DESC
+                    LIMIT -1 OFFSET ?
+                ''', (bot_name, keep)).fetchall()
+                rows.reverse()
+                memories = [BotMemory(post_id=r[1], content=r[2], timestamp=r[3], author=bot_name, context=r[4])
+                            for r in rows]
+                cursor.execute('''
+                    INSERT INTO memory_summaries (bot_name, period_start, period_end, memory_count, content)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (bot_name, rows[0][3], rows[-1][3], len(rows), summarize(memories)))
+                cursor.executemany('DELETE FROM bot_memory WHERE id = ?', [(r[0],) for r in rows])
+                compacted += len(rows)
+            conn.commit()
+        finally:
+            conn.close()
+        
+        if bots and keep < self.memory_buffer_size:
+            # Buffers may hold memories that are now summarized; reload on next read
+            with self._memory_lock:
+                for bot_name in bots:
+                    self._recent.pop(bot_name, None)
+                    self._complete.discard(bot_name)
+        return compacted
+
+@lru_cache(maxsize=26)
+def _caesar_table(shift: int) -> bytes:
+    """Translation table rotating ASCII letters by ``shift`` (0-25)"""
+    upper = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    lower = upper.lower()
+    return bytes.maketrans(upper + lower, upper[shift:] + upper[:shift] + lower[shift:] + lower[:shift])
 
 class EncryptionModule:
     """Handles encryption/decryption of sensitive messages"""
@@ -182,14 +378,17 @@ class EncryptionModule:
     @staticmethod
     def caesar_cipher(text: str, shift: int) -> str:
         """Simple Caesar cipher encryption"""
-        result = ""
+        if text.isascii():
+            return text.encode('ascii').translate(_caesar_table(shift % 26)).decode('ascii')
+        # Non-ASCII letters also pass isalpha(); keep their original (ASCII-folding) mapping.
+        result = []
         for char in text:
             if char.isalpha():
                 ascii_offset = ord('A') if char.isupper() else ord('a')
-                result += chr((ord(char) - ascii_offset + shift) % 26 + ascii_offset)
+                result.append(chr((ord(char) - ascii_offset + shift) % 26 + ascii_offset))
             else:
-                result += char
-        return result
+                result.append(char)
+        return ''.join(result)
     
     @staticmethod
     def base64_encode(text: str) -> str:
@@ -213,23 +412,68 @@ class EncryptionModule:
             return f"[ENCRYPTED-BASE64]: {EncryptionModule.base64_encode(text)}"
         return text
 
+def _default_llm_cache() -> Optional[LLMResponseCache]:
+    """Response cache from Config (LLM_CACHE_PATH, LLM_CACHE_TTL, LLM_CACHE_MAX_ENTRIES), or None if disabled."""
+    if Config.LLM_CACHE_TTL <= 0:
+        return None
+    return LLMResponseCache(
+        Config.LLM_CACHE_PATH or Config.DATABASE_PATH,
+        ttl_seconds=Config.LLM_CACHE_TTL,
+        max_entries=Config.LLM_CACHE_MAX_ENTRIES
+    )
+
+def _default_listing_cache(source: Optional[ListingSource] = None) -> ListingCache:
+    """Listing cache sized from Config (REDDIT_CACHE_TTL, REDDIT_CACHE_MAX_ENTRIES)"""
+    return ListingCache(source, ttl_seconds=Config.REDDIT_CACHE_TTL, max_entries=Config.REDDIT_CACHE_MAX_ENTRIES)
+
+def _default_openai_provider(client=None) -> OpenAIProvider:
+    """OpenAI provider whose request timeout and blocking-call threads match the pool's (LLM_TIMEOUT, LLM_MAX_CONCURRENCY)."""
+    return OpenAIProvider(client=client, api_key=Config.OPENAI_API_KEY, timeout=Config.LLM_TIMEOUT,
+                          max_workers=Config.LLM_MAX_CONCURRENCY)
+
+def _default_llm_pool(provider, cache: Optional[LLMResponseCache] = None) -> LLMPool:
+    """LLM pool sized from Config (LLM_MAX_CONCURRENCY, LLM_TIMEOUT, LLM_MAX_RETRIES)."""
+    return LLMPool(
+        provider,
+        max_concurrency=Config.LLM_MAX_CONCURRENCY,
+        timeout=Config.LLM_TIMEOUT,
+        max_retries=Config.LLM_MAX_RETRIES,
+        cache=cache
+    )
+
 class InquisitorBot:
     """Individual Inquisitor bot with personality and behavior"""
     
     def __init__(self, personality: InquisitorPersonality, reddit_credentials: Dict, 
-                 openai_client, db_manager: DatabaseManager):
+                 openai_client, db_manager: DatabaseManager, llm_pool: Optional[LLMPool] = None,
+                 listing_cache: Optional[ListingCache] = None):
         self.personality = personality
         self.reddit = self._init_reddit(reddit_credentials)
+        # Reads (listings, post context) may come from a cache shared with other bots;
+        # writes always use this bot's own Reddit connection.
+        self.listing_cache = listing_cache or _default_listing_cache(PrawListingSource(self.reddit))
         self.openai_client = openai_client
+        # Bots managed by InquisitorNetworkManager share one pool (and its concurrency cap);
+        # a standalone bot builds its own and releases it in close().
+        self._owns_llm = llm_pool is None
+        self.llm = llm_pool if llm_pool is not None else _default_llm_pool(_default_openai_provider(openai_client))
         self.db_manager = db_manager
+        self._persona_prefix = self._build_persona_prefix()
         self.last_post_time = datetime.now() - timedelta(hours=2)
         self.daily_post_count = 0
         self.daily_reset_time = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
         
         logger.info(f"Initialized Inquisitor {self.personality.name} of {self.personality.ordo}")
     
+    def close(self):
+        """Shut down the LLM pool if this bot created it; a shared pool is left to its owner"""
+        if self._owns_llm:
+            self.llm.close()
+    
     def _init_reddit(self, credentials: Dict) -> praw.Reddit:
         """Initialize Reddit API connection"""
+        import praw
+
         return praw.Reddit(
             client_id=credentials['client_id'],
             client_secret=credentials['client_secret'],
@@ -255,9 +499,9 @@ class InquisitorBot:
         
         return cooldown_met and daily_limit_ok
     
-    def generate_prompt(self, context: str, action_type: str) -> str:
-        """Generate personality-appropriate prompt for OpenAI"""
-        personality_desc = (
+    def _build_persona_prefix(self) -> str:
+        """Persona part of every prompt; built once since the personality is fixed"""
+        return (
             f"You are {self.personality.name}, an Inquisitor of the {self.personality.ordo}."
             f"You are a {self.personality.philosophy} who believes in the absolute authority of the God-Emperor."
             f"Personality traits: {', '.join(self.personality.traits)}"
@@ -268,27 +512,29 @@ class InquisitorBot:
             f"- Consistent with your puritan/radical philosophy"
             f"- Suspicious of heresy and xenos influence"
             f"- Appropriately dramatic and grim"
+        )
+
+    def generate_prompt(self, context: str, action_type: str) -> str:
+        """Generate personality-appropriate prompt for OpenAI"""
+        return (
+            f"{self._persona_prefix}"
             f"Context: {context}"
             f"Action: {action_type}"
             f"Generate a response that is 2-3 paragraphs long and maintains character throughout."
         )
-
-        return personality_desc
     
     def generate_response(self, prompt: str) -> str:
-        """Generate response using OpenAI API"""
+        """Generate response through the pooled LLM client"""
+        request = LLMRequest.chat(
+            Config.OPENAI_MODEL,
+            "You are a Warhammer 40K Inquisitor. Stay in character.",
+            prompt,
+            max_tokens=500,
+            temperature=0.8
+        )
         try:
-            response = self.openai_client.chat.completions.create(
-                model=Config.OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": "You are a Warhammer 40K Inquisitor. Stay in character."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=500,
-                temperature=0.8
-            )
-            return response.choices[0].message.content.strip()
-        except Exception as e:
+            return self.llm.complete(request)
+        except LLMError as e:
             logger.error(f"OpenAI API error: {e}")
             return self._generate_fallback_response()
     
@@ -375,10 +621,10 @@ class InquisitorBot:
             return None
         
         try:
-            submission = self.reddit.submission(id=post_id)
+            post = self.listing_cache.submission(post_id)
             
             # Get context from original post
-            context = f"Original post by {submission.author}: {submission.selftext[:200]}..."
+            context = f"Original post by {post.author}: {post.selftext[:200]}..."
             
             # Generate reply
             prompt = self.generate_prompt(
@@ -392,8 +638,8 @@ class InquisitorBot:
             if self.should_encrypt_message(reply_content):
                 reply_content = EncryptionModule.encrypt_message(reply_content)
             
-            # Post reply
-            comment = submission.reply(reply_content)
+            # Post reply (a lazy submission object, so no extra fetch)
+            comment = self.reddit.submission(id=post_id).reply(reply_content)
             
             # Update tracking
             self.last_post_time = datetime.now()
@@ -452,11 +698,19 @@ class InquisitorBot:
 class InquisitorNetworkManager:
     """Manages the entire network of Inquisitor bots"""
     
-    def __init__(self):
+    def __init__(self, listing_source: Optional[ListingSource] = None, openai_client=None):
         self.db_manager = DatabaseManager(Config.DATABASE_PATH)
-        self.openai_client = openai.OpenAI(api_key=Config.OPENAI_API_KEY)
+        # An injected OpenAI client is used as is; otherwise one is built from OPENAI_API_KEY on first use.
+        self.openai_client = openai_client
+        # Repeated (persona, topic) prompts are served from the cache shared by all bots.
+        self.llm_cache = _default_llm_cache()
+        self.llm_pool = _default_llm_pool(_default_openai_provider(openai_client), cache=self.llm_cache)
+        # Without an explicit source, the first bot's Reddit connection feeds the cache.
+        self.listing_cache = _default_listing_cache(listing_source)
         self.bots: Dict[str, InquisitorBot] = {}
-        self.scheduler = BackgroundScheduler()
+        # Created by start_network (the pool also on a direct _activity_tick); the asyncio runtime uses neither
+        self.scheduler = None
+        self.activity_pool: Optional[ThreadPoolExecutor] = None
         self.running = False
         
         # Initialize personalities
@@ -532,7 +786,10 @@ class InquisitorNetworkManager:
             return
         
         personality = self.personalities[bot_name]
-        bot = InquisitorBot(personality, reddit_credentials, self.openai_client, self.db_manager)
+        bot = InquisitorBot(personality, reddit_credentials, self.openai_client, self.db_manager,
+                            llm_pool=self.llm_pool, listing_cache=self.listing_cache)
+        if self.listing_cache.source is None:
+            self.listing_cache.source = PrawListingSource(bot.reddit)
         self.bots[bot_name] = bot
         
         logger.info(f"Added bot: {bot_name}")
@@ -543,14 +800,19 @@ class InquisitorNetworkManager:
             logger.warning("Network already running")
             return
         
+        from apscheduler.schedulers.background import BackgroundScheduler
+
         self.running = True
+        self.scheduler = BackgroundScheduler()
+        self._ensure_activity_pool()
         
-        # Schedule random bot activities
+        # Schedule activity ticks; the jitter is drawn afresh for every tick
         self.scheduler.add_job(
-            self._random_bot_activity,
+            self._activity_tick,
             'interval',
-            minutes=random.randint(30, 90),
-            id='random_activity'
+            minutes=Config.ACTIVITY_INTERVAL_MINUTES,
+            jitter=Config.ACTIVITY_JITTER_MINUTES * 60,
+            id='activity_tick'
         )
         
         # Schedule daily maintenance
@@ -572,47 +834,85 @@ class InquisitorNetworkManager:
         
         self.running = False
         self.scheduler.shutdown()
+        self.scheduler = None
+        self.close()
         logger.info("InquisitorNet network stopped")
     
-    def _random_bot_activity(self):
-        """Trigger random bot activity"""
-        if not self.bots:
-            return
-        
-        available_bots = [bot for bot in self.bots.values() if bot.can_post()]
-        if not available_bots:
+    def close(self):
+        """Release the activity pool, LLM pool and response cache"""
+        if self.activity_pool is not None:
+            self.activity_pool.shutdown(wait=True)
+            self.activity_pool = None
+        self.llm_pool.close()
+        if self.llm_cache is not None:
+            self.llm_cache.close()
+    
+    def async_runtime(self) -> AsyncBotRuntime:
+        """Event-loop alternative to start_network: each bot is a task, blocking I/O shares RUNTIME_IO_WORKERS threads"""
+        return AsyncBotRuntime(
+            self,
+            subreddit=Config.SUBREDDIT_NAME,
+            interval=Config.ACTIVITY_INTERVAL_MINUTES * 60,
+            jitter=Config.ACTIVITY_JITTER_MINUTES * 60,
+            listing_limit=Config.ACTIVITY_LISTING_LIMIT,
+            workers=Config.RUNTIME_IO_WORKERS
+        )
+    
+    def _plan_activity_tick(self, eligible: List[str], listing: List[str]) -> List[PlannedActivity]:
+        """Give each eligible bot (up to ACTIVITY_MAX_ACTIONS) one action for this tick"""
+        chosen = random.sample(eligible, min(len(eligible), Config.ACTIVITY_MAX_ACTIONS))
+        # Each post in the shared listing is replied to by at most one bot per tick
+        unclaimed = random.sample(listing, len(listing))
+        plan = []
+        for bot_name in chosen:
+            if unclaimed and random.random() < Config.ACTIVITY_REPLY_CHANCE:
+                plan.append(PlannedActivity(bot_name, 'reply', unclaimed.pop()))
+            else:
+                plan.append(PlannedActivity(bot_name, 'post'))
+        return plan
+    
+    def _run_activity(self, activity: PlannedActivity) -> Optional[str]:
+        """Carry out one planned action with the bot's own Reddit connection"""
+        bot = self.bots[activity.bot_name]
+        if activity.action == 'reply':
+            return bot.reply_to_post(activity.post_id, Config.SUBREDDIT_NAME)
+        return bot.create_post(Config.SUBREDDIT_NAME)
+    
+    def _ensure_activity_pool(self) -> ThreadPoolExecutor:
+        if self.activity_pool is None:
+            self.activity_pool = ThreadPoolExecutor(max_workers=Config.ACTIVITY_WORKERS,
+                                                    thread_name_prefix='bot-activity')
+        return self.activity_pool
+    
+    def _activity_tick(self) -> List[PlannedActivity]:
+        """Plan and run one tick of bot activity across all eligible bots"""
+        eligible = [name for name, bot in self.bots.items() if bot.can_post()]
+        if not eligible:
             logger.info("No bots available for posting")
-            return
-        
-        # Select random bot
-        bot = random.choice(available_bots)
+            return []
         
-        # Get recent posts to potentially reply to
-        recent_posts = self._get_recent_posts(Config.SUBREDDIT_NAME, limit=5)
+        # One listing fetch per tick, shared by every bot that acts in it
+        listing = self._get_recent_posts(Config.SUBREDDIT_NAME, limit=Config.ACTIVITY_LISTING_LIMIT)
+        plan = self._plan_activity_tick(eligible, listing)
         
-        if recent_posts and random.choice([True, False]):
-            # Reply to existing post
-            post_id = random.choice(recent_posts)
-            bot.reply_to_post(post_id, Config.SUBREDDIT_NAME)
-        else:
-            # Create new post
-            bot.create_post(Config.SUBREDDIT_NAME)
+        pool = self._ensure_activity_pool()
+        futures = [pool.submit(self._run_activity, activity) for activity in plan]
+        succeeded = 0
+        for activity, future in zip(plan, futures):
+            try:
+                succeeded += future.result() is not None
+            except Exception as e:
+                logger.error(f"Activity {activity.action} for {activity.bot_name} failed: {e}")
+        logger.info(f"Activity tick: {succeeded}/{len(plan)} actions completed")
+        return plan
     
     def _get_recent_posts(self, subreddit_name: str, limit: int = 10) -> List[str]:
         """Get recent post IDs from subreddit"""
         try:
-            if not self.bots:
+            if self.listing_cache.source is None:
                 return []
             
-            # Use first bot's reddit connection
-            bot = list(self.bots.values())[0]
-            subreddit = bot.reddit.subreddit(subreddit_name)
-            
-            post_ids = []
-            for submission in subreddit.new(limit=limit):
-                post_ids.append(submission.id)
-            
-            return post_ids
+            return [post.id for post in self.listing_cache.new(subreddit_name, limit=limit)]
             
         except Exception as e:
             logger.error(f"Error getting recent posts: {e}")
@@ -622,8 +922,17 @@ class InquisitorNetworkManager:
         """Perform daily maintenance tasks"""
         logger.info("Running daily maintenance")
         
-        # Clean up old memories (keep last 100 per bot)
-        # This would be implemented based on your needs
+        compacted = self.db_manager.compact_memories(keep=Config.MEMORY_KEEP)
+        logger.info(f"Compacted {compacted} memories into summaries")
+        
+        if self.llm_cache is not None:
+            stats = self.llm_cache.stats
+            logger.info(f"LLM cache: {stats.hits} hits, {stats.misses} misses "
+                        f"({stats.hit_rate:.0%}), {stats.evictions} evicted")
+        
+        stats = self.listing_cache.stats
+        logger.info(f"Listing cache: {stats.hits} hits, {stats.misses} misses "
+                    f"({stats.hit_rate:.0%}), {stats.evictions} evicted")
         
         # Generate status report
         total_posts = len(self.bots) * Config.MAX_DAILY_POSTS
@@ -631,6 +940,8 @@ class InquisitorNetworkManager:
 
 def main():
     """Main function to run the InquisitorNet"""
+    _load_env()
+    _configure_logging()
     
     # Check required environment variables
     required_vars = ['REDDIT_CLIENT_ID', 'REDDIT_CLIENT_SECRET', 'OPENAI_API_KEY']
@@ -676,6 +987,17 @@ def main():
         logger.error("No bots could be initialized. Check your credentials.")
         return
     
+    if Config.RUNTIME == 'asyncio':
+        logger.info("InquisitorNet is now running on the asyncio runtime...")
+        try:
+            asyncio.run(network.async_runtime().run())
+        except KeyboardInterrupt:
+            logger.info("Shutting down InquisitorNet...")
+        finally:
+            network.close()
+        logger.info("InquisitorNet stopped.")
+        return
+    
     try:
         # Start the network
         network.start_network()
@@ -700,11 +1022,19 @@ if __name__ == "__main__":
 # Additional utility functions and classes
 
 class HeresyScanner:
-    """Phase 2 functionality - Scans for heretical content in target subreddits"""
+    """Phase 2 functionality - Scans for heretical content in target subreddits
+
+    Text is scored with the pipeline's DetectorEngine, and record_verdicts stores
+    scan results through the same batched writes as the detector job.
+    """
     
-    def __init__(self, reddit_client, db_manager: DatabaseManager):
+    def __init__(self, reddit_client, db_manager: DatabaseManager, listing_cache: Optional[ListingCache] = None,
+                 word_boundary: bool = False):
         self.reddit = reddit_client
+        self.word_boundary = word_boundary
         self.db_manager = db_manager
+        # Pass the network's cache to share listings with the bots
+        self.listing_cache = listing_cache or _default_listing_cache(PrawListingSource(reddit_client))
         self.target_subreddits = [
             'Warhammer40k',
             'Grimdank',
@@ -733,19 +1063,18 @@ class HeresyScanner:
         heretical_posts = []
         
         try:
-            subreddit = self.reddit.subreddit(subreddit_name)
-            
-            for submission in subreddit.new(limit=limit):
-                heresy_score = self._calculate_heresy_score(submission.title + " " + submission.selftext)
+            for submission in self.listing_cache.new(subreddit_name, limit=limit):
+                scan = self._scan(submission.title + " " + submission.selftext)
+                heresy_score = scan.score
                 
                 if heresy_score > 0:
                     heretical_posts.append({
                         'post_id': submission.id,
                         'title': submission.title,
-                        'author': str(submission.author),
+                        'author': submission.author,
                         'content': submission.selftext,
                         'heresy_score': heresy_score,
-                        'heresy_type': self._classify_heresy(submission.title + " " + submission.selftext),
+                        'heresy_type': scan.category or 'general_heresy',
                         'url': submission.url,
                         'subreddit': subreddit_name
                     })
@@ -756,28 +1085,79 @@ class HeresyScanner:
             logger.error(f"Error scanning subreddit {subreddit_name}: {e}")
             return []
     
-    def _calculate_heresy_score(self, text: str) -> int:
-        """Calculate how heretical a piece of text is"""
-        text_lower = text.lower()
-        score = 0
-        
+    def _rules(self) -> List[Dict]:
+        """heresy_keywords as detector rules: one weight-1 rule per (category, keyword)"""
+        rules = []
         for category, keywords in self.heresy_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    score += 1
+            for n, keyword in enumerate(keywords):
+                pattern = re.escape(keyword)
+                if self.word_boundary:
+                    pattern = rf"\b{pattern}\b"
+                rules.append({'id': f"{category}.{n}", 'name': category, 'pattern': "(?i)" + pattern,
+                              'weight': 1.0})
+        return rules
+    
+    def _scan(self, text: str) -> HeresyScan:
+        """Score and classify text with the shared detector engine"""
+        if (getattr(self, '_engine_keywords', None) != list(self.heresy_keywords.items())
+                or self._engine_word_boundary != self.word_boundary):
+            # (Re)compile when heresy_keywords has been edited
+            self._engine = DetectorEngine(compile_rules(self._rules()))
+            self._rule_keywords = {
+                f"{category}.{n}": (category, keyword)
+                for category, keywords in self.heresy_keywords.items()
+                for n, keyword in enumerate(keywords)
+            }
+            # Copied, so edits in place to a category's list are noticed too
+            self._engine_keywords = [(category, list(keywords)) for category, keywords in self.heresy_keywords.items()]
+            self._engine_word_boundary = self.word_boundary
+        matched = self._engine.evaluate(text).matched
+        if not matched:
+            return HeresyScan(0, None, ())
+        hits = [self._rule_keywords[rule_id] for rule_id in matched]
+        return HeresyScan(len(hits), hits[0][0], tuple(dict.fromkeys(keyword for _, keyword in hits)))
+    
+    def record_verdicts(self, conn: sqlite3.Connection, posts: List[Dict],
+                        th_mark: float = 0.65, th_acquit: float = 0.35) -> Tuple[int, int]:
+        """Judge scanned posts into detector_marks / detector_acquittals
         
-        return score
+        Posts are stored as scrape_hits first (the verdict tables reference them);
+        posts that already have a verdict are skipped.
+        
+        Args:
+            conn (sqlite3.Connection): Connection to the migrated pipeline database.
+            posts (List[Dict]): Results of scan_subreddit.
+            th_mark (float, optional): Score at or above which a post is marked.
+            th_acquit (float, optional): Score at or below which a post is acquitted.
+        
+        Returns:
+            Tuple[int, int]: Number of posts marked and acquitted.
+        """
+        self._scan('')  # make sure the engine matches heresy_keywords
+        items = [(f"t3_{post['post_id']}", post['subreddit'], f"{post['title']} {post['content']}",
+                  json.dumps({'title': post['title'], 'url': post['url'], 'source': 'heresy_scanner'}))
+                 for post in posts]
+        cur = conn.cursor()
+        cur.executemany('''
+            INSERT OR IGNORE INTO scrape_hits (item_id, subreddit, author_token, body, post_meta_json)
+            VALUES (?, ?, '[USER-REDACTED]', ?, ?)
+        ''', items)
+        judged = {row[0] for row in cur.execute(
+            'SELECT item_id FROM detector_marks UNION SELECT item_id FROM detector_acquittals'
+        )}
+        marks, acquittals = judge_items(self._engine, (item for item in items if item[0] not in judged),
+                                        th_mark, th_acquit)
+        write_verdicts(cur, marks, acquittals)
+        conn.commit()
+        return len(marks), len(acquittals)
+    
+    def _calculate_heresy_score(self, text: str) -> int:
+        """Calculate how heretical a piece of text is"""
+        return self._scan(text).score
     
     def _classify_heresy(self, text: str) -> str:
         """Classify the type of heresy detected"""
-        text_lower = text.lower()
-        
-        for category, keywords in self.heresy_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    return category
-        
-        return 'general_heresy'
+        return self._scan(text).category or 'general_heresy'
 
 class InquisitorResponseTemplates:
     """Templates for generating more authentic Inquisitor responses"""
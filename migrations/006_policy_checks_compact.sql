@@ -0,0 +1,47 @@
+-- migrations/006_policy_checks_compact.sql
+-- Normalized policy gate storage: draft text deduplicated by hash, rule ids
+-- interned to integers, one row per rule hit instead of three JSON blobs.
+CREATE TABLE IF NOT EXISTS policy_drafts (
+  id INTEGER PRIMARY KEY,
+  text_sha256 TEXT NOT NULL UNIQUE,
+  draft_text TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS policy_rules (
+  id INTEGER PRIMARY KEY,
+  rule_key TEXT NOT NULL UNIQUE,
+  category TEXT,
+  action TEXT,        -- note|flag|block (latest definition seen)
+  weight REAL
+);
+
+CREATE TABLE IF NOT EXISTS policy_checks_compact (
+  id INTEGER PRIMARY KEY,
+  draft_scope TEXT,
+  draft_id INTEGER NOT NULL REFERENCES policy_drafts(id),
+  decision TEXT NOT NULL,   -- allow|flag|block
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS policy_check_hits (
+  check_id INTEGER NOT NULL REFERENCES policy_checks_compact(id),
+  rule_id INTEGER NOT NULL REFERENCES policy_rules(id),
+  snippet TEXT,
+  PRIMARY KEY (check_id, rule_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_policy_check_hits_rule ON policy_check_hits(rule_id);
+
+-- Legacy-shaped read view over the compact tables.
+CREATE VIEW IF NOT EXISTS policy_checks_expanded AS
+SELECT
+  c.id,
+  c.draft_scope,
+  d.draft_text,
+  c.decision = 'allow' AS allow,
+  (SELECT json_group_array(r.rule_key)
+     FROM policy_check_hits h JOIN policy_rules r ON r.id = h.rule_id
+    WHERE h.check_id = c.id) AS flags,
+  c.created_at
+FROM policy_checks_compact c
+JOIN policy_drafts d ON d.id = c.draft_id;
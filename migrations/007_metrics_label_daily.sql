@@ -0,0 +1,50 @@
+-- migrations/007_metrics_label_daily.sql
+-- Per-day TP/FP/TN/FN counters kept current by triggers on labels, so any
+-- N-day window is a sum over at most N rollup rows instead of a labels scan.
+-- Requires the labels table (002_phase2.sql or label_cli's schema).
+-- Writers must not use INSERT OR REPLACE on labels: REPLACE deletes rows
+-- without firing the delete trigger. Use an upsert instead.
+CREATE TABLE IF NOT EXISTS metrics_label_daily (
+  day TEXT PRIMARY KEY,     -- ISO date string YYYY-MM-DD of labels.created_at
+  tp INTEGER NOT NULL DEFAULT 0,
+  fp INTEGER NOT NULL DEFAULT 0,
+  tn INTEGER NOT NULL DEFAULT 0,
+  fn INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_labels_rollup_insert
+AFTER INSERT ON labels
+WHEN NEW.label IN ('TP','FP','TN','FN')
+BEGIN
+  INSERT INTO metrics_label_daily (day, tp, fp, tn, fn)
+  VALUES (COALESCE(date(NEW.created_at), date('now')),
+          NEW.label = 'TP', NEW.label = 'FP', NEW.label = 'TN', NEW.label = 'FN')
+  ON CONFLICT(day) DO UPDATE SET
+    tp = tp + excluded.tp, fp = fp + excluded.fp, tn = tn + excluded.tn, fn = fn + excluded.fn;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_labels_rollup_delete
+AFTER DELETE ON labels
+WHEN OLD.label IN ('TP','FP','TN','FN')
+BEGIN
+  UPDATE metrics_label_daily SET
+    tp = tp - (OLD.label = 'TP'), fp = fp - (OLD.label = 'FP'),
+    tn = tn - (OLD.label = 'TN'), fn = fn - (OLD.label = 'FN')
+  WHERE day = COALESCE(date(OLD.created_at), date('now'));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_labels_rollup_update
+AFTER UPDATE OF label, created_at ON labels
+BEGIN
+  UPDATE metrics_label_daily SET
+    tp = tp - (OLD.label = 'TP'), fp = fp - (OLD.label = 'FP'),
+    tn = tn - (OLD.label = 'TN'), fn = fn - (OLD.label = 'FN')
+  WHERE OLD.label IN ('TP','FP','TN','FN')
+    AND day = COALESCE(date(OLD.created_at), date('now'));
+  INSERT INTO metrics_label_daily (day, tp, fp, tn, fn)
+  SELECT COALESCE(date(NEW.created_at), date('now')),
+         NEW.label = 'TP', NEW.label = 'FP', NEW.label = 'TN', NEW.label = 'FN'
+  WHERE NEW.label IN ('TP','FP','TN','FN')
+  ON CONFLICT(day) DO UPDATE SET
+    tp = tp + excluded.tp, fp = fp + excluded.fp, tn = tn + excluded.tn, fn = fn + excluded.fn;
+END;
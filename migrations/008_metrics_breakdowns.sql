@@ -0,0 +1,21 @@
+-- migrations/008_metrics_breakdowns.sql
+-- Per-rule and per-subreddit detector metrics, written by metrics_job.
+-- Requires detector_marks / detector_acquittals (001_init.sql).
+CREATE TABLE IF NOT EXISTS metrics_rule_daily (
+  day TEXT NOT NULL,        -- ISO date string YYYY-MM-DD
+  rule_id TEXT NOT NULL,    -- id from rules_triggered (exculpatory hits keep their ':ex' suffix)
+  precision REAL, recall REAL, f1 REAL,
+  tp INTEGER, fp INTEGER, tn INTEGER, fn INTEGER,
+  PRIMARY KEY (day, rule_id)
+);
+
+CREATE TABLE IF NOT EXISTS metrics_subreddit_daily (
+  day TEXT NOT NULL,
+  subreddit TEXT NOT NULL,
+  precision REAL, recall REAL, f1 REAL,
+  tp INTEGER, fp INTEGER, tn INTEGER, fn INTEGER,
+  PRIMARY KEY (day, subreddit)
+);
+
+CREATE INDEX IF NOT EXISTS idx_detector_marks_item ON detector_marks(item_id);
+CREATE INDEX IF NOT EXISTS idx_detector_acquittals_item ON detector_acquittals(item_id);
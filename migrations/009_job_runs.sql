@@ -0,0 +1,20 @@
+-- migrations/009_job_runs.sql
+-- Run log and duration histograms for the in-process scheduler.
+CREATE TABLE IF NOT EXISTS job_runs (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  job TEXT NOT NULL,
+  started_at TEXT NOT NULL,     -- UTC ISO timestamp
+  duration_ms REAL,
+  status TEXT NOT NULL,         -- ok | error | skipped | missed
+  error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_job_runs_job ON job_runs(job, started_at);
+
+-- Non-cumulative buckets: a run lands in the first bucket whose upper bound
+-- (le, in ms, '+Inf' for the overflow bucket) is >= its duration.
+CREATE TABLE IF NOT EXISTS job_duration_histogram (
+  job TEXT NOT NULL,
+  le TEXT NOT NULL,
+  count INTEGER NOT NULL DEFAULT 0,
+  PRIMARY KEY (job, le)
+);
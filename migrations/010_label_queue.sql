@@ -0,0 +1,13 @@
+-- migrations/010_label_queue.sql
+-- Precomputed labeling queue so label_cli never sorts the detector tables.
+CREATE TABLE IF NOT EXISTS label_queue (
+  item_id TEXT PRIMARY KEY,
+  verdict TEXT NOT NULL,      -- mark | acquittal
+  subreddit TEXT,
+  score REAL,                 -- detector score recovered from degree_of_confidence
+  rules_triggered TEXT,       -- JSON array copied from the verdict row
+  stratum TEXT NOT NULL,      -- verdict|subreddit|score band
+  priority REAL NOT NULL,     -- served highest first
+  built_at TEXT DEFAULT (datetime('now'))
+);
+CREATE INDEX IF NOT EXISTS idx_label_queue_priority ON label_queue(priority DESC);
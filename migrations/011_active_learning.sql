@@ -0,0 +1,21 @@
+-- migrations/011_active_learning.sql
+-- Active-learning ranking on top of label_queue (010_label_queue.sql).
+-- Per-item signals are stored so priorities can be recomputed without
+-- rescanning the detector tables when only label coverage changes.
+ALTER TABLE label_queue ADD COLUMN uncertainty REAL;   -- 1 at a threshold, 0 far from both
+ALTER TABLE label_queue ADD COLUMN conflict REAL;      -- matched rule also hit its exculpatory pattern
+
+-- Labeled outcomes per detector rule, as of the last ranking pass.
+CREATE TABLE IF NOT EXISTS label_rule_stats (
+  rule_id TEXT PRIMARY KEY,
+  tp INTEGER NOT NULL DEFAULT 0,
+  fp INTEGER NOT NULL DEFAULT 0,
+  tn INTEGER NOT NULL DEFAULT 0,
+  fn INTEGER NOT NULL DEFAULT 0
+);
+
+-- Rowid watermarks (detector_marks, detector_acquittals, labels) of the last pass.
+CREATE TABLE IF NOT EXISTS label_queue_state (
+  name TEXT PRIMARY KEY,
+  last_id INTEGER NOT NULL
+);
@@ -0,0 +1,8 @@
+-- migrations/012_feed_offsets.sql
+-- Last detector_marks.id handed to each named consumer (exports, feeds), so
+-- incremental readers resume with an indexed rowid range scan.
+CREATE TABLE IF NOT EXISTS feed_offsets (
+  consumer TEXT PRIMARY KEY,
+  last_id INTEGER NOT NULL DEFAULT 0,
+  updated_at TEXT DEFAULT (datetime('now'))
+);
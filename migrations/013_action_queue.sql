@@ -0,0 +1,14 @@
+-- migrations/013_action_queue.sql
+-- Turns planned_actions into a durable work queue for the executor.
+-- status: queued -> running -> done | retry (back to running) | failed
+ALTER TABLE planned_actions ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE planned_actions ADD COLUMN claimed_by TEXT;        -- worker claim token
+ALTER TABLE planned_actions ADD COLUMN claimed_at TEXT;
+ALTER TABLE planned_actions ADD COLUMN next_attempt_at TEXT;   -- earliest retry time (UTC)
+ALTER TABLE planned_actions ADD COLUMN finished_at TEXT;
+ALTER TABLE planned_actions ADD COLUMN last_error TEXT;
+ALTER TABLE planned_actions ADD COLUMN result_json TEXT;
+CREATE INDEX IF NOT EXISTS idx_planned_actions_claim ON planned_actions(status, id);
+-- Dossiers are looked up by the item they describe, not by their markdown.
+ALTER TABLE dossiers ADD COLUMN item_id TEXT;
+CREATE INDEX IF NOT EXISTS idx_dossiers_item ON dossiers(item_id);
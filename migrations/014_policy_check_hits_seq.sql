@@ -0,0 +1,42 @@
+-- migrations/014_policy_check_hits_seq.sql
+-- Compact policy storage keeps everything the wide policy_checks row holds:
+-- every gate hit in order (a rule id can fire more than once per check) and
+-- the raw matches.
+ALTER TABLE policy_checks_compact ADD COLUMN raw_match TEXT;  -- JSON object rule id -> [matches]
+
+CREATE TABLE policy_check_hits_seq (
+  check_id INTEGER NOT NULL REFERENCES policy_checks_compact(id),
+  seq INTEGER NOT NULL,     -- position of the hit in the gate decision's reasons
+  rule_id INTEGER NOT NULL REFERENCES policy_rules(id),
+  snippet TEXT,
+  PRIMARY KEY (check_id, seq)
+) WITHOUT ROWID;
+
+INSERT INTO policy_check_hits_seq (check_id, seq, rule_id, snippet)
+SELECT check_id, ROW_NUMBER() OVER (PARTITION BY check_id ORDER BY rule_id) - 1, rule_id, snippet
+FROM policy_check_hits;
+
+DROP VIEW IF EXISTS policy_checks_expanded;
+DROP TABLE policy_check_hits;
+ALTER TABLE policy_check_hits_seq RENAME TO policy_check_hits;
+CREATE INDEX IF NOT EXISTS idx_policy_check_hits_rule ON policy_check_hits(rule_id);
+
+-- Legacy-shaped read view over the compact tables.
+CREATE VIEW policy_checks_expanded AS
+SELECT
+  c.id,
+  c.draft_scope,
+  d.draft_text,
+  c.decision = 'allow' AS allow,
+  (SELECT json_group_array(rule_key) FROM (
+     SELECT r.rule_key FROM policy_check_hits h JOIN policy_rules r ON r.id = h.rule_id
+      WHERE h.check_id = c.id ORDER BY h.seq)) AS flags,
+  (SELECT json_group_array(json(reason)) FROM (
+     SELECT json_object('id', r.rule_key, 'category', r.category, 'action', r.action,
+                        'weight', r.weight, 'snippet', h.snippet) AS reason
+       FROM policy_check_hits h JOIN policy_rules r ON r.id = h.rule_id
+      WHERE h.check_id = c.id ORDER BY h.seq)) AS reasons,
+  c.raw_match,
+  c.created_at
+FROM policy_checks_compact c
+JOIN policy_drafts d ON d.id = c.draft_id;
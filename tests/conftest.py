@@ -1,6 +1,8 @@
 from pathlib import Path
 import sqlite3
 import sys
+import threading
+import time
 
 import pytest
 
@@ -11,6 +13,11 @@ from inquisitor.ingestion.config import Settings
 from inquisitor.ingestion.db import migrate, column_exists
 
 
+@pytest.fixture(autouse=True)
+def _isolated_config_cache(tmp_path_factory, monkeypatch):
+    monkeypatch.setenv("INQUISITOR_CACHE_DIR", str(tmp_path_factory.getbasetemp() / "config-cache"))
+
+
 @pytest.fixture
 def repo_root() -> Path:
     return REPO_ROOT
@@ -29,3 +36,59 @@ def db_conn(tmp_path: Path, repo_root: Path):
     if not column_exists(conn, "detector_marks", "rules_triggered"):
         migrate(conn, repo_root / "migrations" / "005_rules_triggered.sql")
     return conn
+
+
+class FakeBot:
+    """InquisitorBot stand-in for network manager and runtime tests.
+
+    Without ``eligible`` a bot may act once.  Each action waits on
+    ``barrier`` (if given), blocks for ``delay`` seconds like a PRAW/LLM
+    call, and is logged to ``db_manager`` (if given).
+    """
+
+    def __init__(self, name, db_manager=None, *, barrier=None, eligible=None, delay=0.0):
+        self.name = name
+        self.db_manager = db_manager
+        self.barrier = barrier
+        self.eligible = eligible
+        self.delay = delay
+        self.actions = []
+        self.threads_seen = 0
+
+    def can_post(self):
+        return self.eligible if self.eligible is not None else not self.actions
+
+    def reply_to_post(self, post_id, subreddit_name):
+        return self._act("reply", post_id)
+
+    def create_post(self, subreddit_name):
+        return self._act("post", None)
+
+    def _act(self, kind, post_id):
+        if self.barrier is not None:
+            self.barrier.wait(timeout=5)
+        if self.delay:
+            time.sleep(self.delay)
+        self.threads_seen = threading.active_count()
+        self.actions.append((kind, post_id))
+        if self.db_manager is not None:
+            self.db_manager.log_activity(self.name, kind, post_id)
+        return f"{kind}_{self.name}"
+
+
+@pytest.fixture
+def fake_bot():
+    return FakeBot
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """InquisitorNetworkManager on a temporary database, LLM cache off, always replying when it can."""
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "net.db"))
+    monkeypatch.setenv("LLM_CACHE_TTL", "0")
+    monkeypatch.setenv("ACTIVITY_REPLY_CHANCE", "1.0")
+    from inquisitor_net import InquisitorNetworkManager
+
+    net = InquisitorNetworkManager()
+    yield net
+    net.close()
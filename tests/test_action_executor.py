@@ -0,0 +1,89 @@
+import json
+import sqlite3
+import threading
+
+from inquisitor.ingestion.db import migrate
+from inquisitor.operations.executor import (
+    ActionExecutor,
+    FakeRedditClient,
+    claim_actions,
+    default_executors,
+    ensure_action_queue,
+    queue_depth,
+)
+
+
+def _queue(db, actions, repo_root):
+    with sqlite3.connect(db) as conn:
+        migrate(conn, repo_root / "migrations" / "003_phase3.sql")
+        conn.executemany(
+            "INSERT INTO planned_actions (item_id, type, payload_json) VALUES (?, ?, ?)",
+            [(item, kind, json.dumps(payload)) for item, kind, payload in actions],
+        )
+
+
+def test_executor_runs_retries_and_fails_permanently(tmp_path, repo_root):
+    db = tmp_path / "ops.db"
+    _queue(db, [
+        ("t3_a", "post", {"title": "Draft", "body": "Heresy found"}),
+        ("t3_b", "post", {"title": "Draft", "body": ""}),
+        ("t3_c", "dossier", {"subject_token": "SUBJ-001"}),
+        ("t3_d", "log", {}),
+        ("t3_e", "teleport", {}),
+    ], repo_root)
+    reddit = FakeRedditClient(fail_first=2)
+    pool = ActionExecutor(db, default_executors(reddit, tmp_path / "dossiers"), workers=3,
+                          backoff_base=0.01, poll_interval=0.01)
+    stats = pool.drain()
+
+    assert stats["queue_depth"] == {"done": 3, "failed": 2}
+    assert stats["outcomes"] == {"done": 3, "failed": 2, "retry": 2}
+    assert [p["body"] for p in reddit.posts] == ["Heresy found"]
+    assert (tmp_path / "dossiers" / "t3_c.md").read_text().startswith("# Dossier for item t3_c")
+    with sqlite3.connect(db) as conn:
+        rows = dict(conn.execute("SELECT item_id, attempts FROM planned_actions").fetchall())
+        assert rows["t3_a"] == 3 and rows["t3_b"] == 1
+        assert conn.execute("SELECT COUNT(*) FROM dossiers").fetchone()[0] == 1
+
+
+def test_claims_are_exclusive_across_workers(tmp_path, repo_root):
+    db = tmp_path / "ops.db"
+    _queue(db, [(f"t3_{i}", "log", {}) for i in range(200)], repo_root)
+    seen, lock = [], threading.Lock()
+
+    def record(action, conn):
+        with lock:
+            seen.append(action.id)
+
+    pool = ActionExecutor(db, {"log": record}, workers=8, poll_interval=0.01)
+    stats = pool.drain()
+    assert sorted(seen) == list(range(1, 201))
+    assert stats["queue_depth"] == {"done": 200}
+    assert stats["run_ms_p95"] is not None
+
+    with sqlite3.connect(db) as conn:
+        ensure_action_queue(conn)
+        assert claim_actions(conn, "late-worker") == []
+        assert queue_depth(conn) == {"done": 200}
+
+
+def test_drain_requeues_stale_rows_and_ignores_foreign_claims(tmp_path, repo_root):
+    db = tmp_path / "ops.db"
+    _queue(db, [("t3_x", "log", {}), ("t3_y", "dossier", {})], repo_root)
+    with sqlite3.connect(db) as conn:
+        ensure_action_queue(conn)
+        # t3_x was claimed just now by a worker that has since crashed.
+        conn.execute("""UPDATE planned_actions SET status = 'running', claimed_by = 'gone-1', attempts = 1,
+                        claimed_at = strftime('%Y-%m-%d %H:%M:%f', 'now') WHERE item_id = 't3_x'""")
+        conn.execute("INSERT INTO dossiers (item_id, subject_token, markdown) VALUES ('t3_y', 'S', '# planned')")
+
+    stats = ActionExecutor(db, default_executors(FakeRedditClient()), workers=2, poll_interval=0.01).drain()
+    assert stats["queue_depth"] == {"done": 1, "running": 1}  # not ours and not stale: not waited for
+
+    stats = ActionExecutor(db, default_executors(FakeRedditClient()), workers=2, poll_interval=0.01,
+                           stale_after=0).drain()
+    assert stats["queue_depth"] == {"done": 2}
+    with sqlite3.connect(db) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM dossiers").fetchone()[0] == 1  # found by item_id
+        result = conn.execute("SELECT result_json FROM planned_actions WHERE item_id = 't3_y'").fetchone()[0]
+        assert json.loads(result)["dossier_id"] == 1
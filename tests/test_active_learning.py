@@ -0,0 +1,53 @@
+import json
+
+from inquisitor.labeling.active import rank_active_queue, rule_label_stats
+from inquisitor.labeling.queue import build_label_queue, next_items
+
+THRESHOLDS = (0.65, 0.35)
+
+
+def _mark(conn, item_id, score, rules):
+    conn.execute(
+        "INSERT INTO detector_marks (item_id, subreddit, degree_of_confidence, rules_triggered) VALUES (?,?,?,?)",
+        (item_id, "SubA", score, json.dumps(rules)),
+    )
+
+
+def _labels(conn):
+    conn.execute("CREATE TABLE labels (id INTEGER PRIMARY KEY AUTOINCREMENT, item_id TEXT, label TEXT, "
+                 "notes TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)")
+
+
+def test_ranker_prefers_sparse_rules_then_refreshes_incrementally(db_conn):
+    _labels(db_conn)
+    for i in range(5):
+        _mark(db_conn, f"common{i}", 0.95, ["H001"])
+    _mark(db_conn, "rare", 0.95, ["H010"])
+    _mark(db_conn, "borderline", 0.66, ["H001"])
+    db_conn.executemany("INSERT INTO labels (item_id, label) VALUES (?, 'TP')", [(f"common{i}",) for i in range(4)])
+    db_conn.commit()
+
+    assert rank_active_queue(db_conn, thresholds=THRESHOLDS) == 3
+    assert next_items(db_conn, 2) == ["rare", "borderline"]
+
+    # Labeling the rare rule's only item drops it and rescores nothing else.
+    db_conn.execute("INSERT INTO labels (item_id, label) VALUES ('rare', 'FP')")
+    _mark(db_conn, "rare2", 0.95, ["H010"])
+    db_conn.commit()
+    assert rank_active_queue(db_conn, thresholds=THRESHOLDS) == 1
+    assert next_items(db_conn, 5) == ["rare2", "borderline", "common4"]
+    assert rule_label_stats(db_conn) == {"H001": (4, 0, 0, 0), "H010": (0, 1, 0, 0)}
+
+
+def test_exculpatory_conflict_and_queue_handover(db_conn):
+    _labels(db_conn)
+    _mark(db_conn, "plain", 0.9, ["H010"])
+    _mark(db_conn, "conflicted", 0.9, ["H010", "H010:ex"])
+    db_conn.commit()
+    rank_active_queue(db_conn, thresholds=THRESHOLDS)
+    assert next_items(db_conn, 1) == ["conflicted"]
+
+    # A stratified rebuild resets the watermarks, so the next active pass starts over.
+    build_label_queue(db_conn, per_stratum=1, thresholds=THRESHOLDS, seed=0)
+    assert db_conn.execute("SELECT COUNT(*) FROM label_queue_state").fetchone()[0] == 0
+    assert rank_active_queue(db_conn, thresholds=THRESHOLDS) == 2
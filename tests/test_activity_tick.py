@@ -0,0 +1,35 @@
+import threading
+
+import pytest
+
+
+def test_tick_shares_one_listing_across_concurrent_bots(manager, fake_bot, monkeypatch):
+    monkeypatch.setenv("ACTIVITY_MAX_ACTIONS", "3")
+    monkeypatch.setenv("ACTIVITY_WORKERS", "3")
+    barrier = threading.Barrier(3)  # all acting bots must be running at once
+    manager.bots = {n: fake_bot(n, barrier=barrier, eligible=True) for n in ("Verax", "Kaelus", "Lysander")}
+    manager.bots["Idle"] = fake_bot("Idle", barrier=barrier, eligible=False)
+    fetches = []
+    monkeypatch.setattr(manager, "_get_recent_posts",
+                        lambda sub, limit=10: fetches.append(sub) or ["p1", "p2", "p3"])
+
+    plan = manager._activity_tick()
+
+    assert len(fetches) == 1
+    assert sorted(a.bot_name for a in plan) == ["Kaelus", "Lysander", "Verax"]
+    replied = [post for bot in manager.bots.values() for kind, post in bot.actions if kind == "reply"]
+    assert sorted(replied) == ["p1", "p2", "p3"]  # no two bots reply to the same post
+    assert manager.bots["Idle"].actions == []
+
+
+def test_tick_respects_action_cap_and_skips_fetch_when_idle(manager, fake_bot, monkeypatch):
+    monkeypatch.setenv("ACTIVITY_MAX_ACTIONS", "1")
+    manager.bots = {n: fake_bot(n, eligible=True) for n in ("Verax", "Kaelus")}
+    monkeypatch.setattr(manager, "_get_recent_posts", lambda sub, limit=10: [])
+    plan = manager._activity_tick()
+    assert len(plan) == 1 and plan[0].action == "post"
+
+    for bot in manager.bots.values():
+        bot.eligible = False
+    monkeypatch.setattr(manager, "_get_recent_posts", lambda *a, **k: pytest.fail("listing fetched"))
+    assert manager._activity_tick() == []
@@ -0,0 +1,68 @@
+import asyncio
+import sqlite3
+import threading
+
+
+def test_hundreds_of_bots_share_a_few_threads(manager, fake_bot, monkeypatch):
+    db = manager.db_manager
+    manager.bots = {f"bot{i}": fake_bot(f"bot{i}", db, delay=0.005) for i in range(200)}
+    fetches = []
+    monkeypatch.setattr(manager, "_get_recent_posts",
+                        lambda sub, limit=10: fetches.append(sub) or [f"p{i}" for i in range(50)])
+    runtime = manager.async_runtime()
+    runtime.interval, runtime.jitter, runtime.workers, runtime.maintenance_hour = 0.01, 0.05, 8, None
+    baseline = threading.active_count()
+
+    asyncio.run(runtime.run(duration=1.5))
+
+    assert all(len(bot.actions) == 1 for bot in manager.bots.values())
+    assert max(bot.threads_seen for bot in manager.bots.values()) <= baseline + 8 + 2  # I/O pool + writer + loop helper
+    replied = [post for bot in manager.bots.values() for kind, post in bot.actions if kind == "reply"]
+    assert len(replied) == 50 and len(set(replied)) == 50
+    assert len(fetches) < 200  # concurrent wake-ups share a listing fetch
+    assert (runtime.completed, runtime.failed) == (200, 0)
+    assert all(bot.db_manager is db for bot in manager.bots.values())
+    with sqlite3.connect(db.db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM bot_activity").fetchone()[0] == 200
+
+
+def test_write_queue_applies_writes_in_order_on_one_thread():
+    from core.async_runtime import AsyncWriteQueue
+
+    applied = []
+
+    async def main():
+        queue = AsyncWriteQueue(batch_size=3)
+        queue.start()
+        loop = asyncio.get_running_loop()
+        for i in range(5):
+            queue.submit(lambda i=i: applied.append((i, threading.current_thread().name)))
+        await loop.run_in_executor(None, queue.submit, lambda: applied.append((5, threading.current_thread().name)))
+        queue.submit(lambda: 1 / 0)
+        await queue.close()
+        return queue
+
+    queue = asyncio.run(main())
+    assert [i for i, _ in applied] == list(range(6))
+    assert {name for _, name in applied} == {"db-writer_0"}
+    assert (queue.written, queue.failed) == (6, 1)
+
+
+def test_maintenance_runs_on_the_writer_thread(manager, monkeypatch):
+    from core import async_runtime
+
+    class LateNight(async_runtime.datetime):
+        @classmethod
+        def now(cls):
+            return cls(2026, 1, 1, 23, 59, 59, 950000)  # maintenance is due in 50ms
+
+    monkeypatch.setattr(async_runtime, "datetime", LateNight)
+    ran = []
+    monkeypatch.setattr(manager, "_daily_maintenance", lambda: ran.append(threading.current_thread().name))
+    runtime = manager.async_runtime()
+    runtime.maintenance_hour = 0
+
+    asyncio.run(runtime.run(duration=0.3))
+
+    assert ran and set(ran) == {"db-writer_0"}
+    assert manager.activity_pool is None and manager.scheduler is None
@@ -0,0 +1,34 @@
+import numpy as np
+
+import pytest
+
+from inquisitor.operations.bots import base
+from inquisitor.operations.bots.base import BaseBot, InquisitorPersonality, load_personas
+
+
+@pytest.mark.parametrize("numpy_min_batch", [1, 1 << 20])
+def test_decide_batch_matches_scalar_decide_for_every_persona(repo_root, monkeypatch, numpy_min_batch):
+    monkeypatch.setattr(base, "NUMPY_MIN_BATCH", numpy_min_batch)
+    personas = load_personas(repo_root / "config" / "personas.yml")
+    assert set(personas) == {"Verax", "Kaelus", "Lysander"}
+    rng = np.random.default_rng(0)
+    scores = np.concatenate([rng.random(500), [0.0, 0.4, 0.5, 0.75, 0.8, 0.9, 1.0, -0.1]])
+    ids = [f"t3_{i}" for i in range(len(scores))]
+    for persona in personas.values():
+        bot = BaseBot(persona)
+        batch = bot.decide_batch(ids, scores)
+        scalar = [bot.decide({"item_id": i, "score": s}) for i, s in zip(ids, scores.tolist())]
+        assert list(batch.action) == [d["planned_action"]["type"] for d in scalar]
+        assert list(batch.label) == [d["label"] for d in scalar]
+        assert list(batch.priority) == [d["priority"] for d in scalar]
+        assert sum(batch.counts.values()) == len(scores)
+
+
+def test_default_thresholds_and_persona_overrides(repo_root):
+    scores = [0.85, 0.8, 0.79, 0.5, 0.45, float("nan")]
+    default = BaseBot(InquisitorPersonality(name="anon")).decide_batch(list("abcdef"), scores)
+    assert list(default.action) == ["post", "post", "dossier", "dossier", "log", "log"]
+
+    kaelus = BaseBot(load_personas(repo_root / "config" / "personas.yml")["Kaelus"])
+    assert list(kaelus.decide_batch(list("abcdef"), scores).action) == [
+        "dossier", "dossier", "dossier", "dossier", "dossier", "log"]
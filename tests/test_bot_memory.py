@@ -0,0 +1,65 @@
+import sqlite3
+
+from inquisitor.ingestion.db import migrate
+
+from inquisitor_net import BotMemory, DatabaseManager
+
+
+def _memory(i):
+    return BotMemory(post_id=f"p{i}", content=f"content {i}", timestamp="", author="Verax", context=f"ctx {i}")
+
+
+def test_recent_memories_served_from_buffer(tmp_path):
+    db = DatabaseManager(str(tmp_path / "bots.db"), memory_buffer_size=5)
+    for i in range(3):
+        db.store_memory("Verax", _memory(i))
+    assert [m.post_id for m in db.get_recent_memories("Verax", 10)] == ["p2", "p1", "p0"]
+
+    queries = []
+    db._query_memories = lambda bot, limit: queries.append(limit) or []
+    for i in range(3, 8):
+        db.store_memory("Verax", _memory(i))
+    assert [m.post_id for m in db.get_recent_memories("Verax", 5)] == ["p7", "p6", "p5", "p4", "p3"]
+    assert queries == []
+    db.get_recent_memories("Verax", 6)  # more than the buffer holds
+    assert queries == [6]
+
+    with sqlite3.connect(db.db_path) as conn:
+        plan = " ".join(row[-1] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM bot_memory WHERE bot_name = ? ORDER BY timestamp DESC, id DESC LIMIT 5",
+            ("Verax",),
+        ))
+    assert "idx_bot_memory_bot_time" in plan and "TEMP B-TREE" not in plan
+
+
+def test_compaction_rolls_old_memories_into_summaries(tmp_path):
+    db = DatabaseManager(str(tmp_path / "bots.db"), memory_buffer_size=5)
+    for i in range(8):
+        db.store_memory("Verax", _memory(i))
+    db.store_memory("Kael", _memory(99))
+    db.get_recent_memories("Verax")
+
+    assert db.compact_memories(keep=3) == 5
+    assert db.compact_memories(keep=3) == 0
+    assert [m.post_id for m in db.get_recent_memories("Verax", 10)] == ["p7", "p6", "p5"]
+    assert [m.post_id for m in db.get_recent_memories("Kael")] == ["p99"]
+    with sqlite3.connect(db.db_path) as conn:
+        rows = conn.execute("SELECT bot_name, memory_count, content FROM memory_summaries").fetchall()
+    assert len(rows) == 1
+    bot_name, count, content = rows[0]
+    assert (bot_name, count) == ("Verax", 5)
+    assert content.splitlines()[0].endswith("ctx 0") and content.splitlines()[-1].endswith("ctx 4")
+
+
+def test_compaction_on_a_migrated_database(tmp_path, repo_root):
+    path = tmp_path / "shared.db"
+    with sqlite3.connect(path) as conn:
+        migrate(conn, repo_root / "migrations" / "001_init.sql")
+    db = DatabaseManager(str(path), memory_buffer_size=5)
+    for i in range(4):
+        db.store_memory("Verax", _memory(i))
+
+    assert db.compact_memories(keep=1) == 3
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT bot_name, memory_count FROM memory_summaries").fetchall() == [("Verax", 3)]
+        assert conn.execute("SELECT COUNT(*) FROM summaries").fetchone() == (0,)
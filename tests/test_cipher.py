@@ -0,0 +1,89 @@
+import io
+import random
+import string
+
+import pytest
+
+from cryptography import cipher, decrypt, decrypt_stream, encrypt, encrypt_stream
+from cryptography.cipher import vigenere_decrypt, vigenere_encrypt
+from inquisitor_net import EncryptionModule
+
+ALPHABET = string.ascii_letters + string.digits + " .,;:'!?-()\n\t"
+
+
+def _texts(seed=42):
+    rng = random.Random(seed)
+    for n in (0, 1, 7, 250, 5000):
+        yield "".join(rng.choice(ALPHABET) for _ in range(n))
+    yield "...leading separators, 2 digits 09 and trailing!!!"
+    yield "Ünïcode ß naïve ١٢٣ text with Greek Ω"
+
+
+@pytest.mark.parametrize("key", ["a", "ROSARIUS", "k3y-Z!", "zzzz"])
+def test_vigenere_matches_reference(key):
+    shifts = cipher._prepare_key(key)
+    for text in _texts():
+        encrypted = vigenere_encrypt(text, key)
+        assert encrypted == cipher._shift_reference(text, shifts, 1)
+        assert vigenere_decrypt(encrypted, key) == cipher._shift_reference(encrypted, shifts, -1)
+        if text.isascii():
+            assert vigenere_decrypt(encrypted, key) == text
+
+
+def test_vigenere_paths_agree(monkeypatch):
+    text = next(t for t in _texts() if len(t) == 5000)
+    numpy_out = vigenere_encrypt(text, "ROSARIUS")
+    monkeypatch.setattr(cipher, "NUMPY_MIN_BYTES", 1 << 30)
+    assert vigenere_encrypt(text, "ROSARIUS") == numpy_out
+
+
+def test_caesar_matches_loop():
+    for text in _texts():
+        for shift in (0, 3, 25, 29, -4):
+            expected = "".join(
+                chr((ord(c) - (65 if c.isupper() else 97) + shift) % 26 + (65 if c.isupper() else 97))
+                if c.isalpha() else c
+                for c in text
+            )
+            assert EncryptionModule.caesar_cipher(text, shift) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_streams_match_one_shot(chunk_size):
+    for text in _texts():
+        wrapped = io.StringIO()
+        read = encrypt_stream(io.StringIO(text), wrapped, "ROSARIUS", thought="x", chunk_size=chunk_size)
+        assert read == len(text)
+        assert wrapped.getvalue() == encrypt(text, "ROSARIUS", thought="x")
+
+        for source in (wrapped.getvalue(), vigenere_encrypt(text, "ROSARIUS")):
+            plain = io.StringIO()
+            decrypt_stream(io.StringIO(source), plain, "ROSARIUS", chunk_size=chunk_size)
+            assert plain.getvalue() == decrypt(source, "ROSARIUS")
+
+
+INTERCEPT = (
+    "Inquisitor, the cell on Hive Tertius has grown bold. Our agents report that the heretics "
+    "gather beneath the old manufactorum on the third night of every week, and that their "
+    "preacher speaks openly of a new god who will free the workers from the tithe. Seventeen "
+    "of the faithful have gone missing since the last report, among them two of our own "
+    "acolytes. The local arbitrators are either blind or bought. I request permission to "
+    "move against the gathering before the feast of the Emperor, when the whole hive will be "
+    "watching the cathedral and the heretics believe themselves unobserved. Send word through "
+    "the usual channel and burn this message once it has been read. The Emperor protects."
+)
+
+
+def test_crack_recovers_key_through_digits():
+    from cryptography import analysis
+
+    text = INTERCEPT.replace("Seventeen", "17").replace("third", "3rd") + " Ref 40-912."
+    key = "ROSARIUS"
+    result = analysis.crack(vigenere_encrypt(text, key))
+    assert result.key == key
+    assert result.plaintext == text
+
+    positions, letters = analysis.keyed_stream("a1 b,c")
+    assert positions.tolist() == [0, 2, 3]  # the digit consumes a key position
+    assert letters.tolist() == [0, 1, 2]
+    assert analysis.kasiski_scores(vigenere_encrypt(INTERCEPT, "KAEL"))[3] > 0
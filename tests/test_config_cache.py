@@ -0,0 +1,33 @@
+from inquisitor.ingestion import config
+from inquisitor.ingestion.config import load_yaml
+from inquisitor.policy.gate import load_rules
+
+
+def test_load_yaml_writes_cache_and_tracks_edits(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    monkeypatch.setenv("INQUISITOR_CACHE_DIR", str(cache))
+    cfg = tmp_path / "rules.yml"
+    cfg.write_text("thresholds:\n  mark: 0.65\n")
+
+    first = load_yaml(cfg)
+    assert first == {"thresholds": {"mark": 0.65}}
+    assert len(list(cache.glob("yaml-*.pickle"))) == 1
+
+    # Callers may mutate what they get back without poisoning the cache.
+    first["thresholds"]["mark"] = 0.1
+    config._memo.clear()
+    assert load_yaml(cfg) == {"thresholds": {"mark": 0.65}}
+
+    cfg.write_text("thresholds:\n  mark: 0.9\n")
+    assert load_yaml(cfg) == {"thresholds": {"mark": 0.9}}
+    assert len(list(cache.glob("yaml-*.pickle"))) == 2
+
+
+def test_gate_rules_round_trip_through_cache(repo_root, monkeypatch):
+    monkeypatch.setenv("INQUISITOR_CONFIG_CACHE", "0")
+    uncached = load_rules(repo_root / "config" / "policy_gate.yml")
+    config._memo.clear()
+    monkeypatch.delenv("INQUISITOR_CONFIG_CACHE")
+    load_rules(repo_root / "config" / "policy_gate.yml")
+    config._memo.clear()
+    assert load_rules(repo_root / "config" / "policy_gate.yml") == uncached
@@ -0,0 +1,89 @@
+import json
+import random
+
+from inquisitor.ingestion.detector import DetectorEngine, compile_rules, run_detector_to_db
+from inquisitor_net import HeresyScanner
+from core.reddit_cache import ListingCache
+
+RULES = [
+    {"id": "H001", "name": "Explicit", "pattern": "(?i)heres(y|ies)|excommunicate|corruption", "weight": 0.8},
+    {"id": "H010", "name": "Allegiance", "pattern": "(?i)pledge|devotion|cult", "weight": 0.6,
+     "exculpatory": ["(?i)mini painting|tabletop match"]},
+    {"id": "H020", "name": "Literal", "pattern": "(?i)warp travel is safe|the c\\.o\\.g", "weight": 0.3},
+    {"id": "H030", "name": "Repeat", "pattern": r"(\w+) \1", "weight": 0.2},
+    {"id": "H040", "name": "Case", "pattern": "Emperor", "weight": 0.1},
+    {"id": "H050", "name": "Whole", "pattern": r"(?i)\b(?:cult|the c\.o\.g)\b", "weight": 0.4},
+]
+WORDS = ("heresy", "Heresies", "cult", "culture", "pledge", "mini painting", "tabletop match", "the the",
+         "WARP TRAVEL IS SAFE", "the c.o.g", "Emperor", "emperor", "Ünïcode", "calm", "supplies", "x", "cults", "-cult-")
+
+
+def _reference(rules, text):
+    # The original run_detector_to_db scoring loop.
+    score, matched, ex = 0.0, [], []
+    for r in rules:
+        if r["pattern"].search(text):
+            matched.append(r["id"])
+            score += r["weight"]
+        for p in r["exculpatory"]:
+            if p.search(text):
+                ex.append(r["id"] + ":ex")
+                score -= 0.2
+    return max(0.0, min(1.0, score)), matched, ex
+
+
+def test_engine_matches_reference_loop():
+    rng = random.Random(48)
+    rules = compile_rules(RULES)
+    engine = DetectorEngine(rules)
+    assert engine._prefilter is None  # case-sensitive and backreference rules cannot be fused
+    fused = DetectorEngine(rules[:3] + rules[5:])
+    assert fused._prefilter is not None
+    assert set(fused._keyword_rules) == {1, 2, 3}  # literal (?i) keyword lists share the automata
+    assert [a.word_boundary for a in fused._automata] == [False, True]
+    keywords = DetectorEngine([rules[2], rules[5]])
+    assert keywords._keywords_only
+    for _ in range(500):
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 6)))
+        for e in (engine, fused, keywords):
+            verdict = e.evaluate(text)
+            assert (verdict.score, verdict.matched, verdict.exculpatory) == _reference(e.rules, text), text
+
+
+def test_run_detector_pages_through_hits(settings, db_conn):
+    bodies = ["heresy and devotion", "calm talk", "a cult at the tabletop match", "heresy", "nothing"]
+    db_conn.executemany(
+        "INSERT INTO scrape_hits (item_id, subreddit, body, post_meta_json) VALUES (?,?,?,?)",
+        [(f"t1_{i}", "AllowedSub", body, json.dumps({})) for i, body in enumerate(bodies)],
+    )
+    db_conn.commit()
+    settings.detector = {"rules": RULES[:2], "thresholds": {"mark": 0.7, "acquit": 0.2}}
+    assert run_detector_to_db(settings, db_conn, chunk=2) == (2, 2)
+    assert run_detector_to_db(settings, db_conn, rules=DetectorEngine.from_settings(settings)) == (0, 0)
+    marked = [row[0] for row in db_conn.execute("SELECT item_id FROM detector_marks ORDER BY item_id")]
+    assert marked == ["t1_0", "t1_3"]
+
+
+def test_heresy_scanner_rules_go_through_engine():
+    scanner = HeresyScanner(None, None, listing_cache=ListingCache(), word_boundary=True)
+    scan = scanner._scan("psykers are safe, and mutation is good. Emperor is dead!")
+    assert (scan.score, scan.category) == (3, "heretical_doctrine")
+    assert scan.keywords == ("mutation is good", "psykers are safe", "emperor is dead")
+    assert scanner._scan("the tau are goodness").score == 0  # whole words only
+
+
+def test_heresy_scanner_records_through_detector_writes(db_conn):
+    scanner = HeresyScanner(None, None, listing_cache=ListingCache())
+    posts = [
+        {"post_id": "a1", "subreddit": "Grimdank", "title": "Honestly", "content": "the Tau are good",
+         "url": "https://example.invalid/a1"},
+        {"post_id": "a2", "subreddit": "Grimdank", "title": "Painting", "content": "blue armour tips",
+         "url": "https://example.invalid/a2"},
+    ]
+    assert scanner.record_verdicts(db_conn, posts) == (1, 1)
+    assert scanner.record_verdicts(db_conn, posts) == (0, 0)
+    marks = db_conn.execute("SELECT item_id, subreddit, rules_triggered FROM detector_marks").fetchall()
+    assert marks == [("t3_a1", "Grimdank", '["xenos_sympathy.0"]')]
+    acquitted = [row[0] for row in db_conn.execute("SELECT item_id FROM detector_acquittals")]
+    assert acquitted == ["t3_a2"]
+    assert db_conn.execute("SELECT COUNT(*) FROM scrape_hits").fetchone() == (2,)
@@ -0,0 +1,37 @@
+"""Guards against the fixtures-mode pipeline importing the live API stacks."""
+import subprocess
+import sys
+
+HEAVY = ("praw", "openai", "apscheduler")
+
+
+def _imported_modules(args, cwd, repo_root):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=cwd,
+        env={"PYTHONPATH": str(repo_root), "INQUISITOR_CONFIG_CACHE": "0", "PATH": ""},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = set()
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.add(line.rsplit("|", 1)[1].strip().split(".")[0])
+    return modules
+
+
+def test_fixtures_pipeline_skips_heavy_clients(tmp_path, repo_root):
+    modules = _imported_modules(
+        ["-m", "inquisitor.ingestion.cli", "--mode", "fixtures", "--db", str(tmp_path / "t.db")],
+        repo_root,
+        repo_root,
+    )
+    assert "inquisitor" in modules
+    assert not modules & set(HEAVY)
+
+
+def test_importing_network_module_is_lazy(tmp_path, repo_root):
+    modules = _imported_modules(["-c", "import inquisitor_net"], tmp_path, repo_root)
+    assert not modules & set(HEAVY + ("dotenv",))
+    assert not (tmp_path / "inquisitor_net.log").exists()
@@ -0,0 +1,27 @@
+import json
+import sqlite3
+import sys
+
+from inquisitor.operations import inquisitor_cli
+
+
+def test_jsonl_plan_gates_posts_and_reports_throughput(tmp_path, repo_root, monkeypatch, capsys):
+    marks = tmp_path / "marks.jsonl"
+    marks.write_text("\n".join(json.dumps(m) for m in [
+        {"item_id": "a", "score": 0.9, "rationale": "Heresy in the ranks."},
+        {"item_id": "b", "score": 0.9, "rationale": "Contact heretic@example.com"},
+        {"item_id": "c", "score": 0.6, "rationale": "Uncertain omens."},
+        {"item_id": "d", "score": 0.1, "rationale": ""},
+    ]) + "\n")
+    db = tmp_path / "ops.db"
+    monkeypatch.setattr(sys, "argv", [
+        "inquisitor_cli", "--db", str(db), "--marks-jsonl", str(marks), "--batch-size", "3",
+        "--policy-config", str(repo_root / "config" / "policy_gate.yml"),
+    ])
+    inquisitor_cli.main()
+
+    assert "Planned 4 marks (dossier=2, log=1, post=1)" in capsys.readouterr().out
+    with sqlite3.connect(db) as conn:
+        actions = conn.execute("SELECT item_id, type FROM planned_actions ORDER BY id").fetchall()
+        assert actions == [("a", "post"), ("b", "dossier"), ("c", "dossier"), ("d", "log")]
+        assert conn.execute("SELECT item_id FROM dossiers ORDER BY id").fetchall() == [("b",), ("c",)]
@@ -0,0 +1,57 @@
+import random
+import re
+
+from core.reddit_cache import ListingCache
+from inquisitor.ingestion.keywords import KeywordAutomaton
+from inquisitor_net import HeresyScanner
+
+KEYWORDS = {
+    "a": ["he", "hers", "she", "chaos is better"],
+    "b": ["his", "he", "is b"],
+    "c": ["chaos", "r i"],
+}
+
+
+def _reference(categories, text):
+    lowered = text.lower()
+    return [c for c, words in categories.items() if any(kw in lowered for kw in words)]
+
+
+def test_matches_substring_semantics_with_overlaps():
+    automaton = KeywordAutomaton(KEYWORDS)
+    rng = random.Random(7)
+    alphabet = "hersi cabotBHESR"
+    texts = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40))) for _ in range(2000)]
+    texts += ["USHERS", "Chaos is better", "this is better"]
+    for text in texts:
+        assert automaton.matched(text) == _reference(KEYWORDS, text), text
+
+
+def test_word_boundary_mode():
+    automaton = KeywordAutomaton(KEYWORDS, word_boundary=True)
+    rng = random.Random(8)
+    alphabet = "hersi cabot,BHESR"
+    for text in ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40))) for _ in range(2000)]:
+        lowered = text.lower()
+        expected = [c for c, words in KEYWORDS.items()
+                    if any(re.search(rf"\b{re.escape(kw)}\b", lowered) for kw in words)]
+        assert automaton.matched(text) == expected, text
+    assert automaton.find("Ushers and others") == set()
+    assert automaton.find("she said hers, not his") == {"hers", "she", "his"}
+
+
+def test_overlapping_keywords_are_all_found():
+    automaton = KeywordAutomaton({"a": ["chaos is better", "is bet", "better", "s i", "xx"]})
+    assert automaton._overlaps["chaos is better"]  # offsets where another keyword may start
+    assert automaton.find("CHAOS IS BETTER") == {"chaos is better", "is bet", "better", "s i"}
+    assert automaton.find("x" * 1000) == {"xx"}
+
+
+def test_heresy_scanner_uses_one_scan():
+    scanner = HeresyScanner(None, None, listing_cache=ListingCache())
+    text = "Honestly the Tau are good and WARP TRAVEL IS SAFE"
+    assert scanner._calculate_heresy_score(text) == 2
+    assert scanner._classify_heresy(text) == "xenos_sympathy"
+    assert scanner._classify_heresy("nothing to see") == "general_heresy"
+    scanner.heresy_keywords["blasphemy"].append("nothing to see")
+    assert scanner._classify_heresy("nothing to see") == "blasphemy"
@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from inquisitor.ingestion.db import migrate
+from inquisitor.labeling.label_cli import SCHEMA, import_labels, read_label_file
+
+
+def _rollup(conn):
+    return conn.execute("SELECT SUM(tp), SUM(fp), SUM(tn), SUM(fn) FROM metrics_label_daily").fetchone()
+
+
+def test_read_label_file_validates_csv_and_jsonl(tmp_path):
+    csv_path = tmp_path / "labels.csv"
+    csv_path.write_text("item_id,label,notes\na,tp,\nb,XX,bad\n,FP,\nc,FN,late\na,FP,second\n")
+    rows, invalid = read_label_file(csv_path)
+    assert rows == [("a", "FP", "second"), ("c", "FN", "late")]
+    assert [line for line, _ in invalid] == [3, 4]
+
+    jsonl_path = tmp_path / "labels.jsonl"
+    jsonl_path.write_text(json.dumps({"item_id": "d", "label": "TN"}) + "\n{not json\n")
+    rows, invalid = read_label_file(jsonl_path)
+    assert rows == [("d", "TN", None)]
+    assert invalid[0][0] == 2
+
+
+@pytest.mark.parametrize("shape", ["keyed", "phase2"])
+def test_import_labels_upserts_and_reports_conflicts(db_conn, repo_root, shape):
+    if shape == "keyed":
+        db_conn.execute(SCHEMA["labels"])
+    else:
+        migrate(db_conn, repo_root / "migrations" / "002_phase2.sql")
+    first = import_labels(db_conn, [("a", "TP", None), ("b", "FP", "x"), ("c", "TN", None)])
+    assert (first.inserted, first.updated, first.conflicts) == (3, 0, [])
+    assert _rollup(db_conn) == (1, 1, 1, 0)
+
+    kept = import_labels(db_conn, [("a", "FP", None), ("b", "FP", None)], keep_existing=True)
+    assert (kept.kept, kept.unchanged, kept.conflicts) == (1, 1, [("a", "TP", "FP")])
+    assert _rollup(db_conn) == (1, 1, 1, 0)
+
+    second = import_labels(db_conn, [("a", "FP", None), ("c", "TN", "checked"), ("d", "FN", None)])
+    assert (second.inserted, second.updated, len(second.conflicts)) == (1, 2, 1)
+    assert _rollup(db_conn) == (0, 2, 1, 1)
+    labels = dict(db_conn.execute("SELECT item_id, label FROM labels").fetchall())
+    assert labels == {"a": "FP", "b": "FP", "c": "TN", "d": "FN"}
+    assert db_conn.execute("SELECT notes FROM labels WHERE item_id = 'b'").fetchone()[0] == "x"
@@ -0,0 +1,54 @@
+import random
+
+from inquisitor.ingestion.db import migrate
+from inquisitor.labeling.queue import build_label_queue, next_items, threshold_distance
+
+THRESHOLDS = (0.65, 0.35)
+
+
+def _seed_verdicts(conn, n=200):
+    rng = random.Random(7)
+    marks, acquittals = [], []
+    for i in range(n):
+        sub = "SubA" if i % 3 else "SubB"
+        if i % 2:
+            marks.append((f"m{i}", sub, round(rng.uniform(0.65, 1.0), 3), '["H001"]'))
+        else:
+            acquittals.append((f"a{i}", sub, round(rng.uniform(0.65, 1.0), 3), "[]"))
+    conn.executemany(
+        "INSERT INTO detector_marks (item_id, subreddit, degree_of_confidence, rules_triggered) VALUES (?,?,?,?)", marks)
+    conn.executemany(
+        "INSERT INTO detector_acquittals (item_id, subreddit, degree_of_confidence, rules_triggered) VALUES (?,?,?,?)",
+        acquittals)
+    conn.commit()
+
+
+def test_queue_is_stratified_and_skips_labeled(db_conn, repo_root):
+    migrate(db_conn, repo_root / "migrations" / "002_phase2.sql")
+    _seed_verdicts(db_conn)
+    db_conn.execute("INSERT INTO labels (item_id, label) VALUES ('m1', 'TP')")
+    db_conn.commit()
+
+    n = build_label_queue(db_conn, per_stratum=2, thresholds=THRESHOLDS, seed=1, chunk=17)
+    strata = db_conn.execute("SELECT stratum, COUNT(*) FROM label_queue GROUP BY stratum").fetchall()
+    assert n == sum(c for _, c in strata)
+    assert all(c <= 2 for _, c in strata)
+    assert {s.split("|")[0] for s, _ in strata} == {"mark", "acquittal"}
+    assert {s.split("|")[1] for s, _ in strata} == {"SubA", "SubB"}
+
+    served = next_items(db_conn, limit=n)
+    assert "m1" not in served
+    # The first round holds one item from every stratum.
+    first_round = db_conn.execute(
+        "SELECT stratum FROM label_queue ORDER BY priority DESC LIMIT ?", (len(strata),)).fetchall()
+    assert len(set(first_round)) == len(strata)
+
+
+def test_near_threshold_prefers_borderline_scores(db_conn, repo_root):
+    _seed_verdicts(db_conn, n=400)
+    build_label_queue(db_conn, per_stratum=3, thresholds=THRESHOLDS, seed=3)
+    uniform = db_conn.execute("SELECT AVG(score) FROM label_queue WHERE verdict = 'mark'").fetchone()[0]
+    build_label_queue(db_conn, per_stratum=3, thresholds=THRESHOLDS, seed=3, near_threshold=True)
+    rows = db_conn.execute("SELECT score FROM label_queue WHERE verdict = 'mark'").fetchall()
+    near = sum(threshold_distance(s, THRESHOLDS) for (s,) in rows) / len(rows)
+    assert near < abs(uniform - THRESHOLDS[0])
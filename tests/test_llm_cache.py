@@ -0,0 +1,52 @@
+from core.llm_cache import LLMResponseCache
+from core.llm_client import FakeLLMProvider, LLMPool, LLMRequest
+
+
+def _req(topic, temperature=0.8):
+    return LLMRequest.chat("fake", "You are an Inquisitor.", f"Create a post about: {topic}", temperature=temperature)
+
+
+def test_hits_persist_and_temperature_buckets(tmp_path):
+    path = tmp_path / "cache.db"
+    cache = LLMResponseCache(path)
+    assert cache.get(_req("xenos")) is None
+    cache.put(_req("xenos"), "Purge the xenos.")
+    assert cache.get(_req("xenos", temperature=0.78)) == "Purge the xenos."
+    assert cache.get(_req("xenos", temperature=0.2)) is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+    cache.close()
+
+    reopened = LLMResponseCache(path)
+    assert reopened.get(_req("xenos")) == "Purge the xenos."
+    reopened.close()
+
+
+def test_ttl_expiry_and_lru_eviction():
+    now = [1000.0]
+    cache = LLMResponseCache(ttl_seconds=60, max_entries=2, clock=lambda: now[0])
+    cache.put(_req("a"), "A")
+    now[0] += 1
+    cache.put(_req("b"), "B")
+    now[0] += 1
+    assert cache.get(_req("a")) == "A"  # a is now more recent than b
+    cache.put(_req("c"), "C")
+    assert cache.stats.evictions == 1
+    assert cache.get(_req("b")) is None
+    assert cache.get(_req("a")) == "A" and cache.get(_req("c")) == "C"
+
+    now[0] += 120
+    assert cache.get(_req("a")) is None
+    assert cache.stats.expired == 1
+
+
+def test_pool_serves_repeats_from_cache():
+    provider = FakeLLMProvider()
+    cache = LLMResponseCache()
+    pool = LLMPool(provider, cache=cache)
+    try:
+        first = pool.complete(_req("heresy"), timeout=5)
+        assert pool.complete(_req("heresy"), timeout=5) == first
+    finally:
+        pool.close()
+    assert len(provider.calls) == 1
+    assert cache.stats.hits == 1
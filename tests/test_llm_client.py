@@ -0,0 +1,104 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core.llm_client import AsyncLLMClient, FakeLLMProvider, LLMError, LLMPool, LLMRequest, OpenAIProvider
+
+
+def _req(topic, model="fake"):
+    return LLMRequest.chat(model, "You are an Inquisitor.", f"Create a post about: {topic}")
+
+
+def test_concurrency_cap_and_coalescing():
+    provider = FakeLLMProvider(latency=0.02)
+    client = AsyncLLMClient(provider, max_concurrency=3)
+
+    async def run():
+        distinct = [client.complete(_req(f"topic {i}")) for i in range(10)]
+        duplicates = [client.complete(_req("same topic")) for _ in range(5)]
+        return await asyncio.gather(*distinct, *duplicates)
+
+    results = asyncio.run(run())
+    assert len(set(results[-5:])) == 1
+    assert provider.max_active == 3
+    assert len(provider.calls) == 11
+    assert client.stats.coalesced == 4
+
+
+def test_retries_with_backoff_then_timeout_failure():
+    flaky = FakeLLMProvider(fail_first=2, responses=["By the Emperor"])
+    client = AsyncLLMClient(flaky, backoff_base=0.001)
+    assert asyncio.run(client.complete(_req("x"))) == "By the Emperor"
+    assert client.stats.retries == 2
+
+    slow = AsyncLLMClient(FakeLLMProvider(latency=0.2), timeout=0.01, max_retries=1, backoff_base=0.001)
+    with pytest.raises(LLMError):
+        asyncio.run(slow.complete(_req("y")))
+    assert slow.stats.timeouts == 2 and slow.stats.failures == 1
+
+
+def test_pool_shares_cap_across_threads():
+    provider = FakeLLMProvider(latency=0.02)
+    pool = LLMPool(provider, max_concurrency=2)
+    try:
+        with ThreadPoolExecutor(max_workers=6) as ex:
+            results = list(ex.map(lambda i: pool.complete(_req(f"topic {i}"), timeout=5), range(6)))
+    finally:
+        pool.close()
+    assert len(results) == 6
+    assert provider.max_active == 2
+
+
+def test_cache_io_runs_off_the_event_loop():
+    import threading
+
+    class RecordingCache:
+        def __init__(self):
+            self.threads, self.store = [], {}
+
+        def get(self, request):
+            self.threads.append(threading.current_thread())
+            return self.store.get(request)
+
+        def put(self, request, response):
+            self.threads.append(threading.current_thread())
+            self.store[request] = response
+
+    cache = RecordingCache()
+    client = AsyncLLMClient(FakeLLMProvider(responses=["Purge"]), cache=cache)
+
+    async def run():
+        first = await client.complete(_req("x"))
+        return first, await client.complete(_req("x")), threading.current_thread()
+
+    first, second, loop_thread = asyncio.run(run())
+    assert first == second == "Purge"
+    assert len(cache.threads) == 3 and loop_thread not in cache.threads
+
+
+def test_timed_out_sync_calls_stay_within_the_provider_threads():
+    import threading
+    import time
+    from types import SimpleNamespace
+
+    lock, seen = threading.Lock(), {"active": 0, "max_active": 0, "timeouts": []}
+
+    def create(**kwargs):
+        with lock:
+            seen["active"] += 1
+            seen["max_active"] = max(seen["max_active"], seen["active"])
+            seen["timeouts"].append(kwargs.get("timeout"))
+        time.sleep(0.05)  # a blocking HTTP call that outlives the caller's timeout
+        with lock:
+            seen["active"] -= 1
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="late"))])
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    provider = OpenAIProvider(client=client, timeout=2.0, max_workers=1)
+    pool = LLMPool(provider, max_concurrency=1, timeout=0.01, max_retries=2, backoff_base=0.001)
+    with pytest.raises(LLMError):
+        pool.complete(_req("x"), timeout=5)
+    pool.close()  # waits for the abandoned calls
+    assert seen["max_active"] == 1  # retries queued behind the abandoned call (and were cancelled there)
+    assert seen["timeouts"] and set(seen["timeouts"]) == {2.0}
@@ -0,0 +1,48 @@
+import sys
+
+from inquisitor.exports.marks_export import read_offset
+from inquisitor.operations import inquisitor_cli
+from inquisitor.operations.mark_feed import MarkFeed
+
+
+def _add_marks(conn, scores):
+    start = conn.execute("SELECT COUNT(*) FROM detector_marks").fetchone()[0]
+    conn.executemany(
+        "INSERT INTO detector_marks (item_id, degree_of_confidence, reasoning_for_mark) VALUES (?,?,?)",
+        [(f"t3_{start + i}", s, "omens") for i, s in enumerate(scores)],
+    )
+    conn.commit()
+
+
+def test_feed_redelivers_until_committed(db_conn):
+    _add_marks(db_conn, [0.9, 0.6, 0.3])
+    feed = MarkFeed(db_conn, "ops", chunk=2)
+    first = next(feed.batches())
+    assert [m["item_id"] for m in first] == ["t3_0", "t3_1"]
+    assert first[0]["score"] == 0.9
+
+    assert [m["item_id"] for m in next(MarkFeed(db_conn, "ops").batches())][:1] == ["t3_0"]
+    feed.commit(first[-1]["id"])
+    assert [[m["item_id"] for m in b] for b in MarkFeed(db_conn, "ops").batches()] == [["t3_2"]]
+
+
+def test_inquisitor_cli_from_db_consumes_only_new_marks(tmp_path, repo_root, monkeypatch):
+    import sqlite3
+    from inquisitor.ingestion.db import migrate
+
+    db = tmp_path / "ops.db"
+    with sqlite3.connect(db) as conn:
+        migrate(conn, repo_root / "migrations" / "001_init.sql")
+        _add_marks(conn, [0.6, 0.3])
+    argv = ["inquisitor_cli", "--db", str(db), "--from-db",
+            "--policy-config", str(repo_root / "config" / "policy_gate.yml")]
+    monkeypatch.setattr(sys, "argv", argv)
+    inquisitor_cli.main()
+    with sqlite3.connect(db) as conn:
+        _add_marks(conn, [0.55])
+    inquisitor_cli.main()
+
+    with sqlite3.connect(db) as conn:
+        actions = conn.execute("SELECT item_id, type FROM planned_actions ORDER BY id").fetchall()
+        assert actions == [("t3_0", "dossier"), ("t3_1", "log"), ("t3_2", "dossier")]
+        assert read_offset(conn, "inquisitor_cli") == 3
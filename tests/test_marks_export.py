@@ -0,0 +1,41 @@
+import gzip
+import json
+
+import numpy as np
+import pytest
+
+from inquisitor.exports.marks_export import export_marks, read_offset
+
+
+def _add_marks(conn, ids):
+    conn.executemany(
+        "INSERT INTO detector_marks (item_id, subreddit, degree_of_confidence, reasoning_for_mark) VALUES (?,?,?,?)",
+        [(f"t3_{i}", "SubA", 0.5 + i / 100, f"reason {i}") for i in ids],
+    )
+    conn.commit()
+
+
+def test_incremental_gzip_export_resumes_from_consumer_offset(db_conn, tmp_path):
+    _add_marks(db_conn, range(5))
+    assert export_marks(db_conn, tmp_path / "day1.jsonl.gz", consumer="nightly", chunk=2) == 5
+    _add_marks(db_conn, range(5, 8))
+    assert export_marks(db_conn, tmp_path / "day2.jsonl.gz", consumer="nightly", chunk=2) == 3
+
+    with gzip.open(tmp_path / "day2.jsonl.gz", "rt") as fh:
+        rows = [json.loads(line) for line in fh]
+    assert [r["item_id"] for r in rows] == ["t3_5", "t3_6", "t3_7"]
+    assert rows[0]["score"] == pytest.approx(0.55)
+    assert read_offset(db_conn, "nightly") == 8
+    assert export_marks(db_conn, tmp_path / "day3.jsonl.gz", consumer="nightly") == 0
+
+
+def test_npz_export_is_columnar(db_conn, tmp_path):
+    _add_marks(db_conn, range(3))
+    assert export_marks(db_conn, tmp_path / "marks.npz", since_id=1) == 2
+    data = np.load(tmp_path / "marks.npz")
+    assert data["id"].tolist() == [2, 3]
+    assert data["item_id"].tolist() == ["t3_1", "t3_2"]
+    assert data["score"].dtype == np.float64
+
+    with pytest.raises(ValueError):
+        export_marks(db_conn, tmp_path / "marks.npz", compression="gzip")
@@ -0,0 +1,111 @@
+import sqlite3
+
+from inquisitor.ingestion.db import migrate, table_exists
+from inquisitor.labeling.label_cli import ensure_schema, upsert_label
+from inquisitor.metrics.metrics_job import compute_metrics, compute_metrics_windows, ensure_label_rollups
+
+
+def _insert(conn, item_id, label, days_ago):
+    conn.execute(
+        "INSERT INTO labels (item_id, label, created_at) VALUES (?, ?, datetime('now', ?))",
+        (item_id, label, f"-{days_ago} days"),
+    )
+
+
+def test_rollups_backfill_and_track_label_changes(db_conn, repo_root):
+    migrate(db_conn, repo_root / "migrations" / "002_phase2.sql")
+    _insert(db_conn, "a", "TP", 1)
+    _insert(db_conn, "b", "FP", 2)
+    _insert(db_conn, "c", "FN", 20)
+    db_conn.commit()
+
+    assert ensure_label_rollups(db_conn)  # backfills existing rows
+    windows = compute_metrics_windows(db_conn, (7, 30))
+    assert (windows[7]["tp"], windows[7]["fp"], windows[7]["fn"]) == (1, 1, 0)
+    assert windows[30]["fn"] == 1
+    assert windows[30]["recall"] == 0.5
+
+    _insert(db_conn, "d", "TP", 0)
+    db_conn.execute("UPDATE labels SET label = 'TP' WHERE item_id = 'b'")
+    db_conn.execute("DELETE FROM labels WHERE item_id = 'c'")
+    db_conn.commit()
+    m = compute_metrics(db_conn, days=30)
+    assert (m["tp"], m["fp"], m["tn"], m["fn"]) == (3, 0, 0, 0)
+
+
+def test_compute_metrics_is_read_only(db_conn, repo_root):
+    migrate(db_conn, repo_root / "migrations" / "002_phase2.sql")
+    _insert(db_conn, "a", "TP", 1)
+    _insert(db_conn, "b", "FN", 3)
+    db_conn.commit()
+    m = compute_metrics(db_conn, days=7)
+    assert (m["tp"], m["fn"]) == (1, 1)
+    assert not table_exists(db_conn, "metrics_label_daily")
+
+
+def test_breakdowns_work_on_a_read_only_connection(db_conn, repo_root, tmp_path):
+    from inquisitor.metrics.metrics_job import compute_breakdowns
+
+    migrate(db_conn, repo_root / "migrations" / "002_phase2.sql")
+    db_conn.execute("INSERT INTO detector_marks (item_id, subreddit, rules_triggered) VALUES ('m1', 'SubA', '[\"H001\"]')")
+    _insert(db_conn, "m1", "TP", 0)
+    db_conn.commit()
+    readonly = sqlite3.connect(f"file:{tmp_path / 'test.db'}?mode=ro", uri=True)
+    try:
+        assert compute_breakdowns(readonly, days=7)["rules"]["H001"]["tp"] == 1
+    finally:
+        readonly.close()
+    assert not table_exists(db_conn, "metrics_rule_daily")
+
+
+def test_policy_pipeline_reads_the_rollup(db_conn, settings, repo_root):
+    from inquisitor.pipelines.policy_pipeline import run_policy_pipeline
+
+    migrate(db_conn, repo_root / "migrations" / "002_phase2.sql")
+    _insert(db_conn, "a", "TP", 1)
+    db_conn.commit()
+    statements = []
+    db_conn.set_trace_callback(statements.append)
+    run_policy_pipeline(settings, db_conn, drafts_path=repo_root / "fixtures" / "drafts.jsonl",
+                        policy_config_path=repo_root / "config" / "policy_gate.yml")
+    db_conn.set_trace_callback(None)
+
+    selects = [s for s in statements if s.lstrip().upper().startswith(("SELECT", "WITH"))]
+    assert any("FROM metrics_label_daily" in s for s in selects)
+    assert not any("FROM labels" in s for s in selects if "metrics_label_daily" not in s)
+    assert db_conn.execute("SELECT tp FROM metrics_label_daily").fetchall() == [(1,)]
+
+
+def test_label_cli_upsert_keeps_rollup_consistent(tmp_path):
+    conn = sqlite3.connect(tmp_path / "labels.db")
+    ensure_schema(conn)
+    upsert_label(conn, "x", "FP")
+    upsert_label(conn, "x", "TP")
+    conn.commit()
+    m = compute_metrics(conn, days=7)
+    assert (m["tp"], m["fp"]) == (1, 0)
+
+
+def test_breakdowns_per_rule_and_subreddit(db_conn, repo_root, tmp_path):
+    from inquisitor.metrics.metrics_job import compute_breakdowns, write_breakdowns_to_db, write_reports
+
+    migrate(db_conn, repo_root / "migrations" / "002_phase2.sql")
+    marks = [("m1", "SubA", '["H001"]'), ("m2", "SubA", '["H001", "H010"]'), ("m3", "SubB", '["H010"]')]
+    db_conn.executemany("INSERT INTO detector_marks (item_id, subreddit, rules_triggered) VALUES (?,?,?)", marks)
+    db_conn.execute("INSERT INTO detector_acquittals (item_id, subreddit, rules_triggered) VALUES ('a1', 'SubB', '[\"H010:ex\"]')")
+    for item_id, label in [("m1", "TP"), ("m2", "FP"), ("m3", "TP"), ("a1", "FN")]:
+        _insert(db_conn, item_id, label, 0)
+    db_conn.commit()
+
+    b = compute_breakdowns(db_conn, days=7)
+    assert (b["rules"]["H001"]["tp"], b["rules"]["H001"]["fp"]) == (1, 1)
+    assert b["rules"]["H010"]["precision"] == 0.5
+    assert b["rules"]["H010:ex"]["fn"] == 1
+    assert b["subreddits"]["SubB"]["recall"] == 0.5
+
+    write_breakdowns_to_db(db_conn, b)
+    write_breakdowns_to_db(db_conn, b)
+    assert db_conn.execute("SELECT COUNT(*) FROM metrics_rule_daily").fetchone()[0] == 3
+    write_reports(compute_metrics(db_conn), tmp_path, b)
+    assert "| H010 |" in next(tmp_path.glob("metrics_*.md")).read_text()
+    assert len(list(tmp_path.glob("metrics_rules_*.csv"))) == 1
@@ -0,0 +1,85 @@
+import json
+
+from inquisitor.ingestion.db import migrate
+from inquisitor.policy.gate import evaluate_text_with_raw_matches, load_rules
+from inquisitor.policy.store import PolicyCheck, insert_policy_checks_bulk, rule_hit_counts
+
+DRAFTS = [
+    "This is a lore-friendly report. No links.",
+    "Contact me at test@example.com to discuss.",
+    "As an AI, I think we should share the DMCA document here: https://example.com/file",
+    "Contact me at test@example.com to discuss.",
+]
+
+
+def _checks(repo_root):
+    rules = load_rules(repo_root / "config" / "policy_gate.yml")
+    out = []
+    for text in DRAFTS:
+        decision, raw_match = evaluate_text_with_raw_matches(text, rules)
+        out.append(PolicyCheck(draft_text=text, decision=decision, raw_match=raw_match))
+    return out
+
+
+def test_bulk_insert_legacy_and_compact_agree(db_conn, repo_root):
+    migrate(db_conn, repo_root / "migrations" / "002_phase2.sql")
+    checks = _checks(repo_root)
+
+    assert insert_policy_checks_bulk(db_conn, checks, draft_scope="t") == 4
+    assert insert_policy_checks_bulk(db_conn, checks, draft_scope="t", storage="compact") == 4
+
+    legacy = db_conn.execute("SELECT draft_text, allow, flags FROM policy_checks ORDER BY id").fetchall()
+    compact = db_conn.execute("SELECT draft_text, allow, flags FROM policy_checks_expanded ORDER BY id").fetchall()
+    assert [(t, bool(a), json.loads(f)) for t, a, f in legacy] == [(t, bool(a), json.loads(f)) for t, a, f in compact]
+
+    assert db_conn.execute("SELECT COUNT(*) FROM policy_drafts").fetchone()[0] == 3
+    assert rule_hit_counts(db_conn) == rule_hit_counts(db_conn, storage="compact")
+    assert rule_hit_counts(db_conn, storage="compact")["pii_email"] == 2
+
+    # Re-running reuses interned drafts and rules and keeps ids increasing.
+    insert_policy_checks_bulk(db_conn, checks[:1], draft_scope="t", storage="compact")
+    assert db_conn.execute("SELECT COUNT(*), MAX(id) FROM policy_checks_compact").fetchone() == (5, 5)
+    assert db_conn.execute("SELECT COUNT(*) FROM policy_drafts").fetchone()[0] == 3
+
+
+def test_compact_round_trips_the_wide_format(db_conn, repo_root):
+    from inquisitor.policy.gate import GateRule
+    from inquisitor.policy.store import ensure_compact_tables
+
+    migrate(db_conn, repo_root / "migrations" / "002_phase2.sql")
+    # The same rule id firing twice, with another rule in between
+    rules = [
+        GateRule(id="links", pattern=r"https?://\S+", category="links"),
+        GateRule(id="pii_email", pattern=r"\S+@\S+", action="block", category="pii"),
+        GateRule(id="links", pattern=r"www\.\S+", category="links"),
+    ]
+    checks = []
+    for text in ("see https://a.example and www.b.example, or mail x@y.example", "nothing here"):
+        decision, raw_match = evaluate_text_with_raw_matches(text, rules)
+        checks.append(PolicyCheck(draft_text=text, decision=decision, raw_match=raw_match))
+    assert [r["id"] for r in checks[0].decision.reasons] == ["links", "pii_email", "links"]
+
+    # Rows written in the original compact layout are carried over by the migration
+    migrate(db_conn, repo_root / "migrations" / "006_policy_checks_compact.sql")
+    db_conn.execute("INSERT INTO policy_drafts (id, text_sha256, draft_text) VALUES (1, 'h', 'old')")
+    db_conn.execute("INSERT INTO policy_rules (id, rule_key) VALUES (1, 'old_rule')")
+    db_conn.execute("INSERT INTO policy_checks_compact (id, draft_scope, draft_id, decision) VALUES (1, 'o', 1, 'flag')")
+    db_conn.execute("INSERT INTO policy_check_hits (check_id, rule_id, snippet) VALUES (1, 1, 's')")
+    db_conn.commit()
+    ensure_compact_tables(db_conn)
+    assert db_conn.execute("SELECT check_id, seq, rule_id, snippet FROM policy_check_hits").fetchall() == [(1, 0, 1, "s")]
+
+    insert_policy_checks_bulk(db_conn, checks, draft_scope="t")
+    insert_policy_checks_bulk(db_conn, checks, draft_scope="t", storage="compact")
+    columns = "draft_scope, draft_text, allow, flags, reasons, raw_match"
+    wide = db_conn.execute(f"SELECT {columns} FROM policy_checks ORDER BY id").fetchall()
+    compact = db_conn.execute(f"SELECT {columns} FROM policy_checks_expanded WHERE id > 1 ORDER BY id").fetchall()
+
+    def decoded(rows):
+        return [(scope, text, bool(allow), json.loads(flags), json.loads(reasons), json.loads(raw))
+                for scope, text, allow, flags, reasons, raw in rows]
+
+    assert decoded(compact) == decoded(wide)
+    assert decoded(wide)[0][3] == ["links", "pii_email", "links"]
+    assert decoded(wide)[0][5]["links"] == ["https://a.example", "www.b.example,"]
+    assert rule_hit_counts(db_conn, storage="compact")["links"] == rule_hit_counts(db_conn)["links"] == 2
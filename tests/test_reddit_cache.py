@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+from core.reddit_cache import FileListingSource, ListingCache
+
+POSTS = [
+    {"id": "p3", "subreddit": "OrdoImperialis", "title": "Tau are good", "selftext": "the greater good", "author": "u3"},
+    {"id": "p2", "subreddit": "OrdoImperialis", "title": "Report", "selftext": "all quiet", "author": "u2"},
+    {"id": "p1", "subreddit": "OrdoImperialis", "title": "Hello", "body": "first post", "author": "u1"},
+    {"id": "x1", "subreddit": "Grimdank", "title": "warp travel is safe", "selftext": "", "author": "u4"},
+]
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "listing.jsonl"
+    path.write_text("\n".join(json.dumps(p) for p in POSTS) + "\n")
+    return FileListingSource(path)
+
+
+def test_listing_and_submission_hits(source):
+    now = [0.0]
+    cache = ListingCache(source, ttl_seconds=30, clock=lambda: now[0])
+    assert [p.id for p in cache.new("OrdoImperialis", limit=3)] == ["p3", "p2", "p1"]
+    assert [p.id for p in cache.new("ordoimperialis", limit=2)] == ["p3", "p2"]
+    assert cache.submission("p1").selftext == "first post"  # filled by the listing
+    assert source.calls == {"new": 1}
+    assert (cache.stats.hits, cache.stats.misses) == (2, 1)
+
+    now[0] = 31
+    cache.new("OrdoImperialis", limit=3)
+    assert source.calls["new"] == 2 and cache.stats.expired == 1
+
+
+def test_lru_bound(source):
+    cache = ListingCache(source, max_entries=2)
+    cache.submission("p1")
+    cache.submission("p2")
+    cache.submission("p1")
+    cache.submission("x1")  # evicts p2, the least recently used
+    assert cache.stats.evictions == 1
+    cache.submission("p1")
+    cache.submission("p2")
+    assert source.calls["submission"] == 4
+
+
+def test_network_and_scanner_share_one_fetch(source, tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "net.db"))
+    monkeypatch.setenv("LLM_CACHE_TTL", "0")
+    from inquisitor_net import HeresyScanner, InquisitorNetworkManager
+
+    net = InquisitorNetworkManager(listing_source=source)
+    try:
+        assert net._get_recent_posts("OrdoImperialis", limit=3) == ["p3", "p2", "p1"]
+        scanner = HeresyScanner(None, net.db_manager, listing_cache=net.listing_cache)
+        found = scanner.scan_subreddit("OrdoImperialis", limit=3)
+    finally:
+        net.close()
+    assert [f["post_id"] for f in found] == ["p3"]
+    assert found[0]["author"] == "u3"
+    assert source.calls["new"] == 1
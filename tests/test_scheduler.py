@@ -0,0 +1,77 @@
+import json
+import threading
+
+from inquisitor.ingestion.db import migrate
+from inquisitor.pipelines.scheduler import SchedulerService
+
+
+def test_jobs_run_in_process_and_record_durations(settings, db_conn, repo_root, tmp_path):
+    migrate(db_conn, repo_root / "migrations" / "002_phase2.sql")
+    db_conn.execute(
+        "INSERT INTO scrape_hits (item_id, subreddit, body, post_meta_json) VALUES (?,?,?,?)",
+        ("t1", "SubA", "Excommunicate the heresy!", json.dumps({})),
+    )
+    db_conn.commit()
+    settings.database_path = str(tmp_path / "test.db")
+    service = SchedulerService(settings, reports_dir=tmp_path / "reports")
+    try:
+        assert service.run_job("detector_backfill") == "ok"
+        assert service.run_job("metrics") == "ok"
+        assert service.run_job("reports") == "ok"
+        assert list((tmp_path / "reports").glob("metrics_windows_*.csv"))
+
+        # A trigger that fires while the same job is still running is skipped.
+        started, release = threading.Event(), threading.Event()
+        service.jobs["metrics"] = lambda: (started.set(), release.wait(5))
+        worker = threading.Thread(target=service.run_job, args=("metrics",))
+        worker.start()
+        started.wait(5)
+        assert service.run_job("metrics") == "skipped"
+        release.set()
+        worker.join()
+
+        statuses = service.conn.execute("SELECT job, status FROM job_runs ORDER BY id").fetchall()
+        assert statuses[-2:] == [("metrics", "skipped"), ("metrics", "ok")]
+        assert service.conn.execute("SELECT SUM(count) FROM job_duration_histogram").fetchone()[0] == 4
+        assert db_conn.execute("SELECT COUNT(*) FROM detector_marks").fetchone()[0] == 1
+    finally:
+        service.shutdown()
+
+
+def test_max_instances_skips_are_recorded(settings, tmp_path):
+    from datetime import datetime
+
+    from apscheduler.events import EVENT_JOB_MAX_INSTANCES, JobSubmissionEvent
+
+    settings.database_path = str(tmp_path / "test.db")
+    service = SchedulerService(settings, reports_dir=tmp_path / "reports")
+    try:
+        service.jobs["metrics"] = lambda: None
+        service._on_max_instances(
+            JobSubmissionEvent(EVENT_JOB_MAX_INSTANCES, "metrics", "default", [datetime(2025, 8, 14, 2, 0)])
+        )
+        assert service.run_job("metrics") == "ok"
+        statuses = service.conn.execute("SELECT job, started_at, status FROM job_runs ORDER BY id").fetchall()
+        assert statuses[0] == ("metrics", "2025-08-14T02:00:00", "skipped")
+        assert statuses[1][2] == "ok"
+    finally:
+        service.shutdown()
+
+
+def test_failed_job_leaves_no_partial_writes(settings, db_conn, tmp_path):
+    settings.database_path = str(tmp_path / "test.db")
+    service = SchedulerService(settings, reports_dir=tmp_path / "reports")
+
+    def half_done():
+        service.conn.execute(
+            "INSERT INTO scrape_hits (item_id, subreddit, body, post_meta_json) VALUES ('t1', 'SubA', 'x', '{}')"
+        )
+        raise RuntimeError("boom")
+
+    try:
+        service.jobs["detector_backfill"] = half_done
+        assert service.run_job("detector_backfill") == "error"
+        assert service.conn.execute("SELECT COUNT(*) FROM scrape_hits").fetchone()[0] == 0
+        assert service.conn.execute("SELECT status FROM job_runs").fetchall() == [("error",)]
+    finally:
+        service.shutdown()
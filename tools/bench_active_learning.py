@@ -0,0 +1,159 @@
+# tools/bench_active_learning.py
+"""Simulate labeling on synthetic detector output.
+
+Builds an in-memory database of marks and acquittals over rules with skewed
+hit rates and known precision, then "labels" items in batches using each
+strategy until every rule's precision estimate is stable: the Beta posterior
+standard deviation is at most ``--target-std``, or every mark of that rule has
+been labeled.  Reports the labels each strategy needed and the mean absolute
+error of the final per-rule precision estimates.
+
+Strategies:
+    uniform     shuffled order (the old ``ORDER BY RANDOM()`` behaviour)
+    stratified  :func:`inquisitor.labeling.queue.build_label_queue`
+    active      :func:`inquisitor.labeling.active.rank_active_queue`
+
+Active ordering does not sample uniformly within a rule, so its estimates can
+carry selection bias; compare the error column at an equal budget with
+``--target-std 0 --budget N``.
+
+Usage:
+    python tools/bench_active_learning.py --items 5000 --seeds 3
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import sqlite3
+import statistics
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from inquisitor.ingestion.db import migrate  # noqa: E402
+from inquisitor.labeling.active import rank_active_queue, rule_label_stats  # noqa: E402
+from inquisitor.labeling.queue import build_label_queue, next_items  # noqa: E402
+
+THRESHOLDS = (0.65, 0.35)
+
+# rule id -> (hit rate, weight, true precision)
+RULES = {
+    "R01": (0.40, 0.70, 0.90),
+    "R02": (0.25, 0.60, 0.70),
+    "R03": (0.12, 0.50, 0.55),
+    "R04": (0.06, 0.65, 0.35),
+    "R05": (0.04, 0.80, 0.80),
+    "R06": (0.02, 0.70, 0.50),
+}
+
+
+def _make_world(n: int, rng: random.Random):
+    conn = sqlite3.connect(":memory:")
+    migrate(conn, REPO_ROOT / "migrations" / "001_init.sql")
+    migrate(conn, REPO_ROOT / "migrations" / "002_phase2.sql")
+    truth = {}
+    marks, acquittals = [], []
+    for i in range(n):
+        matched = [r for r, (rate, _, _) in RULES.items() if rng.random() < rate]
+        excul = [f"{r}:ex" for r in matched if rng.random() < 0.1]
+        score = sum(RULES[r][1] for r in matched) - 0.2 * len(excul) + rng.gauss(0, 0.08)
+        score = max(0.0, min(1.0, score))
+        item_id = f"t{i}"
+        sub = rng.choice(("SubA", "SubB", "SubC"))
+        if score >= THRESHOLDS[0]:
+            # Precision of the weakest rule, pulled down near the threshold and by benign context.
+            p = min(RULES[r][2] for r in matched) + 0.5 * (score - THRESHOLDS[0]) - 0.2 * bool(excul)
+            truth[item_id] = "TP" if rng.random() < p else "FP"
+            marks.append((item_id, sub, score, json.dumps(matched)))
+        elif score <= THRESHOLDS[1]:
+            truth[item_id] = "FN" if rng.random() < 0.05 + 0.3 * score else "TN"
+            acquittals.append((item_id, sub, 1.0 - score, json.dumps(matched + excul)))
+    conn.executemany(
+        "INSERT INTO detector_marks (item_id, subreddit, degree_of_confidence, rules_triggered) VALUES (?,?,?,?)", marks)
+    conn.executemany(
+        "INSERT INTO detector_acquittals (item_id, subreddit, degree_of_confidence, rules_triggered) VALUES (?,?,?,?)",
+        acquittals)
+    conn.commit()
+    return conn, truth
+
+
+def _true_precision(conn, truth):
+    out = {}
+    for rule_id in RULES:
+        rows = conn.execute(
+            "SELECT m.item_id FROM detector_marks m, json_each(m.rules_triggered) j WHERE j.value = ?", (rule_id,)
+        ).fetchall()
+        labels = [truth[r[0]] for r in rows]
+        if labels:
+            out[rule_id] = (labels.count("TP") / len(labels), len(labels))
+    return out
+
+
+def _stable(stats, true_prec, target_std):
+    for rule_id, (_, n_marks) in true_prec.items():
+        tp, fp, _, _ = stats.get(rule_id, (0, 0, 0, 0))
+        if tp + fp >= n_marks:
+            continue
+        a, b = tp + 1, fp + 1
+        if math.sqrt(a * b / ((a + b) ** 2 * (a + b + 1))) > target_std:
+            return False
+    return True
+
+
+def _run(strategy: str, n: int, seed: int, batch: int, target_std: float, budget: int):
+    rng = random.Random(seed)
+    conn, truth = _make_world(n, rng)
+    true_prec = _true_precision(conn, truth)
+    order = list(truth)
+    rng.shuffle(order)
+    n_labeled = 0
+    while n_labeled < min(budget, len(truth)):
+        if strategy == "uniform":
+            items = order[n_labeled:n_labeled + batch]
+        elif strategy == "stratified":
+            items = next_items(conn, batch)
+            if not items:
+                build_label_queue(conn, per_stratum=5, thresholds=THRESHOLDS, seed=seed)
+                items = next_items(conn, batch)
+        else:
+            rank_active_queue(conn, thresholds=THRESHOLDS)
+            items = next_items(conn, batch)
+        if not items:
+            break
+        conn.executemany("INSERT INTO labels (item_id, label) VALUES (?, ?)", [(i, truth[i]) for i in items])
+        conn.commit()
+        n_labeled += len(items)
+        stats = rule_label_stats(conn)
+        if _stable(stats, true_prec, target_std):
+            break
+    errors = []
+    for rule_id, (p, _) in true_prec.items():
+        tp, fp, _, _ = stats.get(rule_id, (0, 0, 0, 0))
+        errors.append(abs((tp + 1) / (tp + fp + 2) - p))
+    return n_labeled, statistics.mean(errors), len(truth)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Labels needed for stable per-rule precision, by sampling strategy")
+    ap.add_argument("--items", type=int, default=5000, help="Synthetic comments per run")
+    ap.add_argument("--seeds", type=int, default=3, help="Independent worlds to average over")
+    ap.add_argument("--batch", type=int, default=10, help="Labels per queue refresh")
+    ap.add_argument("--target-std", type=float, default=0.1, help="Posterior std that counts as stable")
+    ap.add_argument("--budget", type=int, default=5000, help="Give up after this many labels")
+    args = ap.parse_args()
+
+    print(f"{'strategy':<12}{'labels':>10}{'mean |err|':>12}{'pool':>8}")
+    for strategy in ("uniform", "stratified", "active"):
+        runs = [_run(strategy, args.items, seed, args.batch, args.target_std, args.budget) for seed in range(args.seeds)]
+        labels = statistics.mean(r[0] for r in runs)
+        err = statistics.mean(r[1] for r in runs)
+        pool = statistics.mean(r[2] for r in runs)
+        print(f"{strategy:<12}{labels:>10.0f}{err:>12.3f}{pool:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
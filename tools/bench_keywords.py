@@ -0,0 +1,105 @@
+# tools/bench_keywords.py
+"""HeresyScanner keyword-matching throughput benchmark.
+
+Builds a synthetic corpus of posts (filler text with heresy phrases and
+near-misses mixed in), checks that ``HeresyScanner._scan`` gives the same
+score and category as the per-phrase loops it replaced, and reports posts/s
+for both, with substring and with whole-word (``word_boundary=True``)
+matching.  The scanner matches through ``DetectorEngine``, which answers
+keyword rules with one ``KeywordAutomaton`` pass per text.
+
+Usage:
+    python tools/bench_keywords.py --posts 20000 --extra-keywords 0 200
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from core.reddit_cache import ListingCache  # noqa: E402
+from inquisitor_net import HeresyScanner  # noqa: E402
+
+FILLER = ("the", "emperor", "chapter", "painted", "my", "army", "guard", "list", "warp", "tau", "eldar",
+          "space", "marines", "good", "safe", "is", "are", "chaos", "gods", "throne", "battle", "report")
+
+
+def _legacy(keywords, text):
+    # The pre-automaton HeresyScanner: one lower() and one substring scan per phrase, twice.
+    text_lower = text.lower()
+    score = 0
+    for category, words in keywords.items():
+        for keyword in words:
+            if keyword in text_lower:
+                score += 1
+    category = 'general_heresy'
+    for name, words in keywords.items():
+        if any(keyword in text_lower for keyword in words):
+            category = name
+            break
+    return score, category
+
+
+def _legacy_whole_words(keywords, text):
+    # The same loops with one \bphrase\b search per phrase.
+    text_lower = text.lower()
+    hits = [(category, keyword) for category, words in keywords.items() for keyword in words
+            if re.search(rf"\b{re.escape(keyword)}\b", text_lower)]
+    return len(hits), hits[0][0] if hits else 'general_heresy'
+
+
+def _corpus(keywords, n, seed=47):
+    rng = random.Random(seed)
+    phrases = [w for words in keywords.values() for w in words]
+    posts = []
+    for _ in range(n):
+        words = [rng.choice(FILLER) for _ in range(rng.randint(10, 120))]
+        for _ in range(rng.choice((0, 0, 0, 1, 2))):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(phrases).upper() if rng.random() < 0.2
+                         else rng.choice(phrases))
+        posts.append(" ".join(words))
+    return posts
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Keyword matching: per-phrase loops vs the detector engine")
+    ap.add_argument("--posts", type=int, default=20000)
+    ap.add_argument("--extra-keywords", type=int, nargs="+", default=[0, 200],
+                    help="Synthetic keywords added per run to show scaling with the phrase list")
+    args = ap.parse_args()
+
+    base = HeresyScanner(None, None, listing_cache=ListingCache())
+    print(f"{'keywords':>9}{'mode':>12}{'legacy posts/s':>16}{'engine posts/s':>16}{'speedup':>9}")
+    for extra in args.extra_keywords:
+        rng = random.Random(extra)
+        keywords = {k: list(v) for k, v in base.heresy_keywords.items()}
+        keywords["synthetic"] = [" ".join(rng.choice(FILLER) for _ in range(3)) + f" {i}" for i in range(extra)]
+        posts = _corpus(keywords, args.posts)
+        n_kw = sum(map(len, keywords.values()))
+        for mode, word_boundary, reference in (("substring", False, _legacy),
+                                               ("whole-word", True, _legacy_whole_words)):
+            scanner = HeresyScanner(None, None, listing_cache=ListingCache(), word_boundary=word_boundary)
+            scanner.heresy_keywords = keywords
+            scanner._scan("")  # compile outside the timed loop
+
+            t0 = time.perf_counter()
+            legacy = [reference(keywords, p) for p in posts]
+            t_legacy = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            scans = [scanner._scan(p) for p in posts]
+            t_engine = time.perf_counter() - t0
+
+            for post, (score, category), scan in zip(posts, legacy, scans):
+                if (score, category) != (scan.score, scan.category or 'general_heresy'):
+                    raise SystemExit(f"{mode} mismatch on {post!r}: {(score, category)} vs {scan}")
+            print(f"{n_kw:>9}{mode:>12}{len(posts) / t_legacy:>16.0f}{len(posts) / t_engine:>16.0f}"
+                  f"{t_legacy / t_engine:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# tools/bench_startup.py
+"""Startup benchmark for the InquisitorNet CLIs.
+
+Runs each CLI against a single-item input so wall time is dominated by
+interpreter start, imports and config loading (time-to-first-item).  Each
+CLI is measured with a cold config cache and again with a warm one.
+
+Usage:
+    python tools/bench_startup.py --runs 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _commands(work: Path) -> dict[str, list[str]]:
+    drafts = work / "drafts.jsonl"
+    drafts.write_text(json.dumps({"id": "d1", "text": "A lore-friendly report."}) + "\n")
+    marks = work / "marks.jsonl"
+    marks.write_text(json.dumps({"item_id": "m1", "score": 0.6, "rationale": "uncertain"}) + "\n")
+    db = str(work / "bench.db")
+    py = sys.executable
+    return {
+        "ingestion.cli": [py, "-m", "inquisitor.ingestion.cli", "--mode", "fixtures", "--db", db],
+        "pipelines.cli": [py, "-m", "inquisitor.pipelines.cli", "--db", db, "--drafts", str(drafts), "--skip-metrics"],
+        "policy.gate_cli": [py, "-m", "inquisitor.policy.gate_cli", "--input", str(drafts),
+                            "--output", str(work / "gate.jsonl"), "--config", "config/policy_gate.yml"],
+        "operations.inquisitor_cli": [py, "-m", "inquisitor.operations.inquisitor_cli", "--db", db,
+                                      "--marks-jsonl", str(marks)],
+    }
+
+
+def _time_run(cmd: list[str], env: dict[str, str]) -> float:
+    start = time.perf_counter()
+    subprocess.run(cmd, cwd=REPO_ROOT, env=env, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Measure CLI time-to-first-item")
+    ap.add_argument("--runs", type=int, default=5, help="Runs per CLI and cache state")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work = Path(tmp)
+        cache = work / "cache"
+        env = dict(os.environ, INQUISITOR_CACHE_DIR=str(cache), PYTHONDONTWRITEBYTECODE="1")
+        print(f"{'cli':<28}{'cold ms':>10}{'warm ms':>10}")
+        for name, cmd in _commands(work).items():
+            cold, warm = [], []
+            for _ in range(args.runs):
+                shutil.rmtree(cache, ignore_errors=True)
+                cold.append(_time_run(cmd, env))
+                warm.append(_time_run(cmd, env))
+            print(f"{name:<28}{statistics.median(cold) * 1000:>10.1f}{statistics.median(warm) * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,12 @@
 # tools/schedule_metrics.py
-from apscheduler.schedulers.blocking import BlockingScheduler
-import subprocess, sys
+# Thin wrapper kept for existing cron/service units; jobs now run in-process.
+# See inquisitor/pipelines/scheduler.py for the job list and options.
+import sys
+from pathlib import Path
 
-def run_metrics():
-    cmd = [
-        sys.executable,
-        "-m",
-        "inquisitor.metrics.metrics_job",
-        "--db",
-        "inquisitor_net.db",
-        "--days",
-        "7",
-        "--out",
-        "reports/metrics",
-    ]
-    subprocess.run(cmd, check=False)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-def main():
-    sched = BlockingScheduler()
-    # daily at 02:00
-    sched.add_job(run_metrics, 'cron', hour=2, minute=0)
-    try:
-        sched.start()
-    except (KeyboardInterrupt, SystemExit):
-        pass
+from inquisitor.pipelines.scheduler import main
 
 if __name__ == "__main__":
     main()